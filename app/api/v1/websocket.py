@@ -1,9 +1,11 @@
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends, HTTPException
 from app.auth import get_current_user_ws
-from app.services.speech_to_text import transcribe_audio
-from app.services.translation import translate_text
-from app.services.text_to_speech import synthesize_speech
-from app.services.language_detection import detect_language
+from app.cache import cache_manager
+from app.services.speech_to_text import detect_and_transcribe_shared, streaming_transcribe
+from app.services.translation_memory import translation_memory
+from app.services.audio_processing import trim_silence, normalize_audio, is_wav, AudioValidationError
+from app.services.text_to_speech import synthesize_speech_cached, synthesize_speech_stream
+from app.utils import audio_digest
 from app.monitoring import (
     record_translation,
     record_ws_connection,
@@ -22,32 +24,32 @@ from prometheus_client import Counter
 
 logger = structlog.get_logger()
 
+router = APIRouter()
+
 # WebSocket limitleri
 MAX_CONNECTIONS_PER_USER = 3
 MAX_TOTAL_CONNECTIONS = 100
 MAX_MESSAGE_SIZE = 1024 * 1024  # 1MB
 MAX_MESSAGES_PER_MINUTE = 30
 MESSAGE_TIMEOUT = 60  # saniye
+MAX_STREAM_CHUNK_SIZE = 64 * 1024  # 64KB (~2 saniye LINEAR16 16kHz)
 
 class RateLimiter:
+    """
+    Redis üzerinde sabit pencereli sayaç; limit tüm replikalarda ortaktır.
+    Redis'e erişilemezse istek engellenmez.
+    """
     def __init__(self, max_requests: int, time_window: int):
         self.max_requests = max_requests
         self.time_window = time_window
-        self.requests = {}
         
     async def is_allowed(self, user_id: int) -> bool:
-        now = time.time()
-        user_requests = self.requests.get(user_id, [])
-        
-        # Eski istekleri temizle
-        user_requests = [req for req in user_requests if now - req < self.time_window]
-        
-        if len(user_requests) >= self.max_requests:
-            return False
-            
-        user_requests.append(now)
-        self.requests[user_id] = user_requests
-        return True
+        window = int(time.time() // self.time_window)
+        count = await cache_manager.increment_rate_limit(
+            f"ws_rate:{user_id}:{window}",
+            self.time_window
+        )
+        return count <= self.max_requests
 
 class ConnectionManager:
     def __init__(self):
@@ -99,11 +101,273 @@ class ConnectionManager:
 
 manager = ConnectionManager()
 
+def default_source_language(user) -> str:
+    return "tr-TR" if user.target_language == "en" else "en-US"
+
+async def translate_and_synthesize(
+    text: str,
+    user,
+    stream_audio: bool = False,
+    source_language: str = None
+):
+    """
+    Metni kullanıcının hedef diline çevir ve seslendir.
+    stream_audio ise ses üretilmez; send_audio_stream ile ayrıca gönderilir.
+    """
+    target_language = user.target_language
+    translated_text = await translation_memory.translate(text, target_language, source_language)
+    if not translated_text or stream_audio:
+        return translated_text, None
+    
+    audio_content = await synthesize_speech_cached(
+        translated_text,
+        target_language,
+        user.voice_preference
+    )
+    return translated_text, audio_content
+
+async def send_audio_stream(websocket: WebSocket, text: str, user):
+    """Çevrilen metni cümle cümle sentezle ve parçaları sırayla gönder"""
+    start_time = time.time()
+    index = 0
+    async for segment in synthesize_speech_stream(text, user.target_language, user.voice_preference):
+        if index == 0:
+            record_ws_processing_time("first_audio_segment", time.time() - start_time)
+        await websocket.send_json({
+            "type": "audio_chunk",
+            "index": index,
+            "audio_content": segment.hex()
+        })
+        record_ws_message("send", "audio_chunk", len(segment))
+        index += 1
+    await websocket.send_json({"type": "audio_end", "segments": index})
+
+async def send_translation(websocket: WebSocket, user, cached: dict, stream_audio: bool):
+    """Önbellekteki hat sonucunu gönder; ses cümle önbelleğinden birleştirilir"""
+    translated_text = cached["translated_text"]
+    audio_content = None
+    if not stream_audio:
+        audio_content = await synthesize_speech_cached(
+            translated_text,
+            user.target_language,
+            user.voice_preference
+        )
+    response = {
+        "transcribed_text": cached["source_text"],
+        "translated_text": translated_text,
+        "audio_content": audio_content.hex() if audio_content else None
+    }
+    await websocket.send_json(response)
+    record_ws_message("send", "translation", len(str(response)))
+    record_translation(cached["source_lang"], user.target_language)
+    if stream_audio:
+        await send_audio_stream(websocket, translated_text, user)
+
+class StreamingSession:
+    """
+    Akışlı tanıma oturumu.
+    İstemci küçük ses parçaları gönderir, parçalar akışlı tanıyıcıya beslenir ve
+    ara/nihai metinler geldikçe istemciye iletilir.
+    """
+    def __init__(self, websocket: WebSocket, user, language_code: str, stream_audio: bool = False):
+        self.websocket = websocket
+        self.user = user
+        self.language_code = language_code
+        self.stream_audio = stream_audio
+        self.audio_queue = None
+        self.recognizer = None
+        self.forwarder = None
+        self.started_at = None
+        
+    @property
+    def active(self) -> bool:
+        return self.audio_queue is not None
+        
+    async def _audio_chunks(self, audio_queue: asyncio.Queue):
+        while True:
+            chunk = await audio_queue.get()
+            if chunk is None:
+                return
+            yield chunk
+            
+    async def _recognize(self, audio_queue: asyncio.Queue, results: asyncio.Queue):
+        # Tanıma sonuçlarını çeviri/gönderim işinden bağımsız olarak kuyruğa aktarır
+        try:
+            async for transcript, is_final in streaming_transcribe(
+                self._audio_chunks(audio_queue),
+                self.language_code
+            ):
+                results.put_nowait((transcript, is_final))
+        except Exception as e:
+            results.put_nowait(e)
+        finally:
+            # Tanıyıcı hata ya da süre sınırıyla bittiyse sonraki parça yeni oturum açar
+            # (ve rate limit yeniden uygulanır); okunmayan kuyruğa parça yazılmaz
+            if self.audio_queue is audio_queue:
+                self.audio_queue = None
+            results.put_nowait(None)
+            
+    async def start(self):
+        """Yeni bir konuşma için tanıyıcıyı başlat"""
+        self.audio_queue = asyncio.Queue()
+        results = asyncio.Queue()
+        self.started_at = time.time()
+        self.recognizer = asyncio.create_task(self._recognize(self.audio_queue, results))
+        self.forwarder = asyncio.create_task(self._forward_results(results))
+        
+    async def feed(self, chunk: bytes):
+        if not self.active:
+            await self.start()
+        self.audio_queue.put_nowait(chunk)
+        
+    async def finish(self):
+        """Konuşmayı bitir ve kalan sonuçların gönderilmesini bekle"""
+        if not self.active:
+            return
+        self.audio_queue.put_nowait(None)
+        self.audio_queue = None
+        await self.forwarder
+        
+    def close(self):
+        if self.audio_queue is not None:
+            self.audio_queue.put_nowait(None)
+            self.audio_queue = None
+        if self.recognizer is not None:
+            self.recognizer.cancel()
+        if self.forwarder is not None:
+            self.forwarder.cancel()
+            
+    async def _forward_results(self, results: asyncio.Queue):
+        first_result = True
+        while True:
+            item = await results.get()
+            if item is None:
+                return
+            if isinstance(item, Exception):
+                logger.error(
+                    "websocket_stream_error",
+                    error=str(item),
+                    user_id=self.user.id
+                )
+                await self.websocket.send_json({"error": str(item)})
+                continue
+                
+            transcript, is_final = item
+            if first_result:
+                record_ws_processing_time("stream_first_result", time.time() - self.started_at)
+                first_result = False
+                
+            if not is_final:
+                await self.websocket.send_json({
+                    "type": "interim",
+                    "transcribed_text": transcript
+                })
+                record_ws_message("send", "interim", len(transcript))
+                continue
+                
+            try:
+                translated_text, audio_content = await translate_and_synthesize(
+                    transcript,
+                    self.user,
+                    self.stream_audio,
+                    self.language_code
+                )
+                if not translated_text:
+                    await self.websocket.send_json({"error": "Metin çevirilemedi"})
+                    continue
+                    
+                response = {
+                    "type": "final",
+                    "transcribed_text": transcript,
+                    "translated_text": translated_text,
+                    "audio_content": audio_content.hex() if audio_content else None
+                }
+                await self.websocket.send_json(response)
+                record_ws_message("send", "translation", len(str(response)))
+                record_ws_processing_time("stream_final_result", time.time() - self.started_at)
+                record_translation(self.language_code, self.user.target_language)
+                
+                if self.stream_audio:
+                    await send_audio_stream(self.websocket, translated_text, self.user)
+                
+            except Exception as e:
+                logger.error(
+                    "websocket_processing_error",
+                    error=str(e),
+                    user_id=self.user.id
+                )
+                await self.websocket.send_json({"error": str(e)})
+
+async def handle_streaming_session(websocket: WebSocket, user):
+    """
+    Akış modu: binary mesajlar ses parçalarıdır, {"type": "end"} konuşmayı bitirir.
+    """
+    language_code = websocket.query_params.get("language") or default_source_language(user)
+    stream_audio = websocket.query_params.get("audio") == "stream"
+    session = StreamingSession(websocket, user, language_code, stream_audio)
+    
+    try:
+        while True:
+            try:
+                message = await asyncio.wait_for(
+                    websocket.receive(),
+                    timeout=MESSAGE_TIMEOUT
+                )
+            except asyncio.TimeoutError:
+                await session.finish()
+                await websocket.send_json({
+                    "error": "Bağlantı zaman aşımına uğradı"
+                })
+                continue
+                
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
+                
+            chunk = message.get("bytes")
+            if chunk is not None:
+                if len(chunk) > MAX_STREAM_CHUNK_SIZE:
+                    await websocket.send_json({
+                        "error": "Mesaj boyutu çok büyük"
+                    })
+                    continue
+                    
+                # Rate limit konuşma başına uygulanır, parça başına değil
+                if not session.active and not await manager.rate_limiter.is_allowed(user.id):
+                    await websocket.send_json({
+                        "error": "Rate limit aşıldı. Lütfen biraz bekleyin."
+                    })
+                    continue
+                    
+                record_ws_message("receive", "audio_chunk", len(chunk))
+                await session.feed(chunk)
+                continue
+                
+            try:
+                control = json.loads(message.get("text") or "{}")
+            except json.JSONDecodeError:
+                control = {}
+            if control.get("type") == "end":
+                await session.finish()
+                await websocket.send_json({"type": "end"})
+                
+    finally:
+        session.close()
+
 @router.websocket("/ws/translate")
 async def websocket_endpoint(websocket: WebSocket, user = Depends(get_current_user_ws)):
     if not await manager.connect(websocket, user.id):
         return
         
+    if websocket.query_params.get("mode") == "stream":
+        try:
+            await handle_streaming_session(websocket, user)
+        except WebSocketDisconnect:
+            pass
+        finally:
+            manager.disconnect(websocket, user.id)
+        return
+        
+    stream_audio = websocket.query_params.get("audio") == "stream"
     try:
         while True:
             try:
@@ -136,17 +400,40 @@ async def websocket_endpoint(websocket: WebSocket, user = Depends(get_current_us
                 # Mesaj metriğini kaydet
                 record_ws_message("receive", "audio", len(audio_data))
                 
+                # Aynı klip daha önce işlendiyse tanıma ve çeviri atlanır;
+                # ses cümle önbelleğinden birleştirilir
+                audio_hash = audio_digest(audio_data)
+                cached = await cache_manager.get_translation(
+                    audio_hash, None, user.target_language, user.voice_preference
+                )
+                if cached is not None:
+                    try:
+                        await send_translation(websocket, user, cached, stream_audio)
+                    except Exception as e:
+                        logger.error("websocket_processing_error", error=str(e), user_id=user.id)
+                        await websocket.send_json({"error": str(e)})
+                    continue
+                
+                # WAV olarak gönderilen klipleri LINEAR16 mono 16 kHz'e dönüştür
+                if is_wav(audio_data):
+                    try:
+                        audio_data = await asyncio.to_thread(normalize_audio, audio_data)
+                    except AudioValidationError as e:
+                        await websocket.send_json({"error": str(e)})
+                        continue
+                
+                # Sessizliği kırp, tamamen sessiz klipler sağlayıcıya gitmesin
+                audio_data = trim_silence(audio_data)
+                if audio_data is None:
+                    await websocket.send_json({
+                        "error": "Seste konuşma algılanmadı"
+                    })
+                    continue
+                
                 start_time = time.time()
                 try:
-                    # Dil algılama
-                    source_language = await detect_language(audio_data)
-                    
-                    # Metne dönüştür
-                    transcribed_text = await asyncio.to_thread(
-                        transcribe_audio,
-                        audio_data,
-                        source_language
-                    )
+                    # Dil algılama ve metne dönüştürme tek tanıma çağrısında
+                    source_language, transcribed_text = await detect_and_transcribe_shared(audio_data)
                     
                     if not transcribed_text:
                         await websocket.send_json({
@@ -154,12 +441,13 @@ async def websocket_endpoint(websocket: WebSocket, user = Depends(get_current_us
                         })
                         continue
                     
-                    # Hedef dile çevir
+                    # Hedef dile çevir ve sese dönüştür
                     target_language = user.target_language
-                    translated_text = await asyncio.to_thread(
-                        translate_text,
+                    translated_text, audio_content = await translate_and_synthesize(
                         transcribed_text,
-                        target_language
+                        user,
+                        stream_audio,
+                        source_language
                     )
                     
                     if not translated_text:
@@ -168,14 +456,6 @@ async def websocket_endpoint(websocket: WebSocket, user = Depends(get_current_us
                         })
                         continue
                     
-                    # Sese dönüştür
-                    audio_content = await asyncio.to_thread(
-                        synthesize_speech,
-                        translated_text,
-                        target_language,
-                        user.voice_preference
-                    )
-                    
                     # İşlem süresini kaydet
                     processing_time = time.time() - start_time
                     record_ws_processing_time("full_translation", processing_time)
@@ -194,6 +474,22 @@ async def websocket_endpoint(websocket: WebSocket, user = Depends(get_current_us
                     # Çeviri metriğini kaydet
                     record_translation(source_language, target_language)
                     
+                    await cache_manager.set_translation(
+                        audio_hash,
+                        None,
+                        target_language,
+                        {
+                            "source_text": transcribed_text,
+                            "translated_text": translated_text,
+                            "source_lang": source_language,
+                        },
+                        user.voice_preference
+                    )
+                    
+                    # Ses cümle cümle ayrı mesajlarla gönderilir
+                    if stream_audio:
+                        await send_audio_stream(websocket, translated_text, user)
+                    
                 except Exception as e:
                     logger.error(
                         "websocket_processing_error",
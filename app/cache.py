@@ -1,35 +1,257 @@
-from redis import Redis
+from redis.asyncio import Redis
 from typing import Optional, Any, Union
 import json
 import hashlib
-import pickle
 from datetime import timedelta
 import structlog
-from app.config import CACHE_TTL, MAX_CACHE_SIZE
-from app.monitoring import record_cache_hit, record_cache_miss
+import asyncio
+import math
+import random
+import time
+import uuid
+from app.config import (
+    CACHE_TTL,
+    MAX_CACHE_SIZE,
+    TTS_SEGMENT_CACHE_TTL,
+    TRANSLATION_MEMORY_TTL,
+    PIPELINE_RESULT_CACHE_TTL,
+    SINGLEFLIGHT_REDIS_LOCK,
+    SINGLEFLIGHT_LOCK_TTL_MS,
+    SINGLEFLIGHT_LOCK_POLL_MS,
+    CACHE_STALE_TTL,
+    CACHE_XFETCH_BETA,
+    CACHE_L1_ENABLED,
+    CACHE_L1_MAX_ENTRIES,
+    CACHE_L1_MAX_BYTES,
+    CACHE_L1_TTL,
+    CACHE_L1_TYPES,
+    CACHE_INVALIDATION_CHANNEL,
+    CACHE_STATS_SAMPLE_RATE,
+    CACHE_HOT_KEYS_TOP_K,
+    CACHE_MEMORY_SAMPLE_KEYS,
+    CACHE_BLOB_TYPES,
+    CACHE_BLOB_OFFLOAD_THRESHOLD,
+    CACHE_BLOB_MAX_SIZE,
+    CACHE_BLOB_PREFIX,
+    CACHE_GENERATION_REFRESH_SECONDS,
+    CACHE_SWEEP_INTERVAL_SECONDS,
+    CACHE_SWEEP_MAX_KEYS_PER_SECOND,
+    CACHE_SWEEP_SCAN_COUNT
+)
+from app.local_cache import LocalCache
+from app.sketches import TopK
+from app.redis_pool import get_redis
+from app.monitoring import (
+    record_cache_hit,
+    record_cache_miss,
+    record_cache_tier_lookup,
+    record_cache_generation,
+    record_cache_sweep,
+    record_cache_stale_served,
+    record_cache_hit_ttl,
+    record_tts_warmer_hit,
+    record_cache_blob,
+    record_cache_refresh,
+    record_singleflight_lock_wait
+)
+from app.serialization import dumps, loads, SerializationError
+from app.singleflight import SingleFlight
+from app.utils import normalize_text, audio_digest
 
 logger = structlog.get_logger()
 
+# Kilidi yalnızca sahibi silebilir
+RELEASE_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+# Nesil sayacını yerel nesilden geri gitmeyecek şekilde artır ya da onar
+BUMP_GENERATION_SCRIPT = """
+local current = tonumber(redis.call('get', KEYS[1]) or '0')
+local floor = tonumber(ARGV[1])
+if current < floor then
+    current = floor
+end
+current = current + tonumber(ARGV[2])
+redis.call('set', KEYS[1], current)
+return current
+"""
+
+# Pub/sub bağlantısı koptuğunda yeniden deneme aralığı (saniye)
+INVALIDATION_RETRY_SECONDS = 1
+# Pub/sub okuma bekleme süresi; açık verildiğinden soket zaman aşımı boşta hata sayılmaz
+INVALIDATION_POLL_SECONDS = 30
+
+# Nesil numaralı önbellek ad alanları; anahtarlar "{ad_alanı}:v{nesil}:{hash}" biçimindedir
+NAMESPACES = ("translation", "text_translation", "tts", "tts_segment", "user")
+GENERATION_KEY_PREFIX = "cache:gen:"
+SWEEPER_LOCK_KEY = "lock:cache_sweeper"
+
+# get_or_set değerleri yumuşak süre ve hesaplama süresiyle birlikte saklanır
+ENVELOPE_MARKER = "__swr__"
+
+# Nesne deposuna taşınan büyük değerler için Redis'te tutulan işaretçi
+BLOB_MARKER = "__blob__"
+
 class CacheManager:
-    def __init__(self, redis_url: str):
-        self.redis = Redis.from_url(redis_url)
+    def __init__(
+        self,
+        redis_client: Optional[Redis] = None,
+        local_cache: Optional[LocalCache] = None,
+        local_types=CACHE_L1_TYPES
+    ):
+        self._redis = redis_client
         self.default_ttl = int(CACHE_TTL)
         self.max_size = int(MAX_CACHE_SIZE)
+        self.flight = SingleFlight("cache")
+        # İsteğe bağlı süreç içi L1 katmanı; Redis L2 olarak kalır
+        self.local = local_cache
+        self.local_types = set(local_types)
+        self.local_ttl = CACHE_L1_TTL
+        # Kendi süreç içi katmanını tutan bileşenlerin (ör. çeviri belleği) LocalCache'leri;
+        # silme, pattern ve nesil geçersiz kılmaları bunlara da uygulanır
+        self.attached_locals = []
+        self.instance_id = uuid.uuid4().hex
+        self._invalidation_task = None
+        self._maintenance_task = None
+        # Arka planda yenilenen anahtarlar; görevlerin GC ile toplanmaması için tutulur
+        self._refresh_tasks = {}
+        # Okumaların bir örneği üzerinden sıcak anahtarlar ve isabetteki kalan TTL
+        self.stats_sample_rate = CACHE_STATS_SAMPLE_RATE
+        self.hot_keys = TopK(CACHE_HOT_KEYS_TOP_K, width=4096, decay_every=100000)
+        # Büyük değerler için nesne deposu; set_blob_store ile bağlanır
+        self.blob_store = None
+        self.blob_types = set(CACHE_BLOB_TYPES)
+        self.blob_threshold = CACHE_BLOB_OFFLOAD_THRESHOLD
+        self.blob_max_size = CACHE_BLOB_MAX_SIZE
+        # Ad alanı başına geçerli nesil; Redis'teki sayaçtan periyodik ve pub/sub ile güncellenir
+        self.generations = {namespace: 0 for namespace in NAMESPACES}
+    
+    @property
+    def redis(self) -> Redis:
+        """Verilmediyse uygulamanın paylaşılan async bağlantı havuzu"""
+        return self._redis or get_redis()
         
     def _generate_key(self, prefix: str, *args) -> str:
         """Önbellek anahtarı oluştur"""
         key_parts = [str(arg) for arg in args]
         key_string = ":".join(key_parts)
         key_hash = hashlib.md5(key_string.encode()).hexdigest()
-        return f"{prefix}:{key_hash}"
+        return f"{prefix}:v{self.generations.get(prefix, 0)}:{key_hash}"
+    
+    def attach_local(self, local: LocalCache):
+        """Geçersiz kılmaların uygulanacağı ek bir süreç içi katman kaydet"""
+        self.attached_locals.append(local)
+    
+    def _local_tiers(self) -> list:
+        return ([self.local] if self.local is not None else []) + self.attached_locals
+    
+    def _uses_local(self, cache_type: str) -> bool:
+        return self.local is not None and cache_type in self.local_types
+    
+    @staticmethod
+    def _cache_type(key: str) -> str:
+        return key.split(":", 1)[0]
+    
+    @staticmethod
+    def _loads(cache_type: str, data: bytes) -> Any:
+        return loads(data, cache_type=cache_type)
+    
+    @staticmethod
+    def _dumps(cache_type: str, value: Any) -> bytes:
+        return dumps(value, cache_type=cache_type)
+    
+    async def _prepare(self, key: str, value: Any) -> Optional[tuple]:
+        """
+        Değeri (Redis'e yazılacak byte'lar, L1'e yazılacak byte'lar) ikilisine çevir.
+        Eşikten büyük blob türleri nesne deposuna yüklenir ve Redis'e yerine küçük bir
+        işaretçi kaydı yazılır; L1 her zaman değerin kendisini tutar.
+        None dönerse değer saklanmaz.
+        """
+        cache_type = self._cache_type(key)
+        serialized = stored = self._dumps(cache_type, value)
+        if len(serialized) > self.blob_threshold and self.blob_store is not None and cache_type in self.blob_types:
+            stored = await self._offload_blob(cache_type, serialized)
+            if stored is None:
+                return None
+        if len(stored) > self.max_size:
+            logger.warning("cache_value_too_large", key=key, size=len(stored))
+            return None
+        return stored, serialized
+    
+    async def _offload_blob(self, cache_type: str, serialized: bytes) -> Optional[bytes]:
+        if len(serialized) > self.blob_max_size:
+            logger.warning("cache_blob_too_large", cache_type=cache_type, size=len(serialized))
+            record_cache_blob(cache_type, "upload", "too_large")
+            return None
+        # İçerik adresli anahtar: aynı ses bir kez saklanır, tekrar yüklemek zararsızdır
+        blob_key = f"{CACHE_BLOB_PREFIX}/{cache_type}/{audio_digest(serialized)}"
+        if not await self.blob_store.upload_file(serialized, blob_key, "application/octet-stream"):
+            record_cache_blob(cache_type, "upload", "error")
+            return None
+        record_cache_blob(cache_type, "upload", "success", len(serialized))
+        return dumps({BLOB_MARKER: blob_key, "size": len(serialized)}, cache_type=cache_type)
+    
+    async def _decode(self, cache_type: str, data: bytes) -> tuple:
+        """
+        Redis'ten okunan byte'ları (değer, L1'e yazılacak byte'lar) ikilisine çevir.
+        İşaretçi kaydıysa asıl değer nesne deposundan getirilir ve L1'e o yazılır,
+        böylece L1 isabetleri nesne deposuna tekrar gitmez.
+        """
+        value = self._loads(cache_type, data)
+        if not (isinstance(value, dict) and BLOB_MARKER in value):
+            return value, data
+        data = await self.blob_store.download_file(value[BLOB_MARKER]) if self.blob_store is not None else None
+        if data is None:
+            record_cache_blob(cache_type, "download", "error")
+            raise SerializationError("Önbellek blob'u nesne deposunda bulunamadı")
+        record_cache_blob(cache_type, "download", "success", len(data))
+        return self._loads(cache_type, data), data
+    
+    def set_blob_store(self, blob_store):
+        """Büyük değerlerin yükleneceği nesne deposunu (CDNManager) ayarla"""
+        self.blob_store = blob_store
+    
+    async def _fetch(self, key: str, cache_type: str) -> Optional[bytes]:
+        """Redis'ten oku; örneklenen okumalarda aynı round trip'te kalan TTL de alınır"""
+        if random.random() >= self.stats_sample_rate:
+            return await self.redis.get(key)
+        self.hot_keys.add(key)
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.get(key)
+            pipe.pttl(key)
+            data, ttl_ms = await pipe.execute()
+        if data is not None and ttl_ms > 0:
+            record_cache_hit_ttl(cache_type, ttl_ms / 1000)
+        return data
     
     async def get(self, key: str, cache_type: str) -> Optional[Any]:
-        """Önbellekten veri al"""
+        """Önbellekten veri al; önce L1, sonra Redis"""
         try:
-            value = self.redis.get(key)
-            if value is not None:
+            use_local = self._uses_local(cache_type)
+            if use_local:
+                data = self.local.get(key)
+                record_cache_tier_lookup(cache_type, "l1", data is not None)
+                if data is not None:
+                    value = self._loads(cache_type, data)
+                    record_cache_hit(cache_type)
+                    return value
+            
+            data = await self._fetch(key, cache_type)
+            record_cache_tier_lookup(cache_type, "l2", data is not None)
+            if data is not None:
+                value, data = await self._decode(cache_type, data)
+                if use_local:
+                    self.local.set(key, data, self.local_ttl)
                 record_cache_hit(cache_type)
-                return pickle.loads(value)
+                return value
+            record_cache_miss(cache_type)
+            return None
+        except SerializationError as e:
+            logger.warning("cache_value_unreadable", error=str(e), key=key)
             record_cache_miss(cache_type)
             return None
         except Exception as e:
@@ -45,94 +267,617 @@ class CacheManager:
     ) -> bool:
         """Önbelleğe veri kaydet"""
         try:
-            # Boyut kontrolü
-            if len(pickle.dumps(value)) > self.max_size:
-                logger.warning("cache_value_too_large", key=key)
+            # Veriyi bir kez serialize et, boyut kontrolü saklanacak byte'lar üzerinden
+            prepared = await self._prepare(key, value)
+            if prepared is None:
                 return False
-            
-            # Veriyi serialize et
-            serialized = pickle.dumps(value)
+            serialized, local_data = prepared
             
             # TTL ayarla
             ttl = ttl or self.default_ttl
             
             # Kaydet
             if nx:
-                return bool(self.redis.set(
+                stored = bool(await self.redis.set(
                     key,
                     serialized,
                     ex=ttl,
                     nx=True
                 ))
             else:
-                return bool(self.redis.set(
+                stored = bool(await self.redis.set(
                     key,
                     serialized,
                     ex=ttl
                 ))
+            
+            if stored and self._uses_local(self._cache_type(key)):
+                # Diğer replikalardaki eski kopyalar silinsin
+                await self._publish_invalidation(keys=[key])
+                self.local.set(key, local_data, min(ttl, self.local_ttl))
+            return stored
                 
         except Exception as e:
             logger.error("cache_set_error", error=str(e), key=key)
             return False
     
+    async def get_many(self, keys: list, cache_type: str) -> dict:
+        """
+        Birden çok anahtarı tek MGET ile oku; yalnızca bulunanları döndür.
+        Hit/miss sayımı anahtar başınadır.
+        """
+        results = {}
+        if not keys:
+            return results
+        try:
+            use_local = self._uses_local(cache_type)
+            remote_keys = []
+            for key in dict.fromkeys(keys):
+                data = self.local.get(key) if use_local else None
+                if use_local:
+                    record_cache_tier_lookup(cache_type, "l1", data is not None)
+                if data is None:
+                    remote_keys.append(key)
+                    continue
+                try:
+                    results[key] = self._loads(cache_type, data)
+                    record_cache_hit(cache_type)
+                except SerializationError:
+                    record_cache_miss(cache_type)
+            
+            values = await self.redis.mget(remote_keys) if remote_keys else []
+            for key, data in zip(remote_keys, values):
+                record_cache_tier_lookup(cache_type, "l2", data is not None)
+                if data is None:
+                    record_cache_miss(cache_type)
+                    continue
+                try:
+                    results[key], data = await self._decode(cache_type, data)
+                except SerializationError as e:
+                    logger.warning("cache_value_unreadable", error=str(e), key=key)
+                    record_cache_miss(cache_type)
+                    continue
+                if use_local:
+                    self.local.set(key, data, self.local_ttl)
+                record_cache_hit(cache_type)
+            return results
+        except Exception as e:
+            logger.error("cache_get_many_error", error=str(e), count=len(keys))
+            return results
+    
+    async def set_many(
+        self,
+        items: dict,
+        ttl: Optional[int] = None,
+        ttls: Optional[dict] = None
+    ) -> int:
+        """
+        Birden çok değeri tek pipeline ile kaydet.
+        ttls anahtar başına TTL verir; verilmeyenler için ttl ya da varsayılan kullanılır.
+        Serileştirilemeyen ya da yüklenemeyen değerler atlanır, kalanlar yine kaydedilir.
+        """
+        ttls = ttls or {}
+        entries = {}
+        for key, value in items.items():
+            try:
+                prepared = await self._prepare(key, value)
+            except Exception as e:
+                logger.error("cache_set_many_item_error", error=str(e), key=key)
+                continue
+            if prepared is None:
+                continue
+            entries[key] = (*prepared, ttls.get(key) or ttl or self.default_ttl)
+        if not entries:
+            return 0
+        
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for key, (serialized, _, key_ttl) in entries.items():
+                    pipe.set(key, serialized, ex=key_ttl)
+                results = await pipe.execute()
+            
+            local_keys = [
+                key for key, stored in zip(entries, results)
+                if stored and self._uses_local(self._cache_type(key))
+            ]
+            if local_keys:
+                await self._publish_invalidation(keys=local_keys)
+                for key in local_keys:
+                    _, local_data, key_ttl = entries[key]
+                    self.local.set(key, local_data, min(key_ttl, self.local_ttl))
+            return sum(1 for stored in results if stored)
+        except Exception as e:
+            logger.error("cache_set_many_error", error=str(e), count=len(entries))
+            return 0
+    
+    async def delete_many(self, keys: list) -> int:
+        """Birden çok anahtarı tek komutla sil"""
+        if not keys:
+            return 0
+        try:
+            tiers = self._local_tiers()
+            if tiers:
+                for tier in tiers:
+                    for key in keys:
+                        tier.delete(key)
+                await self._publish_invalidation(keys=list(keys))
+            return await self.redis.delete(*keys)
+        except Exception as e:
+            logger.error("cache_delete_many_error", error=str(e), count=len(keys))
+            return 0
+    
     async def delete(self, key: str) -> bool:
         """Önbellekten veri sil"""
         try:
-            return bool(self.redis.delete(key))
+            tiers = self._local_tiers()
+            if tiers:
+                for tier in tiers:
+                    tier.delete(key)
+                await self._publish_invalidation(keys=[key])
+            return bool(await self.redis.delete(key))
         except Exception as e:
             logger.error("cache_delete_error", error=str(e), key=key)
             return False
     
     async def clear_pattern(self, pattern: str) -> int:
-        """Pattern'e uyan tüm verileri sil"""
+        """
+        Pattern'e uyan tüm verileri SCAN ile parça parça sil (KEYS Redis'i bloklar).
+        Bir önbellek türünün tamamı için invalidate_namespace tercih edilmeli.
+        """
         try:
-            keys = self.redis.keys(pattern)
-            if keys:
-                return self.redis.delete(*keys)
-            return 0
+            tiers = self._local_tiers()
+            if tiers:
+                for tier in tiers:
+                    tier.delete_pattern(pattern)
+                await self._publish_invalidation(pattern=pattern)
+            deleted = 0
+            batch = []
+            async for key in self.redis.scan_iter(match=pattern, count=CACHE_SWEEP_SCAN_COUNT):
+                batch.append(key)
+                if len(batch) >= CACHE_SWEEP_SCAN_COUNT:
+                    deleted += await self.redis.unlink(*batch)
+                    batch = []
+            if batch:
+                deleted += await self.redis.unlink(*batch)
+            return deleted
         except Exception as e:
             logger.error("cache_clear_pattern_error", error=str(e), pattern=pattern)
             return 0
     
+    # Nesil numaralı ad alanları
+    async def invalidate_namespace(self, namespace: str) -> int:
+        """
+        Ad alanının neslini artırarak tüm girdilerini O(1) geçersiz kıl.
+        Eski nesil anahtarlar TTL ile ya da arka plan süpürücüsüyle silinir.
+        """
+        generation = int(await self.redis.eval(
+            BUMP_GENERATION_SCRIPT, 1, GENERATION_KEY_PREFIX + namespace,
+            self.generations.get(namespace, 0), 1
+        ))
+        self._set_generation(namespace, generation)
+        await self._publish_invalidation(generations={namespace: generation})
+        logger.info("cache_namespace_invalidated", namespace=namespace, generation=generation)
+        return generation
+    
+    async def invalidate_all(self):
+        """Tüm ad alanlarını geçersiz kıl (FLUSHALL yerine)"""
+        for namespace in NAMESPACES:
+            await self.invalidate_namespace(namespace)
+    
+    def _set_generation(self, namespace: str, generation: int):
+        # Nesil yerelde hiç geri gitmez; aksi halde eski nesil anahtarları yeniden sunulurdu
+        if generation > self.generations.get(namespace, 0):
+            self.generations[namespace] = generation
+            for tier in self._local_tiers():
+                tier.delete_pattern(f"{namespace}:*")
+        record_cache_generation(namespace, generation)
+    
+    async def refresh_generations(self):
+        """Geçerli nesilleri Redis'ten oku"""
+        try:
+            values = await self.redis.mget([GENERATION_KEY_PREFIX + namespace for namespace in NAMESPACES])
+            for namespace, value in zip(NAMESPACES, values):
+                generation = int(value or 0)
+                known = self.generations.get(namespace, 0)
+                if generation < known:
+                    # Sayaç silinmiş (eviction, FLUSHALL); bilinen nesilden geri yüklenir
+                    logger.warning(
+                        "cache_generation_counter_reset",
+                        namespace=namespace, stored=generation, known=known
+                    )
+                    generation = int(await self.redis.eval(
+                        BUMP_GENERATION_SCRIPT, 1, GENERATION_KEY_PREFIX + namespace, known, 0
+                    ))
+                self._set_generation(namespace, generation)
+        except Exception as e:
+            logger.error("cache_generation_refresh_error", error=str(e))
+    
+    def _is_stale(self, key: bytes, namespace: str) -> bool:
+        parts = key.decode(errors="replace").split(":", 2)
+        if len(parts) < 3 or not parts[1].startswith("v") or not parts[1][1:].isdigit():
+            # Nesil numarası olmayan eski formattaki anahtar
+            return True
+        return int(parts[1][1:]) < self.generations.get(namespace, 0)
+    
+    async def sweep_stale_keys(
+        self,
+        max_keys_per_second: int = CACHE_SWEEP_MAX_KEYS_PER_SECOND,
+        scan_count: int = CACHE_SWEEP_SCAN_COUNT
+    ) -> int:
+        """
+        Eski nesillere ait anahtarları tek bir SCAN geçişiyle artımlı olarak sil;
+        anahtarlar önekleriyle ad alanlarına ayrılır. Her SCAN çağrısı eşleşmeden
+        bağımsız olarak yaklaşık scan_count anahtar incelediğinden hız çağrı başına
+        scan_count üzerinden saniyede max_keys_per_second ile sınırlanır.
+        """
+        scanned = {namespace: 0 for namespace in NAMESPACES}
+        deleted = {namespace: 0 for namespace in NAMESPACES}
+        cursor = 0
+        while True:
+            cursor, keys = await self.redis.scan(cursor, count=scan_count)
+            stale = []
+            for key in keys:
+                namespace = key.split(b":", 1)[0].decode(errors="replace")
+                if namespace not in scanned:
+                    continue
+                scanned[namespace] += 1
+                if self._is_stale(key, namespace):
+                    stale.append(key)
+                    deleted[namespace] += 1
+            if stale:
+                await self.redis.unlink(*stale)
+            if cursor == 0:
+                break
+            await asyncio.sleep(scan_count / max_keys_per_second)
+        for namespace in NAMESPACES:
+            record_cache_sweep(namespace, scanned[namespace], deleted[namespace])
+        return sum(deleted.values())
+    
+    # Replikalar arası L1 geçersiz kılma
+    async def _publish_invalidation(self, keys=None, pattern: Optional[str] = None, generations=None):
+        try:
+            message = {
+                "origin": self.instance_id,
+                "keys": keys or [],
+                "pattern": pattern,
+                "generations": generations or {},
+            }
+            await self.redis.publish(CACHE_INVALIDATION_CHANNEL, json.dumps(message))
+        except Exception as e:
+            logger.error("cache_invalidation_publish_error", error=str(e))
+    
+    def _apply_invalidation(self, raw_message) -> None:
+        message = json.loads(raw_message)
+        if message.get("origin") == self.instance_id:
+            return
+        for namespace, generation in message.get("generations", {}).items():
+            self._set_generation(namespace, generation)
+        for tier in self._local_tiers():
+            for key in message.get("keys", []):
+                tier.delete(key)
+            if message.get("pattern"):
+                tier.delete_pattern(message["pattern"])
+    
+    async def _listen_for_invalidations(self):
+        while True:
+            pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(CACHE_INVALIDATION_CHANNEL)
+                # Bağlantı yokken kaçırılmış mesajlar olabilir
+                for tier in self._local_tiers():
+                    tier.clear()
+                await self.refresh_generations()
+                while True:
+                    # Kanal boşken None döner; yeniden bağlanıp katmanları temizlemeye gerek yok
+                    message = await pubsub.get_message(timeout=INVALIDATION_POLL_SECONDS)
+                    if message is not None and message.get("type") == "message":
+                        self._apply_invalidation(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("cache_invalidation_listener_error", error=str(e))
+                await asyncio.sleep(INVALIDATION_RETRY_SECONDS)
+            finally:
+                await pubsub.aclose()
+    
+    async def clear_local(self):
+        """Bu ve diğer replikalardaki L1 katmanını tamamen boşalt"""
+        for tier in self._local_tiers():
+            tier.clear()
+        # Bu replikada L1 olmasa da diğerlerinde olabilir
+        await self._publish_invalidation(pattern="*")
+    
+    def start_invalidation_listener(self):
+        """Diğer replikaların silme ve nesil mesajlarını dinlemeye başla"""
+        if self._invalidation_task is None:
+            self._invalidation_task = asyncio.create_task(self._listen_for_invalidations())
+    
+    async def stop_invalidation_listener(self):
+        if self._invalidation_task is not None:
+            self._invalidation_task.cancel()
+            try:
+                await self._invalidation_task
+            except asyncio.CancelledError:
+                pass
+            self._invalidation_task = None
+    
+    async def _maintenance_loop(self):
+        last_sweep = asyncio.get_running_loop().time()
+        while True:
+            await asyncio.sleep(CACHE_GENERATION_REFRESH_SECONDS)
+            # Pub/sub mesajı kaçırıldıysa nesiller yine de güncellensin
+            await self.refresh_generations()
+            
+            now = asyncio.get_running_loop().time()
+            if now - last_sweep < CACHE_SWEEP_INTERVAL_SECONDS:
+                continue
+            last_sweep = now
+            try:
+                # Aynı anda yalnızca bir replika süpürür
+                if await self.try_lock(SWEEPER_LOCK_KEY, CACHE_SWEEP_INTERVAL_SECONDS):
+                    deleted = await self.sweep_stale_keys()
+                    logger.info("cache_sweep_completed", deleted=deleted)
+            except Exception as e:
+                logger.error("cache_sweep_error", error=str(e))
+    
+    async def start_background_tasks(self):
+        """Nesilleri yükle, geçersiz kılma dinleyicisini ve süpürücüyü başlat"""
+        await self.refresh_generations()
+        self.start_invalidation_listener()
+        if self._maintenance_task is None:
+            self._maintenance_task = asyncio.create_task(self._maintenance_loop())
+    
+    async def stop_background_tasks(self):
+        await self.stop_invalidation_listener()
+        for task in list(self._refresh_tasks.values()):
+            task.cancel()
+        if self._maintenance_task is not None:
+            self._maintenance_task.cancel()
+            try:
+                await self._maintenance_task
+            except asyncio.CancelledError:
+                pass
+            self._maintenance_task = None
+    
     async def get_or_set(
         self,
         key: str,
         func,
         ttl: Optional[int] = None,
-        cache_type: str = "default"
+        cache_type: str = "default",
+        distributed: bool = SINGLEFLIGHT_REDIS_LOCK,
+        stale_ttl: int = CACHE_STALE_TTL
     ) -> Any:
-        """Önbellekten veri al, yoksa fonksiyonu çalıştır ve kaydet"""
-        value = await self.get(key, cache_type)
-        if value is not None:
+        """
+        Önbellekten veri al, yoksa fonksiyonu çalıştır ve kaydet.
+        Aynı anahtar için eşzamanlı istekler tek bir hesaplamayı paylaşır;
+        distributed ise replikalar arasında kısa ömürlü Redis kilidiyle birleştirilir.
+        
+        ttl dolduktan sonra değer stale_ttl boyunca sunulmaya devam eder ve arka planda
+        yenilenir. Sık okunan değerler ttl dolmadan, hesaplama süresiyle orantılı bir
+        olasılıkla (XFetch) erkenden yenilenir.
+        """
+        ttl = ttl or self.default_ttl
+        entry = await self.get(key, cache_type)
+        if entry is not None:
+            value, expires_at, delta = self._unwrap(entry)
+            if expires_at is None:
+                return value
+            
+            remaining = expires_at - time.time()
+            if remaining <= 0:
+                record_cache_stale_served(cache_type)
+                self._schedule_refresh(key, func, ttl, cache_type, distributed, stale_ttl, "stale")
+            elif self._should_refresh_early(remaining, delta):
+                self._schedule_refresh(key, func, ttl, cache_type, distributed, stale_ttl, "early")
             return value
             
+        return await self.flight.do(
+            key,
+            lambda: self._compute_and_set(key, func, ttl, cache_type, distributed, stale_ttl)
+        )
+    
+    @staticmethod
+    def _wrap(value: Any, ttl: int, delta: float, warmed: bool = False) -> dict:
+        entry = {ENVELOPE_MARKER: 1, "value": value, "expires_at": time.time() + ttl, "delta": delta}
+        if warmed:
+            # Isıtıcının yazdığı değerlerden gelen isabetler ayrıca sayılır
+            entry["warmed"] = True
+        return entry
+    
+    @staticmethod
+    def _unwrap(entry: Any) -> tuple:
+        """(değer, yumuşak bitiş zamanı, hesaplama süresi); zarfsız değerler için süre None"""
+        if isinstance(entry, dict) and entry.get(ENVELOPE_MARKER):
+            return entry["value"], entry["expires_at"], entry["delta"]
+        return entry, None, 0.0
+    
+    @staticmethod
+    def _should_refresh_early(remaining: float, delta: float, beta: float = CACHE_XFETCH_BETA) -> bool:
+        # XFetch: kalan süre, hesaplama süresi * beta * -ln(U) değerinin altına düşerse yenile
+        if beta <= 0 or delta <= 0:
+            return False
+        return delta * beta * -math.log(1.0 - random.random()) >= remaining
+    
+    def _schedule_refresh(
+        self,
+        key: str,
+        func,
+        ttl: int,
+        cache_type: str,
+        distributed: bool,
+        stale_ttl: int,
+        reason: str
+    ):
+        """Anahtar için en fazla bir arka plan yenilemesi başlat"""
+        if key in self._refresh_tasks:
+            return
+        task = asyncio.create_task(
+            self._refresh(key, func, ttl, cache_type, distributed, stale_ttl, reason)
+        )
+        self._refresh_tasks[key] = task
+        task.add_done_callback(lambda _: self._refresh_tasks.pop(key, None))
+    
+    async def _refresh(
+        self,
+        key: str,
+        func,
+        ttl: int,
+        cache_type: str,
+        distributed: bool,
+        stale_ttl: int,
+        reason: str
+    ):
+        lock_key = f"lock:{key}"
+        token = None
+        if distributed:
+            token = await self._acquire_lock(lock_key)
+            if token is None:
+                # Başka bir replika zaten yeniliyor
+                record_cache_refresh(cache_type, reason, "skipped")
+                return
+        try:
+            await self._store_computed(key, func, ttl, stale_ttl)
+            record_cache_refresh(cache_type, reason, "success")
+        except Exception as e:
+            # Eski değer stale_ttl dolana kadar sunulmaya devam eder
+            logger.error("cache_refresh_error", error=str(e), key=key, reason=reason)
+            record_cache_refresh(cache_type, reason, "error")
+        finally:
+            if token is not None:
+                await self._release_lock(lock_key, token)
+    
+    async def _store_computed(
+        self,
+        key: str,
+        func,
+        ttl: int,
+        stale_ttl: int,
+        warmed: bool = False
+    ) -> Any:
+        start_time = time.perf_counter()
         value = await func()
         if value is not None:
-            await self.set(key, value, ttl)
+            delta = time.perf_counter() - start_time
+            await self.set(key, self._wrap(value, ttl, delta, warmed), ttl + max(0, stale_ttl))
         return value
     
-    # Çeviri önbelleği için özel metodlar
+    async def _compute_and_set(
+        self,
+        key: str,
+        func,
+        ttl: int,
+        cache_type: str,
+        distributed: bool,
+        stale_ttl: int
+    ) -> Any:
+        lock_key = f"lock:{key}"
+        token = None
+        if distributed:
+            token = await self._acquire_lock(lock_key)
+            if token is None:
+                # Başka bir replika hesaplıyor; sonucun önbelleğe düşmesini bekle
+                entry = await self._wait_for_value(key, lock_key, cache_type)
+                if entry is not None:
+                    return self._unwrap(entry)[0]
+                    
+        try:
+            return await self._store_computed(key, func, ttl, stale_ttl)
+        finally:
+            if token is not None:
+                await self._release_lock(lock_key, token)
+    
+    async def try_lock(self, lock_key: str, ttl: int) -> bool:
+        """Periyodik işler için ttl saniyelik kilit al; sahibi süresi dolunca değişir"""
+        return bool(await self.redis.set(lock_key, self.instance_id, ex=ttl, nx=True))
+    
+    async def _acquire_lock(self, lock_key: str) -> Optional[str]:
+        """Kısa ömürlü dağıtık kilit al, alınamazsa None döndür"""
+        token = uuid.uuid4().hex
+        try:
+            if await self.redis.set(lock_key, token, px=SINGLEFLIGHT_LOCK_TTL_MS, nx=True):
+                return token
+            return None
+        except Exception as e:
+            logger.error("cache_lock_error", error=str(e), key=lock_key)
+            return None
+    
+    async def _release_lock(self, lock_key: str, token: str):
+        try:
+            await self.redis.eval(RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+        except Exception as e:
+            logger.error("cache_unlock_error", error=str(e), key=lock_key)
+    
+    async def _wait_for_value(self, key: str, lock_key: str, cache_type: str) -> Optional[Any]:
+        """Kilit sahibi bitirene ya da kilit süresi dolana kadar değeri yokla"""
+        deadline = asyncio.get_running_loop().time() + SINGLEFLIGHT_LOCK_TTL_MS / 1000
+        while asyncio.get_running_loop().time() < deadline:
+            await asyncio.sleep(SINGLEFLIGHT_LOCK_POLL_MS / 1000)
+            try:
+                value = await self.redis.get(key)
+                if value is not None:
+                    record_singleflight_lock_wait("value_found")
+                    record_cache_hit(cache_type)
+                    return (await self._decode(cache_type, value))[0]
+                if not await self.redis.exists(lock_key):
+                    break
+            except Exception as e:
+                logger.error("cache_lock_wait_error", error=str(e), key=key)
+                break
+        record_singleflight_lock_wait("timeout")
+        return None
+    
+    # Ses çevirisi önbelleği; anahtar ses özeti, kaynak/hedef dil ve sestir.
+    # Değer tüm hattın sonucudur (kaynak dil, metin, çeviri, ses referansı).
     async def get_translation(
         self,
         audio_hash: str,
-        source_lang: str,
-        target_lang: str
-    ) -> Optional[str]:
+        source_lang: Optional[str],
+        target_lang: str,
+        voice: str = ""
+    ) -> Optional[dict]:
         """Çeviri önbelleğinden veri al"""
-        key = self._generate_key("translation", audio_hash, source_lang, target_lang)
+        key = self._generate_key("translation", audio_hash, source_lang or "auto", target_lang, voice)
         return await self.get(key, "translation")
     
     async def set_translation(
         self,
         audio_hash: str,
+        source_lang: Optional[str],
+        target_lang: str,
+        translation: dict,
+        voice: str = "",
+        ttl: Optional[int] = None
+    ) -> bool:
+        """Çeviri önbelleğine veri kaydet"""
+        key = self._generate_key("translation", audio_hash, source_lang or "auto", target_lang, voice)
+        return await self.set(key, translation, ttl or PIPELINE_RESULT_CACHE_TTL)
+    
+    # Metin çeviri belleği için özel metodlar
+    def text_translation_key(self, text: str, source_lang: str, target_lang: str) -> str:
+        """Geçerli nesli içeren metin çevirisi anahtarı"""
+        return self._generate_key("text_translation", normalize_text(text), source_lang, target_lang)
+    
+    async def get_text_translation(
+        self,
+        text: str,
+        source_lang: str,
+        target_lang: str
+    ) -> Optional[str]:
+        """Metin çevirisini önbellekten al"""
+        return await self.get(self.text_translation_key(text, source_lang, target_lang), "text_translation")
+    
+    async def set_text_translation(
+        self,
+        text: str,
         source_lang: str,
         target_lang: str,
         translation: str,
         ttl: Optional[int] = None
     ) -> bool:
-        """Çeviri önbelleğine veri kaydet"""
-        key = self._generate_key("translation", audio_hash, source_lang, target_lang)
-        return await self.set(key, translation, ttl)
+        """Metin çevirisini önbelleğe kaydet"""
+        key = self.text_translation_key(text, source_lang, target_lang)
+        return await self.set(key, translation, ttl or TRANSLATION_MEMORY_TTL)
     
     # TTS önbelleği için özel metodlar
     async def get_tts(
@@ -157,6 +902,105 @@ class CacheManager:
         key = self._generate_key("tts", text, lang, voice)
         return await self.set(key, audio, ttl)
     
+    # Cümle bazlı TTS önbelleği; farklı metinler ortak cümlelerin sesini paylaşır
+    async def get_tts_segment(
+        self,
+        sentence: str,
+        lang: str,
+        voice: str
+    ) -> Optional[bytes]:
+        """Cümle sesini önbellekten al"""
+        key = self._generate_key("tts_segment", normalize_text(sentence), lang, voice)
+        return await self.get(key, "tts_segment")
+    
+    async def set_tts_segment(
+        self,
+        sentence: str,
+        lang: str,
+        voice: str,
+        audio: bytes,
+        ttl: Optional[int] = None
+    ) -> bool:
+        """Cümle sesini önbelleğe kaydet"""
+        key = self._generate_key("tts_segment", normalize_text(sentence), lang, voice)
+        return await self.set(key, audio, ttl or TTS_SEGMENT_CACHE_TTL)
+    
+    async def get_tts_segments(
+        self,
+        sentences: list,
+        lang: str,
+        voice: str
+    ) -> list:
+        """
+        Cümle seslerini tek round trip ile al; bulunmayan ya da yumuşak süresi
+        dolmuş cümleler için None döner (bunlar get_or_set_tts_segment ile yenilenir).
+        """
+        keys = [self._generate_key("tts_segment", normalize_text(sentence), lang, voice) for sentence in sentences]
+        found = await self.get_many(keys, "tts_segment")
+        now = time.time()
+        segments = []
+        warmed_hits = 0
+        for key in keys:
+            entry = found.get(key)
+            value, expires_at, _ = self._unwrap(entry)
+            if expires_at is not None and expires_at <= now:
+                value = None
+            elif expires_at is not None and entry.get("warmed"):
+                # set_tts_segment ile yazılan ham değerler zarfsızdır
+                warmed_hits += 1
+            segments.append(value)
+        if warmed_hits:
+            record_tts_warmer_hit(warmed_hits)
+        return segments
+    
+    async def get_tts_segment_ttls(self, phrases: list) -> list:
+        """
+        (cümle, dil, ses) üçlüleri için yumuşak süre dolana kadar kalan saniyeleri
+        tek PTTL pipeline'ı ile döndür; önbellekte olmayanlar için None.
+        Değerin kendisi okunmaz: cümle zarfları bayat sunma süresi (CACHE_STALE_TTL)
+        kadar uzun fiziksel TTL ile yazıldığından yumuşak süre PTTL'den çıkarılır.
+        Zarfsız ham değerler için bu, yenilemenin en fazla o kadar erken yapılması demektir.
+        """
+        keys = [self._generate_key("tts_segment", normalize_text(sentence), lang, voice) for sentence, lang, voice in phrases]
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.pttl(key)
+            results = await pipe.execute()
+        
+        remaining = []
+        for ttl_ms in results:
+            if ttl_ms == -2:
+                remaining.append(None)
+            elif ttl_ms == -1:
+                remaining.append(math.inf)
+            else:
+                remaining.append(ttl_ms / 1000 - CACHE_STALE_TTL)
+        return remaining
+    
+    async def warm_tts_segment(
+        self,
+        sentence: str,
+        lang: str,
+        voice: str,
+        func,
+        ttl: Optional[int] = None
+    ) -> Optional[bytes]:
+        """Cümle sesini yeniden üret ve tam TTL ile kaydet (önbellek ısıtıcısı için)"""
+        key = self._generate_key("tts_segment", normalize_text(sentence), lang, voice)
+        return await self._store_computed(key, func, ttl or TTS_SEGMENT_CACHE_TTL, CACHE_STALE_TTL, warmed=True)
+    
+    async def get_or_set_tts_segment(
+        self,
+        sentence: str,
+        lang: str,
+        voice: str,
+        func,
+        ttl: Optional[int] = None
+    ) -> Optional[bytes]:
+        """Cümle sesini önbellekten al, yoksa tek bir sentezle üret ve kaydet"""
+        key = self._generate_key("tts_segment", normalize_text(sentence), lang, voice)
+        return await self.get_or_set(key, func, ttl or TTS_SEGMENT_CACHE_TTL, "tts_segment")
+    
     # Kullanıcı önbelleği için özel metodlar
     async def get_user(self, user_id: int) -> Optional[dict]:
         """Kullanıcı önbelleğinden veri al"""
@@ -186,10 +1030,10 @@ class CacheManager:
     ) -> int:
         """Rate limit sayacını artır"""
         try:
-            pipe = self.redis.pipeline()
-            pipe.incr(key)
-            pipe.expire(key, ttl)
-            result = pipe.execute()
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.incr(key)
+                pipe.expire(key, ttl)
+                result = await pipe.execute()
             return result[0]
         except Exception as e:
             logger.error("rate_limit_error", error=str(e), key=key)
@@ -197,20 +1041,13 @@ class CacheManager:
     
     # Önbellek temizleme ve bakım
     async def cleanup_expired(self) -> int:
-        """Süresi dolmuş verileri temizle"""
-        try:
-            script = """
-            local keys = redis.call('keys', ARGV[1])
-            local count = 0
-            for i, key in ipairs(keys) do
-                if redis.call('ttl', key) <= 0 then
-                    redis.call('del', key)
-                    count = count + 1
-                end
-            end
-            return count
-            """
-            return self.redis.eval(script, 0, "*")
+        """
+        Süresi dolan anahtarları Redis kendisi siler; burada yalnızca
+        geçersiz kılınmış nesillere ait anahtarlar süpürülür.
+        """
+        try:
+            await self.refresh_generations()
+            return await self.sweep_stale_keys()
         except Exception as e:
             logger.error("cache_cleanup_error", error=str(e))
             return 0
@@ -218,13 +1055,68 @@ class CacheManager:
     async def get_stats(self) -> dict:
         """Önbellek istatistiklerini al"""
         try:
-            info = self.redis.info()
+            info = await self.redis.info()
+            hits = info.get("keyspace_hits", 0)
+            misses = info.get("keyspace_misses", 0)
             return {
-                "used_memory": info["used_memory"],
-                "hits": info["keyspace_hits"],
-                "misses": info["keyspace_misses"],
-                "keys": info["db0"]["keys"]
+                "used_memory": info.get("used_memory"),
+                "hits": hits,
+                "misses": misses,
+                "hit_ratio": round(hits / (hits + misses), 4) if hits + misses else None,
+                # Seçili veritabanındaki anahtarlar; db0 olmayabilir
+                "keys": await self.redis.dbsize()
             }
         except Exception as e:
             logger.error("cache_stats_error", error=str(e))
-            return {} 
\ No newline at end of file
+            return {}
+    
+    def get_hot_keys(self) -> list:
+        """Örneklenen okumalardaki en sık anahtarlar"""
+        return [{"key": key, "count": count} for key, count in self.hot_keys.items()]
+    
+    async def _memory_usage(self, keys: list) -> list:
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.memory_usage(key)
+            return await pipe.execute()
+    
+    async def estimate_namespace_memory(self, sample_size: int = CACHE_MEMORY_SAMPLE_KEYS) -> dict:
+        """
+        SCAN ile alınan bir anahtar örneğinden ad alanı başına anahtar sayısı ve
+        bellek kullanımını tahmin et; tüm anahtar uzayı dolaşılmaz.
+        """
+        total_keys = await self.redis.dbsize()
+        sampled = []
+        cursor = 0
+        while len(sampled) < sample_size:
+            cursor, keys = await self.redis.scan(cursor, count=CACHE_SWEEP_SCAN_COUNT)
+            sampled.extend(keys)
+            if cursor == 0:
+                break
+        sampled = sampled[:sample_size]
+        
+        namespaces = {}
+        sizes = await self._memory_usage(sampled) if sampled else []
+        for key, size in zip(sampled, sizes):
+            namespace = self._cache_type(key.decode(errors="replace"))
+            stats = namespaces.setdefault(namespace, {"keys": 0, "bytes": 0})
+            stats["keys"] += 1
+            stats["bytes"] += size or 0
+        
+        scale = total_keys / len(sampled) if sampled else 0
+        return {
+            "total_keys": total_keys,
+            "sampled_keys": len(sampled),
+            "namespaces": {
+                namespace: {
+                    "estimated_keys": round(stats["keys"] * scale),
+                    "estimated_bytes": round(stats["bytes"] * scale),
+                    "avg_bytes": round(stats["bytes"] / stats["keys"]),
+                }
+                for namespace, stats in sorted(namespaces.items())
+            },
+        }
+
+cache_manager = CacheManager(
+    local_cache=LocalCache(CACHE_L1_MAX_ENTRIES, CACHE_L1_MAX_BYTES) if CACHE_L1_ENABLED else None
+)
\ No newline at end of file
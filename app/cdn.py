@@ -10,6 +10,7 @@ from app.config import (
     CDN_DISTRIBUTION_ID,
     CDN_BASE_URL
 )
+from app.services.resilience import call_provider
 
 logger = structlog.get_logger()
 
@@ -43,7 +44,9 @@ class CDNManager:
         """Dosyayı S3'e yükle ve CDN URL'ini döndür"""
         try:
             # S3'e yükle
-            self.s3.put_object(
+            await call_provider(
+                "s3",
+                self.s3.put_object,
                 Bucket=self.bucket_name,
                 Key=file_key,
                 Body=file_data,
@@ -58,11 +61,25 @@ class CDNManager:
             logger.error("cdn_upload_error", error=str(e), file_key=file_key)
             return None
     
+    def _read_object(self, file_key: str) -> bytes:
+        response = self.s3.get_object(Bucket=self.bucket_name, Key=file_key)
+        return response["Body"].read()
+    
+    async def download_file(self, file_key: str) -> Optional[bytes]:
+        """Dosya içeriğini S3'ten oku"""
+        try:
+            return await call_provider("s3", self._read_object, file_key)
+        except Exception as e:
+            logger.error("cdn_download_error", error=str(e), file_key=file_key)
+            return None
+    
     async def delete_file(self, file_key: str) -> bool:
         """Dosyayı S3'ten sil ve CDN önbelleğini temizle"""
         try:
             # S3'ten sil
-            self.s3.delete_object(
+            await call_provider(
+                "s3",
+                self.s3.delete_object,
                 Bucket=self.bucket_name,
                 Key=file_key
             )
@@ -5,8 +5,13 @@ load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL")
 GOOGLE_APPLICATION_CREDENTIALS = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
+GOOGLE_CLOUD_PROJECT = os.getenv("GOOGLE_CLOUD_PROJECT")
+GOOGLE_CLOUD_REGION = os.getenv("GOOGLE_CLOUD_REGION", "global")
 SECRET_KEY = os.getenv("SECRET_KEY")
-REDIS_URL = os.getenv("REDIS_URL")
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+REDIS_POOL_MAX_CONNECTIONS = int(os.getenv("REDIS_POOL_MAX_CONNECTIONS", "50"))
+REDIS_POOL_TIMEOUT_SECONDS = float(os.getenv("REDIS_POOL_TIMEOUT_SECONDS", "2"))  # boş bağlantı bekleme
+REDIS_SOCKET_TIMEOUT_SECONDS = float(os.getenv("REDIS_SOCKET_TIMEOUT_SECONDS", "1"))
 
 # CDN Yapılandırması
 AWS_ACCESS_KEY_ID = os.getenv("AWS_ACCESS_KEY_ID")
@@ -18,4 +23,118 @@ CDN_BASE_URL = os.getenv("CDN_BASE_URL")
 
 # CDN önbellek ayarları
 CDN_CACHE_DURATION = int(os.getenv("CDN_CACHE_DURATION", "31536000"))  # 1 yıl (saniye)
-CDN_CLEANUP_DAYS = int(os.getenv("CDN_CLEANUP_DAYS", "30"))  # 30 gün
\ No newline at end of file
+CDN_CLEANUP_DAYS = int(os.getenv("CDN_CLEANUP_DAYS", "30"))  # 30 gün
+
+# Önbellek ayarları
+CACHE_TTL = int(os.getenv("CACHE_TTL", "3600"))  # 1 saat (saniye)
+MAX_CACHE_SIZE = int(os.getenv("MAX_CACHE_SIZE", "5242880"))  # 5MB (byte)
+CACHE_COMPRESSION_THRESHOLD = int(os.getenv("CACHE_COMPRESSION_THRESHOLD", "1024"))  # byte
+
+# Süreç içi L1 önbellek (Redis önünde)
+CACHE_L1_ENABLED = os.getenv("CACHE_L1_ENABLED", "true").lower() == "true"
+CACHE_L1_MAX_ENTRIES = int(os.getenv("CACHE_L1_MAX_ENTRIES", "10000"))
+CACHE_L1_MAX_BYTES = int(os.getenv("CACHE_L1_MAX_BYTES", "67108864"))  # 64MB
+CACHE_L1_TTL = int(os.getenv("CACHE_L1_TTL", "30"))  # saniye, replikalar arası en fazla bayatlık
+CACHE_L1_TYPES = [t.strip() for t in os.getenv("CACHE_L1_TYPES", "user,tts_segment,translation").split(",") if t.strip()]
+CACHE_INVALIDATION_CHANNEL = os.getenv("CACHE_INVALIDATION_CHANNEL", "cache:invalidate")
+
+# Büyük ses değerleri CDN'e yüklenir, Redis'te yalnızca işaretçi tutulur
+CACHE_BLOB_TYPES = [t.strip() for t in os.getenv("CACHE_BLOB_TYPES", "tts,tts_segment").split(",") if t.strip()]
+CACHE_BLOB_OFFLOAD_THRESHOLD = int(os.getenv("CACHE_BLOB_OFFLOAD_THRESHOLD", "524288"))  # 512KB
+CACHE_BLOB_MAX_SIZE = int(os.getenv("CACHE_BLOB_MAX_SIZE", "52428800"))  # 50MB
+CACHE_BLOB_PREFIX = os.getenv("CACHE_BLOB_PREFIX", "cache-blobs")
+
+# Önbellek gözlemlenebilirliği: örneklenen okumalarda kalan TTL ölçülür ve sıcak anahtarlar izlenir
+CACHE_STATS_SAMPLE_RATE = float(os.getenv("CACHE_STATS_SAMPLE_RATE", "0.01"))
+CACHE_HOT_KEYS_TOP_K = int(os.getenv("CACHE_HOT_KEYS_TOP_K", "20"))
+CACHE_MEMORY_SAMPLE_KEYS = int(os.getenv("CACHE_MEMORY_SAMPLE_KEYS", "1000"))
+
+# Nesil numaralı ad alanları ve eski nesil süpürücüsü
+CACHE_GENERATION_REFRESH_SECONDS = int(os.getenv("CACHE_GENERATION_REFRESH_SECONDS", "5"))
+CACHE_SWEEP_INTERVAL_SECONDS = int(os.getenv("CACHE_SWEEP_INTERVAL_SECONDS", "300"))
+CACHE_SWEEP_MAX_KEYS_PER_SECOND = int(os.getenv("CACHE_SWEEP_MAX_KEYS_PER_SECOND", "5000"))
+CACHE_SWEEP_SCAN_COUNT = int(os.getenv("CACHE_SWEEP_SCAN_COUNT", "500"))
+TTS_SEGMENT_CACHE_TTL = int(os.getenv("TTS_SEGMENT_CACHE_TTL", "86400"))  # 1 gün
+TRANSLATION_MEMORY_TTL = int(os.getenv("TRANSLATION_MEMORY_TTL", "604800"))  # 7 gün
+# Aynı ses klibi için tüm hattın (tanıma, çeviri, ses referansı) sonucu
+PIPELINE_RESULT_CACHE_TTL = int(os.getenv("PIPELINE_RESULT_CACHE_TTL", "86400"))  # 1 gün
+TRANSLATION_MEMORY_MAX_ENTRIES = int(os.getenv("TRANSLATION_MEMORY_MAX_ENTRIES", "10000"))
+# Süreç içi çeviri belleği katmanında girdinin en uzun kalma süresi
+TRANSLATION_MEMORY_LOCAL_TTL = int(os.getenv("TRANSLATION_MEMORY_LOCAL_TTL", "300"))  # 5 dakika
+
+# Single-flight (eşzamanlı aynı işlerin birleştirilmesi) ayarları
+SINGLEFLIGHT_REDIS_LOCK = os.getenv("SINGLEFLIGHT_REDIS_LOCK", "false").lower() == "true"
+SINGLEFLIGHT_LOCK_TTL_MS = int(os.getenv("SINGLEFLIGHT_LOCK_TTL_MS", "5000"))
+SINGLEFLIGHT_LOCK_POLL_MS = int(os.getenv("SINGLEFLIGHT_LOCK_POLL_MS", "50"))
+
+# get_or_set: süresi dolan değer arka planda yenilenirken bu kadar süre eskisi sunulur
+CACHE_STALE_TTL = int(os.getenv("CACHE_STALE_TTL", "600"))  # 10 dakika
+# Olasılıksal erken yenileme (XFetch) katsayısı; 0 kapatır, büyüdükçe daha erken yenilenir
+CACHE_XFETCH_BETA = float(os.getenv("CACHE_XFETCH_BETA", "1.0"))
+
+# Sağlayıcı istemci havuzu ayarları
+PROVIDER_CHANNEL_POOL_SIZE = int(os.getenv("PROVIDER_CHANNEL_POOL_SIZE", "1"))
+GRPC_KEEPALIVE_TIME_MS = int(os.getenv("GRPC_KEEPALIVE_TIME_MS", "30000"))  # 30 saniye
+GRPC_KEEPALIVE_TIMEOUT_MS = int(os.getenv("GRPC_KEEPALIVE_TIMEOUT_MS", "10000"))  # 10 saniye
+
+# Çeviri toplu gönderim (micro-batching) ayarları
+TRANSLATION_BATCH_MAX_SIZE = min(int(os.getenv("TRANSLATION_BATCH_MAX_SIZE", "32")), 128)  # API limiti 128
+TRANSLATION_BATCH_MAX_WAIT_MS = int(os.getenv("TRANSLATION_BATCH_MAX_WAIT_MS", "10"))
+
+# Ses ön işleme (sessizlik kırpma) ayarları
+VAD_ENERGY_THRESHOLD_DB = float(os.getenv("VAD_ENERGY_THRESHOLD_DB", "-45"))  # dBFS
+VAD_PADDING_MS = int(os.getenv("VAD_PADDING_MS", "200"))
+VAD_MAX_SILENCE_MS = int(os.getenv("VAD_MAX_SILENCE_MS", "400"))
+
+# Ses yükleme limitleri
+MAX_AUDIO_UPLOAD_SIZE = int(os.getenv("MAX_AUDIO_UPLOAD_SIZE", "26214400"))  # 25MB (~13 dk LINEAR16 16 kHz)
+MAX_AUDIO_DURATION_SECONDS = float(os.getenv("MAX_AUDIO_DURATION_SECONDS", "600"))  # 10 dakika
+
+# Uzun ses parçalama (senkron recognize tek istekte en fazla 60 saniye kabul eder)
+STT_CHUNK_MAX_SECONDS = float(os.getenv("STT_CHUNK_MAX_SECONDS", "50"))
+STT_CHUNK_OVERLAP_MS = int(os.getenv("STT_CHUNK_OVERLAP_MS", "500"))
+STT_CHUNK_CONCURRENCY = int(os.getenv("STT_CHUNK_CONCURRENCY", "4"))
+
+# Cümle bazlı TTS ayarları
+TTS_MAX_CONCURRENCY = int(os.getenv("TTS_MAX_CONCURRENCY", "4"))
+TTS_MAX_SEGMENT_CHARS = int(os.getenv("TTS_MAX_SEGMENT_CHARS", "300"))
+
+# Sık kullanılan cümle seslerini süresi dolmadan yeniden sentezleyen ısıtıcı
+TTS_WARMER_ENABLED = os.getenv("TTS_WARMER_ENABLED", "true").lower() == "true"
+TTS_WARMER_TOP_N = int(os.getenv("TTS_WARMER_TOP_N", "100"))
+TTS_WARMER_CALLS_PER_MINUTE = int(os.getenv("TTS_WARMER_CALLS_PER_MINUTE", "30"))
+TTS_WARMER_INTERVAL_SECONDS = int(os.getenv("TTS_WARMER_INTERVAL_SECONDS", "60"))
+TTS_WARMER_REFRESH_BEFORE_SECONDS = int(os.getenv("TTS_WARMER_REFRESH_BEFORE_SECONDS", "3600"))  # 1 saat
+
+# Sağlayıcı başına uyarlanabilir eşzamanlılık (AIMD)
+PROVIDER_CONCURRENCY_INITIAL = int(os.getenv("PROVIDER_CONCURRENCY_INITIAL", "8"))
+PROVIDER_CONCURRENCY_MIN = int(os.getenv("PROVIDER_CONCURRENCY_MIN", "1"))
+PROVIDER_CONCURRENCY_MAX = int(os.getenv("PROVIDER_CONCURRENCY_MAX", "64"))
+PROVIDER_QUEUE_TIMEOUT_MS = int(os.getenv("PROVIDER_QUEUE_TIMEOUT_MS", "2000"))
+PROVIDER_LATENCY_TOLERANCE = float(os.getenv("PROVIDER_LATENCY_TOLERANCE", "2.0"))  # ortalamanın katı
+PROVIDER_CONCURRENCY_BACKOFF = float(os.getenv("PROVIDER_CONCURRENCY_BACKOFF", "0.9"))
+
+# Hedge istekleri (virgülle ayrılmış sağlayıcılar: stt, translate, tts)
+HEDGE_PROVIDERS = [p.strip() for p in os.getenv("HEDGE_PROVIDERS", "stt,tts").split(",") if p.strip()]
+HEDGE_PERCENTILE = float(os.getenv("HEDGE_PERCENTILE", "0.95"))
+HEDGE_MIN_SAMPLES = int(os.getenv("HEDGE_MIN_SAMPLES", "20"))
+HEDGE_MIN_DELAY_MS = int(os.getenv("HEDGE_MIN_DELAY_MS", "50"))
+HEDGE_MAX_RATIO = float(os.getenv("HEDGE_MAX_RATIO", "0.1"))  # çağrıların en fazla %10'u
+
+# Devre kesici
+CIRCUIT_FAILURE_RATE = float(os.getenv("CIRCUIT_FAILURE_RATE", "0.5"))
+CIRCUIT_MIN_CALLS = int(os.getenv("CIRCUIT_MIN_CALLS", "20"))
+CIRCUIT_WINDOW_SIZE = int(os.getenv("CIRCUIT_WINDOW_SIZE", "50"))
+CIRCUIT_OPEN_SECONDS = float(os.getenv("CIRCUIT_OPEN_SECONDS", "10"))
+
+# Sağlayıcı seçimi: google | simulated
+PROVIDER_BACKEND = os.getenv("PROVIDER_BACKEND", "google")
+
+# Simüle sağlayıcı ayarları (çevrimdışı yük testi için)
+SIMULATED_PROVIDER_SEED = int(os.getenv("SIMULATED_PROVIDER_SEED", "42"))
+SIMULATED_STT_LATENCY_MS = float(os.getenv("SIMULATED_STT_LATENCY_MS", "300"))  # medyan
+SIMULATED_TRANSLATE_LATENCY_MS = float(os.getenv("SIMULATED_TRANSLATE_LATENCY_MS", "80"))
+SIMULATED_TTS_LATENCY_MS = float(os.getenv("SIMULATED_TTS_LATENCY_MS", "200"))
+SIMULATED_LATENCY_SIGMA = float(os.getenv("SIMULATED_LATENCY_SIGMA", "0.4"))  # log-normal şekil parametresi
+SIMULATED_ERROR_RATE = float(os.getenv("SIMULATED_ERROR_RATE", "0"))
+SIMULATED_TTS_BYTES_PER_CHAR = int(os.getenv("SIMULATED_TTS_BYTES_PER_CHAR", "160"))
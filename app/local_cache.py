@@ -0,0 +1,106 @@
+from collections import OrderedDict
+from typing import Optional
+from app.monitoring import record_l1_cache_state, record_l1_cache_eviction
+from app.sketches import CountMinSketch
+import fnmatch
+import time
+
+
+class LocalCache:
+    """
+    Süreç içi L1 önbellek: giriş sayısı ve byte ile sınırlı, TTL'li LRU.
+    Yer açmak gerektiğinde TinyLFU kabul politikası uygulanır: yeni anahtar ancak
+    tahmini erişim sıklığı çıkarılacak LRU kurbanınınkinden yüksekse alınır.
+    Değerler serileştirilmiş byte olarak tutulur, böylece çağıranlar paylaşılan
+    nesneyi değiştiremez ve boyut doğrudan bilinir.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        max_bytes: int = 64 * 1024 * 1024,
+        record_state=record_l1_cache_state,
+        record_eviction=record_l1_cache_eviction
+    ):
+        self.max_entries = max(1, max_entries)
+        self.max_bytes = max(1, max_bytes)
+        self.bytes = 0
+        self._entries = OrderedDict()
+        # Metrikler; ayrı bir katman olarak kullanan bileşenler kendi kaydedicilerini verir
+        self._record_state = record_state
+        self._record_eviction = record_eviction
+        self.sketch = CountMinSketch(
+            width=self.max_entries * 4,
+            sample_size=self.max_entries * 10
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[bytes]:
+        self.sketch.increment(key)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        data, expires_at = entry
+        if expires_at <= time.monotonic():
+            self._remove(key, "expired")
+            return None
+        self._entries.move_to_end(key)
+        return data
+
+    def set(self, key: str, data: bytes, ttl: float) -> bool:
+        """Değeri ekle; kabul edilmezse ya da sığmazsa False döndür"""
+        if ttl <= 0 or len(data) > self.max_bytes:
+            return False
+
+        if key in self._entries:
+            self._remove(key, None)
+
+        now = time.monotonic()
+        candidate_frequency = self.sketch.estimate(key)
+        while self._entries and (
+            len(self._entries) >= self.max_entries or self.bytes + len(data) > self.max_bytes
+        ):
+            victim, (_, victim_expires_at) = next(iter(self._entries.items()))
+            if victim_expires_at <= now:
+                self._remove(victim, "expired")
+            elif candidate_frequency > self.sketch.estimate(victim):
+                self._remove(victim, "capacity")
+            else:
+                self._record_eviction("rejected")
+                self._report()
+                return False
+
+        self._entries[key] = (data, now + ttl)
+        self.bytes += len(data)
+        self._report()
+        return True
+
+    def delete(self, key: str) -> bool:
+        if key not in self._entries:
+            return False
+        self._remove(key, "invalidated")
+        self._report()
+        return True
+
+    def delete_pattern(self, pattern: str) -> int:
+        keys = [key for key in self._entries if fnmatch.fnmatchcase(key, pattern)]
+        for key in keys:
+            self._remove(key, "invalidated")
+        self._report()
+        return len(keys)
+
+    def clear(self):
+        self._entries.clear()
+        self.bytes = 0
+        self._report()
+
+    def _remove(self, key: str, reason: Optional[str]):
+        data, _ = self._entries.pop(key)
+        self.bytes -= len(data)
+        if reason:
+            self._record_eviction(reason)
+
+    def _report(self):
+        self._record_state(len(self._entries), self.bytes)
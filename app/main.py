@@ -3,6 +3,7 @@ from fastapi.security import OAuth2PasswordRequestForm
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import StreamingResponse
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
@@ -11,15 +12,22 @@ from app.database import get_db, engine
 from app.models import Base, User
 from app.schemas import UserCreate, User as UserSchema
 from app.auth import create_access_token, get_current_user
-from app.services.speech_to_text import transcribe_audio
-from app.services.translation import translate_text
-from app.services.text_to_speech import synthesize_speech
+from app.services.speech_to_text import transcribe_long_audio
+from app.services.translation_memory import translation_memory
+from app.services.text_to_speech import synthesize_speech_cached, synthesize_speech_stream
+from app.services.providers import get_provider
+from app.services.resilience import ProviderOverloadedError, get_limiter_stats
+from app.services.tts_warmer import tts_warmer
+from app.services.audio_processing import normalize_audio, trim_silence, AudioValidationError
 from app.config import SECRET_KEY, RATE_LIMIT_PER_MINUTE, RATE_LIMIT_PER_HOUR
 from jose import jwt
 from datetime import timedelta
 from passlib.context import CryptContext
-import redis
-from app.config import REDIS_URL
+from app.config import MAX_AUDIO_UPLOAD_SIZE, CACHE_MEMORY_SAMPLE_KEYS
+from app.monitoring import record_audio_rejected
+from app.redis_pool import init_redis_pool, close_redis_pool
+from app.cache import cache_manager, NAMESPACES as CACHE_NAMESPACES
+from app.utils import read_upload
 import asyncio
 import logging
 import structlog
@@ -63,7 +71,6 @@ app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-redis_client = redis.Redis.from_url(REDIS_URL)
 
 cdn = CDNManager()
 
@@ -111,8 +118,15 @@ def update_user(target_language: str = None, voice_preference: str = None, curre
 @app.on_event("startup")
 async def startup_event():
     """Uygulama başlangıcında çalışacak işlemler"""
-    # Redis bağlantısını başlat
+    # Paylaşılan async Redis bağlantı havuzunu başlat
     await init_redis_pool()
+    # Büyük TTS sesleri CDN'de, Redis'te yalnızca işaretçileri tutulur
+    cache_manager.set_blob_store(cdn)
+    await cache_manager.start_background_tasks()
+    
+    # Sağlayıcı istemcilerini önceden oluştur (TLS/kanal kurulumu ilk istekte olmasın)
+    await get_provider().warm_up()
+    tts_warmer.start()
     
     # CDN bağlantısını kontrol et
     try:
@@ -122,6 +136,14 @@ async def startup_event():
         logger.error("cdn_connection_error", error=str(e))
         raise
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Uygulama kapanırken bağlantıları kapat"""
+    await tts_warmer.stop()
+    await get_provider().close()
+    await cache_manager.stop_background_tasks()
+    await close_redis_pool()
+
 @app.get("/api/v1/audio/{user_id}/{file_name}")
 async def get_audio_file(
     user_id: int,
@@ -147,8 +169,48 @@ async def translate_audio(
 ):
     """Ses dosyasını çevir"""
     try:
-        # Ses dosyasını oku
-        audio_data = await audio_file.read()
+        # Ses dosyasını parça parça okurken özetini çıkar, limitten büyükse reddet
+        audio_data, audio_hash = await read_upload(audio_file, MAX_AUDIO_UPLOAD_SIZE)
+        if audio_data is None:
+            record_audio_rejected("too_large")
+            raise HTTPException(
+                status_code=413,
+                detail="Ses dosyası çok büyük"
+            )
+        
+        # Aynı klip daha önce işlendiyse sağlayıcılara gitmeden sonucu döndür
+        cached = await cache_manager.get_translation(
+            audio_hash, source_lang, target_lang, current_user.voice_preference
+        )
+        if cached is not None:
+            audio_url = cached["audio_url"]
+            if cached["user_id"] != current_user.id:
+                # Dosya her kullanıcının kendi yoluna yüklenir
+                audio_url = await cdn.upload_audio(audio_data, audio_file.filename, current_user.id)
+                if not audio_url:
+                    raise HTTPException(status_code=500, detail="Dosya yüklenemedi")
+            return {
+                "source_text": cached["source_text"],
+                "translated_text": cached["translated_text"],
+                "source_lang": cached["source_lang"],
+                "target_lang": target_lang,
+                "audio_url": audio_url
+            }
+        
+        # LINEAR16 mono 16 kHz'e dönüştür; bozuk dosyalar sağlayıcıya gitmez
+        try:
+            pcm_audio = await asyncio.to_thread(normalize_audio, audio_data)
+        except AudioValidationError as e:
+            record_audio_rejected("invalid")
+            raise HTTPException(status_code=400, detail=str(e))
+        
+        pcm_audio = trim_silence(pcm_audio)
+        if pcm_audio is None:
+            record_audio_rejected("silent")
+            raise HTTPException(
+                status_code=400,
+                detail="Seste konuşma algılanmadı"
+            )
         
         # CDN'e yükle
         cdn_url = await cdn.upload_audio(
@@ -163,22 +225,45 @@ async def translate_audio(
                 detail="Dosya yüklenemedi"
             )
         
-        # Çeviri işlemini gerçekleştir
-        result = await translation_service.translate_audio(
-            audio_data,
-            source_lang,
-            target_lang
+        # Dil algılama ve metne dönüştürme; uzun ses parçalara bölünüp paralel tanınır
+        detected_language, source_text = await transcribe_long_audio(
+            pcm_audio,
+            source_lang
         )
+        if not source_text:
+            raise HTTPException(
+                status_code=400,
+                detail="Ses metne dönüştürülemedi"
+            )
+        
+        # Hedef dile çevir
+        translated_text = await translation_memory.translate(source_text, target_lang, detected_language)
+        if translated_text:
+            await cache_manager.set_translation(audio_hash, source_lang, target_lang, {
+                "source_text": source_text,
+                "translated_text": translated_text,
+                "source_lang": detected_language,
+                "audio_url": cdn_url,
+                "user_id": current_user.id,
+            }, current_user.voice_preference)
         
         # Sonucu döndür
         return {
-            "source_text": result.source_text,
-            "translated_text": result.translated_text,
-            "source_lang": result.detected_language,
+            "source_text": source_text,
+            "translated_text": translated_text,
+            "source_lang": detected_language,
             "target_lang": target_lang,
             "audio_url": cdn_url
         }
         
+    except HTTPException:
+        raise
+    except ProviderOverloadedError:
+        raise HTTPException(
+            status_code=503,
+            detail="Servis yoğun, lütfen tekrar deneyin",
+            headers={"Retry-After": "1"}
+        )
     except Exception as e:
         logger.error(
             "translation_error",
@@ -190,42 +275,100 @@ async def translate_audio(
             detail="Çeviri işlemi başarısız"
         )
 
+async def stream_tts_audio(text: str, language_code: str, voice_gender: str, user_id: int):
+    """MP3 parçalarını üretilir üretilmez gönder"""
+    segments = 0
+    try:
+        async for segment in synthesize_speech_stream(text, language_code, voice_gender):
+            segments += 1
+            yield segment
+    except Exception as e:
+        logger.error("text_to_speech.stream_error", error=str(e), user_id=user_id)
+        return
+    
+    logger.info("text_to_speech.success", user_id=user_id, segments=segments)
+
 @app.post("/tts")
 @limiter.limit(f"{RATE_LIMIT_PER_HOUR}/hour")
-async def text_to_speech(text: str, current_user: UserSchema = Depends(get_current_user)):
+async def text_to_speech(
+    text: str,
+    stream: bool = False,
+    current_user: UserSchema = Depends(get_current_user)
+):
     try:
         logger.info("text_to_speech.start", user_id=current_user.id)
         language_code = "tr-TR" if current_user.target_language == "en" else "en-US"
         voice_gender = current_user.voice_preference
         
-        cache_key = f"tts:{text}:{language_code}:{voice_gender}"
-        cached_audio = redis_client.get(cache_key)
-        
-        if cached_audio:
-            logger.info("text_to_speech.cache_hit", user_id=current_user.id)
-            return {"audio_content": cached_audio}
+        if stream:
+            # Cümleler paralel sentezlenir, MP3 parçaları sırayla gönderilir
+            return StreamingResponse(
+                stream_tts_audio(text, language_code, voice_gender, current_user.id),
+                media_type="audio/mpeg"
+            )
         
-        audio_content = await asyncio.to_thread(synthesize_speech, text, language_code, voice_gender)
+        # Ses, cümle önbelleğindeki parçalar ve yeni sentezlenen eksiklerden birleştirilir
+        audio_content = await synthesize_speech_cached(text, language_code, voice_gender)
         if not audio_content:
             logger.error("text_to_speech.synthesis_failed", user_id=current_user.id)
             raise HTTPException(status_code=400, detail="Ses sentezlenemedi")
         
-        redis_client.set(cache_key, audio_content, ex=3600)
         logger.info("text_to_speech.success", user_id=current_user.id)
         return {"audio_content": audio_content}
         
+    except HTTPException:
+        raise
+    except ProviderOverloadedError:
+        raise HTTPException(
+            status_code=503,
+            detail="Servis yoğun, lütfen tekrar deneyin",
+            headers={"Retry-After": "1"}
+        )
     except Exception as e:
         logger.error("text_to_speech.error", error=str(e), user_id=current_user.id)
         raise HTTPException(status_code=500, detail="Sunucu hatası")
 
+@app.get("/admin/provider-stats")
+async def provider_stats(current_user: UserSchema = Depends(get_current_user)):
+    """Sağlayıcı ve istemci havuzu istatistiklerini döndür"""
+    if not current_user.is_admin:
+        raise HTTPException(status_code=403, detail="Bu işlem için yetkiniz yok")
+    return {
+        **get_provider().get_stats(),
+        "concurrency": get_limiter_stats(),
+    }
+
+@app.get("/admin/cache-stats")
+async def cache_stats(
+    sample_size: int = CACHE_MEMORY_SAMPLE_KEYS,
+    current_user: UserSchema = Depends(get_current_user)
+):
+    """Önbellek istatistikleri, ad alanı bellek tahminleri ve sıcak anahtarlar"""
+    if not current_user.is_admin:
+        raise HTTPException(status_code=403, detail="Bu işlem için yetkiniz yok")
+    return {
+        **await cache_manager.get_stats(),
+        "memory": await cache_manager.estimate_namespace_memory(max(1, min(sample_size, 10000))),
+        "hot_keys": cache_manager.get_hot_keys(),
+    }
+
 # Cache temizleme endpoint'i
 @app.post("/admin/clear-cache")
-async def clear_cache(current_user: UserSchema = Depends(get_current_user)):
+async def clear_cache(
+    cache_type: Optional[str] = None,
+    current_user: UserSchema = Depends(get_current_user)
+):
     if not current_user.is_admin:
         raise HTTPException(status_code=403, detail="Bu işlem için yetkiniz yok")
+    if cache_type is not None and cache_type not in CACHE_NAMESPACES:
+        raise HTTPException(status_code=400, detail="Bilinmeyen önbellek türü")
     try:
-        redis_client.flushall()
-        logger.info("cache.cleared", user_id=current_user.id)
+        # FLUSHALL yerine ad alanı nesilleri artırılır; eski anahtarlar arka planda silinir
+        if cache_type is None:
+            await cache_manager.invalidate_all()
+        else:
+            await cache_manager.invalidate_namespace(cache_type)
+        logger.info("cache.cleared", user_id=current_user.id, cache_type=cache_type)
         return {"message": "Önbellek temizlendi"}
     except Exception as e:
         logger.error("cache.clear_failed", error=str(e), user_id=current_user.id)
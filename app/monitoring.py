@@ -40,6 +40,141 @@ CACHE_MISSES = Counter(
     ['cache_type']
 )
 
+CACHE_TIER_LOOKUPS = Counter(
+    'cache_tier_lookups_total',
+    'Cache lookups per tier (l1 = in-process, l2 = Redis)',
+    ['cache_type', 'tier', 'result']
+)
+
+L1_CACHE_ENTRIES = Gauge(
+    'l1_cache_entries',
+    'Number of entries in the in-process cache'
+)
+
+L1_CACHE_BYTES = Gauge(
+    'l1_cache_bytes',
+    'Bytes held by the in-process cache'
+)
+
+L1_CACHE_EVICTIONS = Counter(
+    'l1_cache_evictions_total',
+    'In-process cache evictions and admission rejections',
+    ['reason']
+)
+
+CACHE_NAMESPACE_GENERATION = Gauge(
+    'cache_namespace_generation',
+    'Current generation number of each cache namespace',
+    ['cache_type']
+)
+
+CACHE_SWEEP_KEYS = Counter(
+    'cache_sweep_keys_total',
+    'Keys examined and deleted by the stale-generation sweeper',
+    ['cache_type', 'result']
+)
+
+REDIS_POOL_WAIT = Histogram(
+    'redis_pool_wait_seconds',
+    'Time spent waiting for a Redis connection from the shared pool',
+    buckets=[0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 2]
+)
+
+REDIS_POOL_IN_USE = Gauge(
+    'redis_pool_connections_in_use',
+    'Redis connections currently checked out of the shared pool'
+)
+
+REDIS_POOL_MAX = Gauge(
+    'redis_pool_max_connections',
+    'Maximum size of the shared Redis connection pool'
+)
+
+CACHE_SERIALIZED_BYTES = Histogram(
+    'cache_serialized_bytes',
+    'Size of serialized cache values',
+    ['cache_type', 'value_type', 'operation'],
+    buckets=[64, 256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304]
+)
+
+CACHE_SERIALIZATION_TIME = Histogram(
+    'cache_serialization_seconds',
+    'Time spent serializing and deserializing cache values',
+    ['cache_type', 'value_type', 'operation'],
+    buckets=[0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05]
+)
+
+TRANSLATION_MEMORY_LOOKUPS = Counter(
+    'translation_memory_lookups_total',
+    'Total number of translation memory lookups per tier',
+    ['tier', 'result']
+)
+
+TRANSLATION_MEMORY_ENTRIES = Gauge(
+    'translation_memory_local_entries',
+    'Number of entries in the in-process translation memory tier'
+)
+
+# Single-flight Metrics
+SINGLEFLIGHT_CALLS = Counter(
+    'singleflight_calls_total',
+    'Total number of single-flight calls by role',
+    ['name', 'role']
+)
+
+CACHE_HIT_TTL_REMAINING = Histogram(
+    'cache_hit_ttl_remaining_seconds',
+    'Remaining TTL of sampled Redis cache hits',
+    ['cache_type'],
+    buckets=[10, 60, 300, 900, 3600, 14400, 43200, 86400, 604800]
+)
+
+TTS_WARMER_CALLS = Counter(
+    'tts_warmer_calls_total',
+    'Phrases re-synthesized by the TTS cache warmer',
+    ['result']
+)
+
+TTS_WARMER_TRACKED = Gauge(
+    'tts_warmer_tracked_phrases',
+    'Number of top phrases tracked by the TTS cache warmer'
+)
+
+TTS_WARMER_HITS = Counter(
+    'tts_warmer_hits_total',
+    'Sentence cache hits served from values written by the warmer'
+)
+
+CACHE_BLOB_OPERATIONS = Counter(
+    'cache_blob_operations_total',
+    'Large cache values offloaded to and fetched from object storage',
+    ['cache_type', 'operation', 'result']
+)
+
+CACHE_BLOB_BYTES = Counter(
+    'cache_blob_bytes_total',
+    'Bytes of cache values moved to and from object storage',
+    ['cache_type', 'operation']
+)
+
+CACHE_STALE_SERVED = Counter(
+    'cache_stale_served_total',
+    'Total number of expired get_or_set values served while refreshing',
+    ['cache_type']
+)
+
+CACHE_REFRESHES = Counter(
+    'cache_refreshes_total',
+    'Total number of background get_or_set refreshes',
+    ['cache_type', 'reason', 'result']
+)
+
+SINGLEFLIGHT_LOCK_WAITS = Counter(
+    'singleflight_lock_waits_total',
+    'Total number of waits on another replica\'s cache fill lock',
+    ['result']
+)
+
 # WebSocket Metrics
 WS_CONNECTIONS_ACTIVE = Gauge(
     'ws_connections_active',
@@ -64,6 +199,136 @@ WS_PROCESSING_TIME = Histogram(
     ['operation']
 )
 
+# Provider Client Metrics
+PROVIDER_CLIENTS_CREATED = Counter(
+    'provider_clients_created_total',
+    'Total number of provider clients created',
+    ['provider']
+)
+
+PROVIDER_CLIENT_INIT_TIME = Histogram(
+    'provider_client_init_seconds',
+    'Time taken to create a provider client',
+    ['provider']
+)
+
+PROVIDER_CLIENT_USES = Counter(
+    'provider_client_uses_total',
+    'Total number of pooled provider client checkouts',
+    ['provider']
+)
+
+# Translation Batching Metrics
+TRANSLATION_BATCH_SIZE = Histogram(
+    'translation_batch_size',
+    'Number of texts sent in a single batched translate request',
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128)
+)
+
+TRANSLATION_BATCH_FILL_RATIO = Histogram(
+    'translation_batch_fill_ratio',
+    'Batch size divided by the configured maximum batch size',
+    buckets=(0.05, 0.1, 0.25, 0.5, 0.75, 1.0)
+)
+
+TRANSLATION_BATCH_FLUSHES = Counter(
+    'translation_batch_flushes_total',
+    'Total number of batch flushes',
+    ['reason']
+)
+
+# Audio Preprocessing Metrics
+AUDIO_BYTES_SAVED = Counter(
+    'audio_preprocess_bytes_saved_total',
+    'Total number of audio bytes removed before provider calls',
+    ['reason']
+)
+
+AUDIO_SILENT_CLIPS = Counter(
+    'audio_silent_clips_total',
+    'Total number of clips rejected as silence before provider calls'
+)
+
+AUDIO_NORMALIZED_TOTAL = Counter(
+    'audio_normalized_total',
+    'Total number of uploads normalized to LINEAR16 mono 16 kHz',
+    ['resampled']
+)
+
+AUDIO_REJECTED_TOTAL = Counter(
+    'audio_rejected_total',
+    'Total number of uploads rejected before provider calls',
+    ['reason']
+)
+
+STT_CHUNKS_PER_REQUEST = Histogram(
+    'stt_chunks_per_request',
+    'Number of recognition chunks a long upload was split into',
+    buckets=[2, 3, 4, 6, 8, 12, 16, 24]
+)
+
+# Provider Concurrency Metrics
+PROVIDER_CONCURRENCY_LIMIT = Gauge(
+    'provider_concurrency_limit',
+    'Current adaptive concurrency limit',
+    ['provider']
+)
+
+PROVIDER_IN_FLIGHT = Gauge(
+    'provider_in_flight_requests',
+    'Provider calls currently in flight',
+    ['provider']
+)
+
+PROVIDER_QUEUE_DEPTH = Gauge(
+    'provider_queue_depth',
+    'Callers waiting for a provider slot',
+    ['provider']
+)
+
+PROVIDER_QUEUE_WAIT = Histogram(
+    'provider_queue_wait_seconds',
+    'Time spent waiting for a provider slot',
+    ['provider'],
+    buckets=[0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2, 5]
+)
+
+PROVIDER_REJECTED = Counter(
+    'provider_rejected_total',
+    'Provider calls rejected after the queue wait limit',
+    ['provider']
+)
+
+PROVIDER_CALL_LATENCY = Histogram(
+    'provider_call_latency_seconds',
+    'Provider call latency',
+    ['provider', 'status']
+)
+
+PROVIDER_HEDGES_SENT = Counter(
+    'provider_hedges_sent_total',
+    'Hedged duplicate provider requests sent',
+    ['provider']
+)
+
+PROVIDER_HEDGES_WON = Counter(
+    'provider_hedges_won_total',
+    'Hedged requests that answered before the original',
+    ['provider']
+)
+
+PROVIDER_CIRCUIT_STATE = Gauge(
+    'provider_circuit_state',
+    'Circuit breaker state (0=closed, 1=half_open, 2=open)',
+    ['provider']
+)
+
+PROVIDER_CIRCUIT_REJECTED = Counter(
+    'provider_circuit_rejected_total',
+    'Provider calls rejected by an open circuit',
+    ['provider']
+)
+
 # Error Metrics
 ERROR_TOTAL = Counter(
     'error_total',
@@ -141,6 +406,93 @@ def record_cache_miss(cache_type: str):
     """Cache miss'i kaydet"""
     CACHE_MISSES.labels(cache_type=cache_type).inc()
 
+def record_cache_tier_lookup(cache_type: str, tier: str, hit: bool):
+    """L1/L2 katman sonucunu kaydet"""
+    CACHE_TIER_LOOKUPS.labels(
+        cache_type=cache_type,
+        tier=tier,
+        result="hit" if hit else "miss"
+    ).inc()
+
+def record_l1_cache_state(entries: int, size: int):
+    """L1 önbellek doluluğunu güncelle"""
+    L1_CACHE_ENTRIES.set(entries)
+    L1_CACHE_BYTES.set(size)
+
+def record_l1_cache_eviction(reason: str):
+    """L1 çıkarma ya da kabul reddini kaydet"""
+    L1_CACHE_EVICTIONS.labels(reason=reason).inc()
+
+def record_cache_generation(cache_type: str, generation: int):
+    """Ad alanının geçerli neslini güncelle"""
+    CACHE_NAMESPACE_GENERATION.labels(cache_type=cache_type).set(generation)
+
+def record_cache_sweep(cache_type: str, scanned: int, deleted: int):
+    """Süpürücünün incelediği ve sildiği anahtarları kaydet"""
+    CACHE_SWEEP_KEYS.labels(cache_type=cache_type, result="scanned").inc(scanned)
+    CACHE_SWEEP_KEYS.labels(cache_type=cache_type, result="deleted").inc(deleted)
+
+def record_redis_pool_wait(duration: float):
+    """Havuzdan bağlantı alma süresini kaydet"""
+    REDIS_POOL_WAIT.observe(duration)
+
+def record_redis_pool_usage(in_use: int, max_connections: int):
+    """Havuz kullanımını güncelle"""
+    REDIS_POOL_IN_USE.set(in_use)
+    REDIS_POOL_MAX.set(max_connections)
+
+def record_cache_serialization(cache_type: str, value_type: str, operation: str, size: int, duration: float):
+    """Önbellek türü başına değer serileştirme boyutu ve süresini kaydet"""
+    labels = {"cache_type": cache_type, "value_type": value_type, "operation": operation}
+    CACHE_SERIALIZED_BYTES.labels(**labels).observe(size)
+    CACHE_SERIALIZATION_TIME.labels(**labels).observe(duration)
+
+def record_translation_memory_lookup(tier: str, hit: bool):
+    """Çeviri belleği katman sonucunu kaydet"""
+    TRANSLATION_MEMORY_LOOKUPS.labels(tier=tier, result="hit" if hit else "miss").inc()
+
+def record_translation_memory_size(entries: int):
+    """Süreç içi çeviri belleği boyutunu kaydet"""
+    TRANSLATION_MEMORY_ENTRIES.set(entries)
+
+def record_singleflight_call(name: str, role: str):
+    """Single-flight çağrısını kaydet (leader: işi yapan, follower: sonucu paylaşan)"""
+    SINGLEFLIGHT_CALLS.labels(name=name, role=role).inc()
+
+def record_cache_hit_ttl(cache_type: str, ttl_seconds: float):
+    """Örneklenen isabetlerde kalan TTL'i kaydet"""
+    CACHE_HIT_TTL_REMAINING.labels(cache_type=cache_type).observe(ttl_seconds)
+
+def record_tts_warmer_call(result: str, count: int = 1):
+    """Isıtıcı sentezini kaydet (warmed/error/over_budget)"""
+    TTS_WARMER_CALLS.labels(result=result).inc(count)
+
+def record_tts_warmer_tracked(count: int):
+    """Isıtıcının izlediği cümle sayısını güncelle"""
+    TTS_WARMER_TRACKED.set(count)
+
+def record_tts_warmer_hit(count: int = 1):
+    """Isıtıcının yazdığı değerlerden gelen isabetleri kaydet"""
+    TTS_WARMER_HITS.inc(count)
+
+def record_cache_blob(cache_type: str, operation: str, result: str, size: int = 0):
+    """Nesne deposuna yükleme/indirme sonucunu kaydet"""
+    CACHE_BLOB_OPERATIONS.labels(cache_type=cache_type, operation=operation, result=result).inc()
+    if size:
+        CACHE_BLOB_BYTES.labels(cache_type=cache_type, operation=operation).inc(size)
+
+def record_cache_stale_served(cache_type: str):
+    """Süresi dolmuş değerin sunulmasını kaydet"""
+    CACHE_STALE_SERVED.labels(cache_type=cache_type).inc()
+
+def record_cache_refresh(cache_type: str, reason: str, result: str):
+    """Arka plan yenilemesini kaydet (reason: stale/early)"""
+    CACHE_REFRESHES.labels(cache_type=cache_type, reason=reason, result=result).inc()
+
+def record_singleflight_lock_wait(result: str):
+    """Dağıtık kilit beklemesinin sonucunu kaydet"""
+    SINGLEFLIGHT_LOCK_WAITS.labels(result=result).inc()
+
 # WebSocket Monitoring Functions
 def record_ws_connection():
     """WebSocket bağlantısını kaydet"""
@@ -162,6 +514,87 @@ def record_ws_processing_time(operation: str, duration: float):
     """WebSocket işlem süresini kaydet"""
     WS_PROCESSING_TIME.labels(operation=operation).observe(duration)
 
+# Provider Client Monitoring Functions
+def record_provider_client_created(provider: str, duration: float):
+    """Sağlayıcı istemcisi oluşturulmasını kaydet"""
+    PROVIDER_CLIENTS_CREATED.labels(provider=provider).inc()
+    PROVIDER_CLIENT_INIT_TIME.labels(provider=provider).observe(duration)
+
+def record_provider_client_use(provider: str):
+    """Havuzdan istemci kullanımını kaydet"""
+    PROVIDER_CLIENT_USES.labels(provider=provider).inc()
+
+# Translation Batching Monitoring Functions
+def record_translation_batch(size: int, max_size: int, reason: str):
+    """Toplu çeviri isteğini kaydet"""
+    TRANSLATION_BATCH_SIZE.observe(size)
+    TRANSLATION_BATCH_FILL_RATIO.observe(size / max_size)
+    TRANSLATION_BATCH_FLUSHES.labels(reason=reason).inc()
+
+# Audio Preprocessing Monitoring Functions
+def record_audio_trimmed(original_size: int, trimmed_size: int):
+    """Sessizlik kırpmasıyla kazanılan byte'ları kaydet"""
+    AUDIO_BYTES_SAVED.labels(reason="trim").inc(original_size - trimmed_size)
+
+def record_silent_audio(size: int):
+    """Sessiz olduğu için reddedilen klibi kaydet"""
+    AUDIO_SILENT_CLIPS.inc()
+    AUDIO_BYTES_SAVED.labels(reason="silent").inc(size)
+
+def record_audio_normalized(original_size: int, normalized_size: int, resampled: bool):
+    """Ses normalizasyonunu kaydet"""
+    AUDIO_NORMALIZED_TOTAL.labels(resampled=str(resampled).lower()).inc()
+    if normalized_size < original_size:
+        AUDIO_BYTES_SAVED.labels(reason="normalize").inc(original_size - normalized_size)
+
+def record_audio_rejected(reason: str):
+    """Sağlayıcıya gitmeden reddedilen sesi kaydet"""
+    AUDIO_REJECTED_TOTAL.labels(reason=reason).inc()
+
+def record_stt_chunked(chunks: int):
+    """Parçalara bölünerek tanınan uzun sesi kaydet"""
+    STT_CHUNKS_PER_REQUEST.observe(chunks)
+
+# Provider Concurrency Monitoring Functions
+def record_provider_limit(provider: str, limit: int, in_flight: int, queue_depth: int):
+    """Sağlayıcı limit, aktif çağrı ve kuyruk derinliğini güncelle"""
+    PROVIDER_CONCURRENCY_LIMIT.labels(provider=provider).set(limit)
+    PROVIDER_IN_FLIGHT.labels(provider=provider).set(in_flight)
+    PROVIDER_QUEUE_DEPTH.labels(provider=provider).set(queue_depth)
+
+def record_provider_queue_wait(provider: str, duration: float):
+    """Sağlayıcı kuyruğunda bekleme süresini kaydet"""
+    PROVIDER_QUEUE_WAIT.labels(provider=provider).observe(duration)
+
+def record_provider_rejected(provider: str):
+    """Kuyruk süresi aşıldığı için reddedilen çağrıyı kaydet"""
+    PROVIDER_REJECTED.labels(provider=provider).inc()
+
+def record_provider_call(provider: str, duration: float, success: bool):
+    """Sağlayıcı çağrı süresini kaydet"""
+    PROVIDER_CALL_LATENCY.labels(
+        provider=provider,
+        status="success" if success else "error"
+    ).observe(duration)
+
+CIRCUIT_STATE_VALUES = {"closed": 0, "half_open": 1, "open": 2}
+
+def record_hedge_sent(provider: str):
+    """Gönderilen hedge isteğini kaydet"""
+    PROVIDER_HEDGES_SENT.labels(provider=provider).inc()
+
+def record_hedge_won(provider: str):
+    """Asıl istekten önce yanıt veren hedge'i kaydet"""
+    PROVIDER_HEDGES_WON.labels(provider=provider).inc()
+
+def record_circuit_state(provider: str, state: str):
+    """Devre kesici durumunu güncelle"""
+    PROVIDER_CIRCUIT_STATE.labels(provider=provider).set(CIRCUIT_STATE_VALUES[state])
+
+def record_circuit_rejected(provider: str):
+    """Açık devre tarafından reddedilen çağrıyı kaydet"""
+    PROVIDER_CIRCUIT_REJECTED.labels(provider=provider).inc()
+
 # Resource Monitoring
 def update_resource_metrics():
     """Sistem kaynak kullanımını güncelle"""
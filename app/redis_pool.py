@@ -0,0 +1,69 @@
+from redis.asyncio import Redis, BlockingConnectionPool
+from typing import Optional
+from app.config import (
+    REDIS_URL,
+    REDIS_POOL_MAX_CONNECTIONS,
+    REDIS_POOL_TIMEOUT_SECONDS,
+    REDIS_SOCKET_TIMEOUT_SECONDS
+)
+from app.monitoring import record_redis_pool_wait, record_redis_pool_usage
+import time
+import structlog
+
+logger = structlog.get_logger()
+
+
+class InstrumentedConnectionPool(BlockingConnectionPool):
+    """Bağlantı bekleme süresini ve kullanımını raporlayan engelleyen havuz"""
+
+    async def get_connection(self, command_name, *keys, **options):
+        start_time = time.perf_counter()
+        try:
+            return await super().get_connection(command_name, *keys, **options)
+        finally:
+            record_redis_pool_wait(time.perf_counter() - start_time)
+            record_redis_pool_usage(len(self._in_use_connections), self.max_connections)
+
+    async def release(self, connection):
+        await super().release(connection)
+        record_redis_pool_usage(len(self._in_use_connections), self.max_connections)
+
+
+_client: Optional[Redis] = None
+
+
+def create_redis_client(redis_url: str = REDIS_URL) -> Redis:
+    pool = InstrumentedConnectionPool.from_url(
+        redis_url,
+        max_connections=REDIS_POOL_MAX_CONNECTIONS,
+        timeout=REDIS_POOL_TIMEOUT_SECONDS,
+        socket_timeout=REDIS_SOCKET_TIMEOUT_SECONDS,
+        socket_connect_timeout=REDIS_SOCKET_TIMEOUT_SECONDS
+    )
+    return Redis(connection_pool=pool)
+
+
+def get_redis() -> Redis:
+    """Uygulama genelinde paylaşılan async Redis istemcisini döndür"""
+    global _client
+    if _client is None:
+        # Bağlantılar ilk komutta, çağıran event loop'ta açılır
+        _client = create_redis_client()
+    return _client
+
+
+async def init_redis_pool():
+    """Paylaşılan bağlantı havuzunu oluştur ve Redis'e erişilebildiğini doğrula"""
+    try:
+        await get_redis().ping()
+        logger.info("redis_pool_ready", max_connections=REDIS_POOL_MAX_CONNECTIONS)
+    except Exception as e:
+        logger.error("redis_pool_error", error=str(e))
+
+
+async def close_redis_pool():
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        await _client.connection_pool.disconnect()
+        _client = None
@@ -0,0 +1,122 @@
+from typing import Any
+from app.config import CACHE_COMPRESSION_THRESHOLD
+from app.monitoring import record_cache_serialization
+import msgpack
+import pickle
+import time
+import zlib
+import structlog
+
+try:
+    import lz4.frame
+except ImportError:  # lz4 yoksa zlib ile sıkıştırılır
+    lz4 = None
+
+logger = structlog.get_logger()
+
+# Başlık: 1 byte tür etiketi + 1 byte sıkıştırma kodu
+TYPE_BYTES = b"B"
+TYPE_STR = b"S"
+TYPE_MSGPACK = b"M"
+TYPE_PICKLE = b"P"  # msgpack'in desteklemediği türler (datetime vb.)
+
+CODEC_NONE = b"0"
+CODEC_ZLIB = b"1"
+CODEC_LZ4 = b"2"
+
+TYPE_NAMES = {
+    TYPE_BYTES: "bytes",
+    TYPE_STR: "str",
+    TYPE_MSGPACK: "msgpack",
+    TYPE_PICKLE: "pickle",
+}
+
+ZLIB_LEVEL = 1
+
+
+class SerializationError(ValueError):
+    """Önbellek değeri bu formatta değil ya da bozuk"""
+
+
+def _compress(payload: bytes) -> tuple:
+    if lz4 is not None:
+        return CODEC_LZ4, lz4.frame.compress(payload)
+    return CODEC_ZLIB, zlib.compress(payload, ZLIB_LEVEL)
+
+
+def _decompress(codec: bytes, payload: bytes) -> bytes:
+    if codec == CODEC_NONE:
+        return payload
+    if codec == CODEC_ZLIB:
+        return zlib.decompress(payload)
+    if codec == CODEC_LZ4:
+        if lz4 is None:
+            raise SerializationError("lz4 ile sıkıştırılmış değer için lz4 kurulu değil")
+        return lz4.frame.decompress(payload)
+    raise SerializationError(f"Bilinmeyen sıkıştırma kodu: {codec!r}")
+
+
+def _encode(value: Any) -> tuple:
+    # bytes ve str kopyalanmadan/dönüştürülmeden saklanır
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return TYPE_BYTES, bytes(value)
+    if isinstance(value, str):
+        return TYPE_STR, value.encode("utf-8")
+    try:
+        # strict_types: tuple'lar liste olarak dönmesin, pickle ile aynen saklansın
+        return TYPE_MSGPACK, msgpack.packb(value, use_bin_type=True, strict_types=True)
+    except (TypeError, ValueError, OverflowError):
+        return TYPE_PICKLE, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _decode(value_type: bytes, payload: bytes) -> Any:
+    if value_type == TYPE_BYTES:
+        return payload
+    if value_type == TYPE_STR:
+        return payload.decode("utf-8")
+    if value_type == TYPE_MSGPACK:
+        # int vb. anahtarlı sözlükler de yazıldığı gibi okunabilmeli
+        return msgpack.unpackb(payload, raw=False, strict_map_key=False)
+    if value_type == TYPE_PICKLE:
+        return pickle.loads(payload)
+    raise SerializationError(f"Bilinmeyen tür etiketi: {value_type!r}")
+
+
+def dumps(
+    value: Any,
+    compression_threshold: int = CACHE_COMPRESSION_THRESHOLD,
+    cache_type: str = "default"
+) -> bytes:
+    """
+    Değeri tür etiketli byte dizisine çevir.
+    Eşikten büyük değerler sıkıştırılır; sıkıştırma yer kazandırmıyorsa ham saklanır.
+    """
+    start_time = time.perf_counter()
+    value_type, payload = _encode(value)
+
+    codec = CODEC_NONE
+    if len(payload) > compression_threshold:
+        compressed_codec, compressed = _compress(payload)
+        if len(compressed) < len(payload):
+            codec, payload = compressed_codec, compressed
+
+    data = value_type + codec + payload
+    record_cache_serialization(
+        cache_type, TYPE_NAMES[value_type], "dumps", len(data), time.perf_counter() - start_time
+    )
+    return data
+
+
+def loads(data: bytes, cache_type: str = "default") -> Any:
+    """dumps ile üretilmiş byte dizisini değere çevir"""
+    start_time = time.perf_counter()
+    value_type, codec = data[:1], data[1:2]
+    if value_type not in TYPE_NAMES:
+        # Eski (pickle) formattaki değerler ıskalama sayılır, TTL ile silinir
+        raise SerializationError("Önbellek değeri tanınmayan formatta")
+
+    value = _decode(value_type, _decompress(codec, data[2:]))
+    record_cache_serialization(
+        cache_type, TYPE_NAMES[value_type], "loads", len(data), time.perf_counter() - start_time
+    )
+    return value
@@ -0,0 +1,28 @@
+from app.monitoring import record_singleflight_call
+from typing import Any, Awaitable, Callable, Dict, Hashable
+import asyncio
+
+class SingleFlight:
+    """
+    Aynı anahtar için eşzamanlı çağrıları tek bir işte birleştirir.
+    İlk çağıran işi başlatır, sonrakiler aynı sonucu bekler. İş ayrı bir task'te
+    çalıştığından bekleyenlerden birinin iptal edilmesi diğerlerini etkilemez.
+    """
+    def __init__(self, name: str):
+        self.name = name
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+        
+    def in_flight(self, key: Hashable) -> bool:
+        return key in self._calls
+        
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._calls.get(key)
+        if task is not None:
+            record_singleflight_call(self.name, "follower")
+            return await asyncio.shield(task)
+            
+        record_singleflight_call(self.name, "leader")
+        task = asyncio.ensure_future(func())
+        self._calls[key] = task
+        task.add_done_callback(lambda _: self._calls.pop(key, None))
+        return await asyncio.shield(task)
\ No newline at end of file
@@ -0,0 +1,74 @@
+from typing import Hashable
+
+COUNTER_MAX = 15  # TinyLFU'daki 4 bitlik sayaçlar gibi
+
+
+class CountMinSketch:
+    """
+    Sabit bellekli yaklaşık frekans sayacı.
+    Tahmin gerçek sayıdan küçük olmaz; sample_size artıştan sonra tüm sayaçlar
+    yarıya indirilir, böylece eski popülerlik zamanla unutulur.
+    """
+
+    def __init__(self, width: int, depth: int = 4, sample_size: int = 0, counter_max: int = COUNTER_MAX):
+        self.width = max(64, width)
+        self.depth = max(1, depth)
+        self.sample_size = sample_size
+        self.counter_max = counter_max
+        self.rows = [[0] * self.width for _ in range(self.depth)]
+        self.additions = 0
+
+    def _indexes(self, item: Hashable):
+        # Tek hash'ten çift hash ile satır indeksleri; (row, item) tuple hash'leri
+        # satırlar arasında ilişkili çıkıp aynı öğeleri her satırda çakıştırabiliyor
+        value = hash(item) & 0xFFFFFFFFFFFFFFFF
+        h1 = value & 0xFFFFFFFF
+        h2 = (value >> 32) | 1
+        return [(h1 + row * h2) % self.width for row in range(self.depth)]
+
+    def increment(self, item: Hashable):
+        for row, index in zip(self.rows, self._indexes(item)):
+            if row[index] < self.counter_max:
+                row[index] += 1
+        self.additions += 1
+        if self.sample_size and self.additions >= self.sample_size:
+            self.reset()
+
+    def estimate(self, item: Hashable) -> int:
+        return min(row[index] for row, index in zip(self.rows, self._indexes(item)))
+
+    def reset(self):
+        """Tüm sayaçları yarıya indir"""
+        for row in self.rows:
+            row[:] = [count >> 1 for count in row]
+        self.additions //= 2
+
+
+class TopK:
+    """
+    Count-min sketch üzerinde en sık k öğeyi izler (heavy hitters).
+    Yalnızca k aday tutulur; aday olmayan bir öğe, tahmini en zayıf adayı geçtiğinde onun yerini alır.
+    """
+
+    def __init__(self, k: int, width: int = 1024, depth: int = 4, decay_every: int = 0):
+        self.k = max(1, k)
+        # Sıralama için 4 bitlik sayaç yetmez; yaşlanma yarıya indirme ile sağlanır
+        self.sketch = CountMinSketch(width, depth, sample_size=decay_every, counter_max=2 ** 32)
+        self.candidates = {}
+
+    def add(self, item: Hashable):
+        self.sketch.increment(item)
+        count = self.sketch.estimate(item)
+        if item in self.candidates or len(self.candidates) < self.k:
+            self.candidates[item] = count
+            return
+        weakest = min(self.candidates, key=self.candidates.get)
+        if count > self.candidates[weakest]:
+            del self.candidates[weakest]
+            self.candidates[item] = count
+
+    def items(self) -> list:
+        """(öğe, tahmini sayı) çiftlerini çoktan aza sıralı döndür"""
+        # Sayaçlar yarıya inmiş olabilir, güncel tahminler kullanılır
+        self.candidates = {item: self.sketch.estimate(item) for item in self.candidates}
+        return sorted(self.candidates.items(), key=lambda pair: pair[1], reverse=True)
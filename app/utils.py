@@ -0,0 +1,33 @@
+import hashlib
+import unicodedata
+
+# İçerik adresli önbellek anahtarları için ses özeti boyutu (byte)
+AUDIO_DIGEST_SIZE = 16
+UPLOAD_READ_CHUNK_SIZE = 64 * 1024
+
+def normalize_text(text: str) -> str:
+    """Metni önbellek anahtarı için normalize et (NFC, tek boşluk, kenar boşluksuz)"""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+def audio_digest(data: bytes) -> str:
+    """Ses verisinin BLAKE2b özetini döndür"""
+    return hashlib.blake2b(data, digest_size=AUDIO_DIGEST_SIZE).hexdigest()
+
+async def read_upload(upload_file, max_size: int, chunk_size: int = UPLOAD_READ_CHUNK_SIZE) -> tuple:
+    """
+    Yüklenen dosyayı parça parça okurken BLAKE2b özetini hesapla.
+    Dosya max_size'ı aşarsa okumayı bırakır ve (None, None) döndürür.
+    """
+    digest = hashlib.blake2b(digest_size=AUDIO_DIGEST_SIZE)
+    chunks = []
+    size = 0
+    while True:
+        chunk = await upload_file.read(chunk_size)
+        if not chunk:
+            break
+        size += len(chunk)
+        if size > max_size:
+            return None, None
+        digest.update(chunk)
+        chunks.append(chunk)
+    return b"".join(chunks), digest.hexdigest()
@@ -0,0 +1,278 @@
+from app.config import (
+    VAD_ENERGY_THRESHOLD_DB,
+    VAD_PADDING_MS,
+    VAD_MAX_SILENCE_MS,
+    MAX_AUDIO_UPLOAD_SIZE,
+    MAX_AUDIO_DURATION_SECONDS,
+    STT_CHUNK_MAX_SECONDS,
+    STT_CHUNK_OVERLAP_MS
+)
+from app.monitoring import record_audio_trimmed, record_silent_audio, record_audio_normalized
+from typing import List, Optional
+import numpy as np
+import struct
+import logging
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RATE = 16000
+FRAME_MS = 20
+INT16_FULL_SCALE = 32768.0
+
+WAVE_FORMAT_PCM = 0x0001
+WAVE_FORMAT_IEEE_FLOAT = 0x0003
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+RESAMPLE_FILTER_TAPS = 63
+
+# Düşük enerjili ama yüksek sıfır geçişli kareler (s, ş, f gibi sessiz sessizler)
+# konuşma sayılır
+ZCR_THRESHOLD = 0.25
+ZCR_ENERGY_MARGIN_DB = 10.0
+
+
+def frame_features(samples: np.ndarray, frame_len: int):
+    """Kare başına enerji (dBFS) ve sıfır geçiş oranını hesapla"""
+    n_frames = len(samples) // frame_len
+    frames = samples[:n_frames * frame_len].reshape(n_frames, frame_len).astype(np.float32)
+
+    energy = np.mean(frames * frames, axis=1) / (INT16_FULL_SCALE * INT16_FULL_SCALE)
+    energy_db = 10.0 * np.log10(energy + 1e-12)
+
+    signs = np.signbit(frames)
+    zcr = np.mean(signs[:, 1:] != signs[:, :-1], axis=1)
+    return energy_db, zcr
+
+
+def speech_mask(
+    energy_db: np.ndarray,
+    zcr: np.ndarray,
+    threshold_db: float,
+    padding_frames: int
+) -> np.ndarray:
+    """Konuşma içeren kareleri işaretle, kenarlara padding ekle"""
+    mask = (energy_db > threshold_db) | (
+        (energy_db > threshold_db - ZCR_ENERGY_MARGIN_DB) & (zcr > ZCR_THRESHOLD)
+    )
+    if padding_frames > 0 and mask.any():
+        kernel = np.ones(2 * padding_frames + 1, dtype=np.int32)
+        mask = np.convolve(mask.astype(np.int32), kernel, mode="same") > 0
+    return mask
+
+
+def trim_silence(
+    audio_content: bytes,
+    sample_rate: int = SAMPLE_RATE,
+    threshold_db: float = VAD_ENERGY_THRESHOLD_DB,
+    padding_ms: int = VAD_PADDING_MS,
+    max_silence_ms: int = VAD_MAX_SILENCE_MS
+) -> Optional[bytes]:
+    """
+    LINEAR16 mono sesin baş ve sonundaki sessizliği kırpar, aradaki uzun
+    sessizlikleri max_silence_ms'e indirger. Ses tamamen sessizse None döner.
+    """
+    samples = np.frombuffer(audio_content, dtype="<i2", count=len(audio_content) // 2)
+    frame_len = sample_rate * FRAME_MS // 1000
+    if len(samples) < frame_len:
+        record_silent_audio(len(audio_content))
+        return None
+
+    energy_db, zcr = frame_features(samples, frame_len)
+    mask = speech_mask(energy_db, zcr, threshold_db, padding_ms // FRAME_MS)
+    if not mask.any():
+        record_silent_audio(len(audio_content))
+        return None
+
+    # Sessizlik dizilerinde her karenin dizi içindeki sırasını bul
+    silent = ~mask
+    index = np.arange(len(mask))
+    run_starts = np.where(silent & ~np.r_[False, silent[:-1]], index, 0)
+    position_in_run = index - np.maximum.accumulate(run_starts)
+    keep = mask | (position_in_run < max_silence_ms // FRAME_MS)
+
+    # Baştaki ve sondaki sessizliği tamamen at
+    speech_frames = np.flatnonzero(mask)
+    keep[:speech_frames[0]] = False
+    keep[speech_frames[-1] + 1:] = False
+
+    n_frames = len(mask)
+    frames = samples[:n_frames * frame_len].reshape(n_frames, frame_len)
+    trimmed = frames[keep].tobytes()
+    if keep[-1]:
+        trimmed += samples[n_frames * frame_len:].tobytes()
+
+    record_audio_trimmed(len(audio_content), len(trimmed))
+    return trimmed
+
+
+def split_at_silence(
+    audio_content: bytes,
+    sample_rate: int = SAMPLE_RATE,
+    max_chunk_seconds: float = STT_CHUNK_MAX_SECONDS,
+    overlap_ms: int = STT_CHUNK_OVERLAP_MS
+) -> List[bytes]:
+    """
+    LINEAR16 mono sesi en fazla max_chunk_seconds uzunluğunda parçalara böler.
+    Kesim, parçanın ikinci yarısındaki en düşük enerjili karede yapılır; sonraki
+    parça overlap_ms geriden başlar, böylece sessizlik bulunamazsa kelime kaybolmaz.
+    """
+    samples = np.frombuffer(audio_content, dtype="<i2", count=len(audio_content) // 2)
+    frame_len = sample_rate * FRAME_MS // 1000
+    n_frames = len(samples) // frame_len
+    max_frames = max(2, int(max_chunk_seconds * 1000 / FRAME_MS))
+    if n_frames <= max_frames:
+        return [audio_content]
+
+    energy_db, _ = frame_features(samples, frame_len)
+    min_frames = max_frames // 2
+    overlap = min(overlap_ms // FRAME_MS, min_frames - 1)
+
+    chunks = []
+    start = 0
+    while n_frames - start > max_frames:
+        window = energy_db[start + min_frames:start + max_frames]
+        # Eşit enerjide en geç kareyi seç, parçalar mümkün olduğunca uzun kalsın
+        cut = start + min_frames + len(window) - 1 - int(np.argmin(window[::-1]))
+        chunks.append(samples[start * frame_len:cut * frame_len].tobytes())
+        start = cut - overlap
+    chunks.append(samples[start * frame_len:].tobytes())
+    return chunks
+
+
+class AudioValidationError(ValueError):
+    """Ses girdisi bozuk, desteklenmiyor veya limitleri aşıyor"""
+
+
+def is_wav(data: bytes) -> bool:
+    return data[:4] == b"RIFF" and data[8:12] == b"WAVE"
+
+
+def parse_wav_header(data: bytes) -> dict:
+    """
+    RIFF/WAVE başlığını kopyalamadan ayrıştırır.
+    Ses verisinin konumu ve formatını döndürür.
+    """
+    view = memoryview(data)
+    if len(view) < 12 or not is_wav(data):
+        raise AudioValidationError("Geçerli bir WAV dosyası değil")
+
+    fmt = None
+    offset = 12
+    while offset + 8 <= len(view):
+        chunk_id = bytes(view[offset:offset + 4])
+        (chunk_size,) = struct.unpack_from("<I", view, offset + 4)
+        body = offset + 8
+
+        if chunk_id == b"fmt ":
+            if chunk_size < 16 or body + 16 > len(view):
+                raise AudioValidationError("WAV fmt bloğu bozuk")
+            audio_format, channels, sample_rate, _, block_align, bits = struct.unpack_from(
+                "<HHIIHH", view, body
+            )
+            if channels < 1 or sample_rate < 1 or block_align < 1:
+                raise AudioValidationError("WAV başlığı geçersiz")
+            if audio_format == WAVE_FORMAT_EXTENSIBLE and chunk_size >= 40 and body + 26 <= len(view):
+                (audio_format,) = struct.unpack_from("<H", view, body + 24)
+            fmt = {
+                "format": audio_format,
+                "channels": channels,
+                "sample_rate": sample_rate,
+                "block_align": block_align,
+                "bits_per_sample": bits,
+            }
+
+        elif chunk_id == b"data":
+            if fmt is None:
+                raise AudioValidationError("WAV data bloğu fmt bloğundan önce geliyor")
+            # Akış halinde yazılmış dosyalarda boyut alanı geçersiz olabilir
+            data_size = min(chunk_size, len(view) - body)
+            return {**fmt, "data_offset": body, "data_size": data_size}
+
+        offset = body + chunk_size + (chunk_size & 1)
+
+    raise AudioValidationError("WAV data bloğu bulunamadı")
+
+
+def decode_pcm(data: bytes, header: dict) -> np.ndarray:
+    """Ham WAV örneklerini [-1, 1] aralığında float32 kanal matrisine çevir"""
+    channels = header["channels"]
+    bits = header["bits_per_sample"]
+    audio_format = header["format"]
+    sample_width = bits // 8
+    frame_width = sample_width * channels
+    size = header["data_size"] - header["data_size"] % frame_width if frame_width else 0
+    raw = memoryview(data)[header["data_offset"]:header["data_offset"] + size]
+
+    if audio_format == WAVE_FORMAT_PCM and bits == 16:
+        samples = np.frombuffer(raw, dtype="<i2").astype(np.float32) / INT16_FULL_SCALE
+    elif audio_format == WAVE_FORMAT_PCM and bits == 8:
+        samples = (np.frombuffer(raw, dtype=np.uint8).astype(np.float32) - 128.0) / 128.0
+    elif audio_format == WAVE_FORMAT_PCM and bits == 24:
+        triplets = np.frombuffer(raw, dtype=np.uint8).reshape(-1, 3).astype(np.int32)
+        values = triplets[:, 0] | (triplets[:, 1] << 8) | (triplets[:, 2] << 16)
+        values = np.where(values & 0x800000, values - 0x1000000, values)
+        samples = values.astype(np.float32) / 8388608.0
+    elif audio_format == WAVE_FORMAT_PCM and bits == 32:
+        samples = (np.frombuffer(raw, dtype="<i4") / 2147483648.0).astype(np.float32)
+    elif audio_format == WAVE_FORMAT_IEEE_FLOAT and bits == 32:
+        samples = np.frombuffer(raw, dtype="<f4")
+    else:
+        raise AudioValidationError(f"Desteklenmeyen WAV formatı: {audio_format}/{bits}-bit")
+
+    return samples.reshape(-1, channels)
+
+
+def resample(samples: np.ndarray, source_rate: int, target_rate: int = SAMPLE_RATE) -> np.ndarray:
+    """Mono sinyali hedef örnekleme hızına getir (alçak geçiren filtre + doğrusal interpolasyon)"""
+    if source_rate == target_rate or len(samples) == 0:
+        return samples
+
+    if source_rate > target_rate:
+        # Katlanmayı önlemek için pencereli sinc alçak geçiren filtre
+        cutoff = target_rate / source_rate / 2
+        n = np.arange(RESAMPLE_FILTER_TAPS) - (RESAMPLE_FILTER_TAPS - 1) / 2
+        kernel = 2 * cutoff * np.sinc(2 * cutoff * n) * np.hamming(RESAMPLE_FILTER_TAPS)
+        kernel /= kernel.sum()
+        samples = np.convolve(samples, kernel.astype(np.float32), mode="same")
+
+    target_length = int(len(samples) * target_rate / source_rate)
+    positions = np.arange(target_length) * (source_rate / target_rate)
+    return np.interp(positions, np.arange(len(samples)), samples).astype(np.float32)
+
+
+def normalize_audio(
+    data: bytes,
+    max_size: int = MAX_AUDIO_UPLOAD_SIZE,
+    max_duration: float = MAX_AUDIO_DURATION_SECONDS
+) -> bytes:
+    """
+    WAV girdisini LINEAR16, mono, 16 kHz'e dönüştürür.
+    Bozuk, desteklenmeyen veya limit aşan girdiler için AudioValidationError fırlatır.
+    """
+    if len(data) > max_size:
+        raise AudioValidationError("Ses dosyası çok büyük")
+
+    header = parse_wav_header(data)
+    duration = header["data_size"] / header["block_align"] / header["sample_rate"]
+    if duration > max_duration:
+        raise AudioValidationError("Ses dosyası çok uzun")
+
+    # Zaten hedef formattaysa çözmeden sadece data bloğunu al
+    if (
+        header["format"] == WAVE_FORMAT_PCM
+        and header["channels"] == 1
+        and header["bits_per_sample"] == 16
+        and header["sample_rate"] == SAMPLE_RATE
+    ):
+        start = header["data_offset"]
+        size = header["data_size"] & ~1
+        record_audio_normalized(len(data), size, resampled=False)
+        return bytes(memoryview(data)[start:start + size])
+
+    channels = decode_pcm(data, header)
+    mono = channels.mean(axis=1) if channels.shape[1] > 1 else channels[:, 0]
+    mono = resample(mono, header["sample_rate"])
+
+    pcm = np.clip(mono * INT16_FULL_SCALE, -INT16_FULL_SCALE, INT16_FULL_SCALE - 1).astype("<i2")
+    record_audio_normalized(len(data), pcm.nbytes, resampled=True)
+    return pcm.tobytes()
@@ -0,0 +1,81 @@
+from .resilience import call_provider
+from .translation import translate_texts
+from app.config import TRANSLATION_BATCH_MAX_SIZE, TRANSLATION_BATCH_MAX_WAIT_MS
+from app.monitoring import record_translation_batch
+from typing import Dict, List, Tuple
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class TranslationBatcher:
+    """
+    Eşzamanlı translate çağrılarını hedef dile göre toplar.
+    Bekleyen metinler max_wait_ms dolunca ya da max_batch_size'a ulaşınca
+    tek bir istekte gönderilir; her çağıran kendi sonucunu alır.
+    """
+
+    def __init__(self, max_batch_size: int = 32, max_wait_ms: int = 10):
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max_wait_ms / 1000
+        self._pending: Dict[str, List[Tuple[str, asyncio.Future]]] = {}
+        self._timers: Dict[str, asyncio.TimerHandle] = {}
+        self._tasks = set()
+
+    async def translate(self, text: str, target_language: str) -> str:
+        """Metni bir sonraki toplu isteğe ekle ve sonucunu bekle"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        batch = self._pending.setdefault(target_language, [])
+        batch.append((text, future))
+
+        if len(batch) >= self.max_batch_size:
+            self._flush(target_language, "full")
+        elif len(batch) == 1:
+            self._timers[target_language] = loop.call_later(
+                self.max_wait, self._flush, target_language, "timeout"
+            )
+
+        return await future
+
+    def _flush(self, target_language: str, reason: str):
+        timer = self._timers.pop(target_language, None)
+        if timer is not None:
+            timer.cancel()
+
+        batch = self._pending.pop(target_language, None)
+        if not batch:
+            return
+
+        record_translation_batch(len(batch), self.max_batch_size, reason)
+        task = asyncio.create_task(self._send(target_language, batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, target_language: str, batch: List[Tuple[str, asyncio.Future]]):
+        # Aynı toplu istekteki tekrar eden metinler bir kez gönderilir
+        unique_texts = list(dict.fromkeys(text for text, _ in batch))
+        try:
+            translations = await call_provider("translate", translate_texts, unique_texts, target_language)
+            if not isinstance(translations, list) or len(translations) != len(unique_texts):
+                raise ValueError(
+                    f"Sağlayıcı {len(unique_texts)} metin için beklenmeyen yanıt döndürdü: {translations!r:.100}"
+                )
+            results = dict(zip(unique_texts, translations))
+            for text, future in batch:
+                if not future.done():
+                    future.set_result(results[text])
+        except Exception as e:
+            # Hiçbir çağıran sonuçsuz beklemede kalmamalı
+            logger.error(f"Toplu çeviri hatası ({len(batch)} metin): {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+
+
+translation_batcher = TranslationBatcher(
+    max_batch_size=TRANSLATION_BATCH_MAX_SIZE,
+    max_wait_ms=TRANSLATION_BATCH_MAX_WAIT_MS
+)
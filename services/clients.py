@@ -0,0 +1,154 @@
+from google.cloud import speech_v1p1beta1 as speech
+from google.cloud import texttospeech
+from google.cloud import translate_v3 as translate
+from google.cloud.speech_v1p1beta1.services.speech.transports import SpeechGrpcAsyncIOTransport
+from google.cloud.texttospeech_v1.services.text_to_speech.transports import TextToSpeechGrpcAsyncIOTransport
+from google.cloud.translate_v3.services.translation_service.transports import TranslationServiceGrpcAsyncIOTransport
+from app.config import (
+    GRPC_KEEPALIVE_TIME_MS,
+    GRPC_KEEPALIVE_TIMEOUT_MS,
+    PROVIDER_CHANNEL_POOL_SIZE
+)
+from app.monitoring import record_provider_client_created, record_provider_client_use
+import asyncio
+import itertools
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Uzun ömürlü gRPC kanalları için keepalive ayarları
+CHANNEL_OPTIONS = [
+    ("grpc.keepalive_time_ms", GRPC_KEEPALIVE_TIME_MS),
+    ("grpc.keepalive_timeout_ms", GRPC_KEEPALIVE_TIMEOUT_MS),
+    ("grpc.keepalive_permit_without_calls", 1),
+    ("grpc.http2.max_pings_without_data", 0),
+    ("grpc.max_send_message_length", -1),
+    ("grpc.max_receive_message_length", -1),
+]
+
+# Isınma sırasında kanal bağlantısı için beklenecek en uzun süre
+CHANNEL_READY_TIMEOUT = 5
+
+
+def _create_speech_client():
+    channel = SpeechGrpcAsyncIOTransport.create_channel(options=CHANNEL_OPTIONS)
+    return speech.SpeechAsyncClient(transport=SpeechGrpcAsyncIOTransport(channel=channel)), channel
+
+
+def _create_tts_client():
+    channel = TextToSpeechGrpcAsyncIOTransport.create_channel(options=CHANNEL_OPTIONS)
+    return texttospeech.TextToSpeechAsyncClient(transport=TextToSpeechGrpcAsyncIOTransport(channel=channel)), channel
+
+
+def _create_translate_client():
+    channel = TranslationServiceGrpcAsyncIOTransport.create_channel(options=CHANNEL_OPTIONS)
+    return translate.TranslationServiceAsyncClient(
+        transport=TranslationServiceGrpcAsyncIOTransport(channel=channel)
+    ), channel
+
+
+class ProviderClientRegistry:
+    """
+    Worker başına bir kez oluşturulan, paylaşılan asyncio gRPC istemcileri.
+    Kanallar event loop'a bağlı olduğundan istemciler ilk kullanımda loop içinde oluşturulur.
+    """
+
+    def __init__(self, pool_size: int = 1):
+        self.pool_size = max(1, pool_size)
+        self._factories = {
+            "speech": _create_speech_client,
+            "translate": _create_translate_client,
+            "tts": _create_tts_client,
+        }
+        self._pools = {}
+        self._channels = {}
+        self._cycles = {}
+        self._stats = {}
+
+    def _create_pool(self, provider: str) -> list:
+        pool = []
+        channels = []
+        for _ in range(self.pool_size):
+            start_time = time.time()
+            client, channel = self._factories[provider]()
+            init_seconds = time.time() - start_time
+            pool.append(client)
+            channels.append(channel)
+            record_provider_client_created(provider, init_seconds)
+            logger.info(f"{provider} istemcisi oluşturuldu ({init_seconds:.3f}s)")
+
+        self._channels[provider] = channels
+        self._stats[provider] = {
+            "pool_size": self.pool_size,
+            "created_at": time.time(),
+            "uses": 0,
+        }
+        return pool
+
+    def get(self, provider: str):
+        """Sağlayıcı istemcisini döndür, yoksa oluştur"""
+        # Tek event loop thread'inde çağrıldığından kilit gerekmez
+        if provider not in self._pools:
+            pool = self._create_pool(provider)
+            self._cycles[provider] = itertools.cycle(pool)
+            self._pools[provider] = pool
+
+        self._stats[provider]["uses"] += 1
+        record_provider_client_use(provider)
+        return next(self._cycles[provider])
+
+    async def warm_up(self):
+        """Tüm istemcileri oluştur ve kanalların bağlanmasını bekle"""
+        for provider in self._factories:
+            try:
+                self.get(provider)
+                await asyncio.wait_for(
+                    asyncio.gather(*[channel.channel_ready() for channel in self._channels[provider]]),
+                    CHANNEL_READY_TIMEOUT
+                )
+            except Exception as e:
+                logger.error(f"{provider} istemcisi başlatılamadı: {e!r}")
+
+    async def close(self):
+        """Tüm kanalları kapat; sonraki get çağrısı istemcileri yeniden oluşturur"""
+        channels = [channel for provider_channels in self._channels.values() for channel in provider_channels]
+        self._pools.clear()
+        self._cycles.clear()
+        self._channels.clear()
+        self._stats.clear()
+        for channel in channels:
+            try:
+                await channel.close()
+            except Exception as e:
+                logger.error(f"Kanal kapatılamadı: {e!r}")
+
+    def get_stats(self) -> dict:
+        """Havuz ve kanal istatistiklerini döndür"""
+        return {
+            provider: {
+                "pool_size": stats["pool_size"],
+                "uptime_seconds": round(time.time() - stats["created_at"], 1),
+                "uses": stats["uses"],
+                "channel_states": {
+                    index: channel.get_state(try_to_connect=False).name
+                    for index, channel in enumerate(self._channels[provider])
+                },
+            }
+            for provider, stats in self._stats.items()
+        }
+
+
+registry = ProviderClientRegistry(pool_size=PROVIDER_CHANNEL_POOL_SIZE)
+
+
+def get_speech_client() -> speech.SpeechAsyncClient:
+    return registry.get("speech")
+
+
+def get_translate_client() -> translate.TranslationServiceAsyncClient:
+    return registry.get("translate")
+
+
+def get_tts_client() -> texttospeech.TextToSpeechAsyncClient:
+    return registry.get("tts")
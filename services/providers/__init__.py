@@ -0,0 +1,33 @@
+from .base import ProviderBackend, SUPPORTED_LANGUAGES, normalize_language_code
+from app.config import PROVIDER_BACKEND
+import threading
+
+__all__ = [
+    "ProviderBackend",
+    "SUPPORTED_LANGUAGES",
+    "normalize_language_code",
+    "create_provider",
+    "get_provider",
+]
+
+_provider = None
+_lock = threading.Lock()
+
+def create_provider(backend: str) -> ProviderBackend:
+    """Yapılandırmadaki isme göre sağlayıcı oluştur"""
+    if backend == "google":
+        from .google import GoogleProvider
+        return GoogleProvider()
+    if backend == "simulated":
+        from .simulated import SimulatedProvider
+        return SimulatedProvider()
+    raise ValueError(f"Bilinmeyen sağlayıcı: {backend}")
+
+def get_provider() -> ProviderBackend:
+    """Worker genelinde paylaşılan sağlayıcıyı döndür"""
+    global _provider
+    if _provider is None:
+        with _lock:
+            if _provider is None:
+                _provider = create_provider(PROVIDER_BACKEND)
+    return _provider
@@ -0,0 +1,56 @@
+from abc import ABC, abstractmethod
+from typing import AsyncIterable, AsyncIterator, List, Optional, Tuple
+
+# Otomatik algılamada denenecek diller, ilki birincil dil
+SUPPORTED_LANGUAGES = ["tr-TR", "en-US"]
+
+def normalize_language_code(language_code: str) -> str:
+    return "tr-TR" if language_code.lower().startswith("tr") else "en-US"
+
+
+class ProviderBackend(ABC):
+    """
+    Konuşma tanıma, dil algılama, çeviri ve seslendirme sağlayıcı arayüzü.
+    Servis modülleri sağlayıcıyı doğrudan değil bu arayüz üzerinden çağırır.
+    Tüm çağrılar asenkrondur; event loop'u engellemez ve thread kullanmaz.
+    """
+    name = "base"
+
+    @abstractmethod
+    async def transcribe(self, audio_content: bytes, language_code: str) -> Optional[str]:
+        """LINEAR16 16 kHz sesi verilen dilde metne dönüştür"""
+
+    @abstractmethod
+    async def detect_and_transcribe(
+        self,
+        audio_content: bytes,
+        language_codes: List[str]
+    ) -> Tuple[str, Optional[str]]:
+        """Aday diller arasından dili algıla ve metne dönüştür"""
+
+    @abstractmethod
+    def streaming_transcribe(
+        self,
+        audio_chunks: AsyncIterable[bytes],
+        language_code: str,
+        interim_results: bool = True
+    ) -> AsyncIterator[Tuple[str, bool]]:
+        """Akışlı tanıma; (transcript, is_final) ikilileri üretir"""
+
+    @abstractmethod
+    async def translate(self, texts: List[str], target_language: str) -> List[str]:
+        """Metinleri hedef dile çevir; sonuçlar girdi sırasıyla döner"""
+
+    @abstractmethod
+    async def synthesize(self, text: str, language_code: str, voice_gender: str) -> bytes:
+        """Metni MP3 sese dönüştür"""
+
+    async def warm_up(self):
+        """Bağlantıları önceden kur"""
+
+    async def close(self):
+        """Bağlantıları kapat"""
+
+    def get_stats(self) -> dict:
+        """Sağlayıcıya özel istatistikleri döndür"""
+        return {"backend": self.name}
@@ -0,0 +1,105 @@
+from google.cloud import speech_v1p1beta1 as speech
+from google.cloud import texttospeech
+from ..clients import get_speech_client, get_translate_client, get_tts_client, registry
+from .base import ProviderBackend, normalize_language_code
+from app.config import GOOGLE_CLOUD_PROJECT, GOOGLE_CLOUD_REGION
+from typing import AsyncIterable, List
+
+
+class GoogleProvider(ProviderBackend):
+    """Google Cloud Speech-to-Text, Translation ve Text-to-Speech sağlayıcısı (asyncio gRPC)"""
+    name = "google"
+
+    def __init__(self, project: str = GOOGLE_CLOUD_PROJECT, region: str = GOOGLE_CLOUD_REGION):
+        self.translate_parent = f"projects/{project}/locations/{region}"
+
+    def _recognition_config(self, language_code: str, alternative_language_codes: List[str] = ()):
+        return speech.RecognitionConfig(
+            encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
+            sample_rate_hertz=16000,
+            language_code=language_code,
+            alternative_language_codes=list(alternative_language_codes),
+        )
+
+    async def transcribe(self, audio_content: bytes, language_code: str):
+        client = get_speech_client()
+        audio = speech.RecognitionAudio(content=audio_content)
+        response = await client.recognize(config=self._recognition_config(language_code), audio=audio)
+        if response.results:
+            return response.results[0].alternatives[0].transcript
+        return None
+
+    async def detect_and_transcribe(self, audio_content: bytes, language_codes: List[str]):
+        client = get_speech_client()
+        audio = speech.RecognitionAudio(content=audio_content)
+        config = self._recognition_config(language_codes[0], language_codes[1:])
+        response = await client.recognize(config=config, audio=audio)
+
+        transcripts = [
+            result.alternatives[0].transcript
+            for result in response.results
+            if result.alternatives
+        ]
+        if not transcripts:
+            return normalize_language_code(language_codes[0]), None
+
+        detected = response.results[0].language_code or language_codes[0]
+        return normalize_language_code(detected), " ".join(transcripts).strip()
+
+    async def streaming_transcribe(
+        self,
+        audio_chunks: AsyncIterable[bytes],
+        language_code: str,
+        interim_results: bool = True
+    ):
+        client = get_speech_client()
+        config = speech.StreamingRecognitionConfig(
+            config=self._recognition_config(language_code),
+            interim_results=interim_results,
+        )
+
+        async def requests():
+            # Async istemcide ilk istek yalnızca yapılandırmayı taşır
+            yield speech.StreamingRecognizeRequest(streaming_config=config)
+            async for chunk in audio_chunks:
+                yield speech.StreamingRecognizeRequest(audio_content=chunk)
+
+        responses = await client.streaming_recognize(requests=requests())
+        async for response in responses:
+            for result in response.results:
+                if result.alternatives:
+                    yield result.alternatives[0].transcript, result.is_final
+
+    async def translate(self, texts: List[str], target_language: str) -> List[str]:
+        client = get_translate_client()
+        response = await client.translate_text(
+            parent=self.translate_parent,
+            contents=texts,
+            target_language_code=target_language,
+            mime_type="text/plain",
+        )
+        return [translation.translated_text for translation in response.translations]
+
+    async def synthesize(self, text: str, language_code: str, voice_gender: str) -> bytes:
+        client = get_tts_client()
+        input_text = texttospeech.SynthesisInput(text=text)
+        voice = texttospeech.VoiceSelectionParams(
+            language_code=language_code,
+            ssml_gender=texttospeech.SsmlVoiceGender.MALE if voice_gender == "male" else texttospeech.SsmlVoiceGender.FEMALE,
+        )
+        audio_config = texttospeech.AudioConfig(
+            audio_encoding=texttospeech.AudioEncoding.MP3
+        )
+        response = await client.synthesize_speech(
+            input=input_text, voice=voice, audio_config=audio_config
+        )
+        return response.audio_content
+
+    async def warm_up(self):
+        await registry.warm_up()
+
+    async def close(self):
+        await registry.close()
+
+    def get_stats(self) -> dict:
+        return {"backend": self.name, "clients": registry.get_stats()}
@@ -0,0 +1,137 @@
+from .base import ProviderBackend, normalize_language_code
+from app.config import (
+    SIMULATED_PROVIDER_SEED,
+    SIMULATED_STT_LATENCY_MS,
+    SIMULATED_TRANSLATE_LATENCY_MS,
+    SIMULATED_TTS_LATENCY_MS,
+    SIMULATED_LATENCY_SIGMA,
+    SIMULATED_ERROR_RATE,
+    SIMULATED_TTS_BYTES_PER_CHAR
+)
+from typing import AsyncIterable, List
+import asyncio
+import hashlib
+import random
+
+# Her MP3 parçasının başına eklenen MPEG-1 Layer III çerçeve başlığı
+MP3_FRAME_HEADER = b"\xff\xfb\x90\x64"
+
+WORDS = [
+    "merhaba", "nasılsın", "bugün", "hava", "çok", "güzel", "toplantı",
+    "yarın", "saat", "üçte", "teşekkürler", "görüşürüz", "lütfen", "tamam",
+]
+
+# Deneme sayısı tutulan en fazla girdi; aşılınca sayaçlar sıfırlanır
+MAX_TRACKED_INPUTS = 100000
+
+
+class SimulatedProviderError(RuntimeError):
+    """Simülatörün yapılandırılmış hata oranıyla ürettiği hata"""
+
+
+class SimulatedProvider(ProviderBackend):
+    """
+    Canlı API'ler olmadan yük testi ve profil çıkarmak için deterministik sağlayıcı.
+    Çıktılar girdinin özetinden türetilir. Gecikme (log-normal) ve hatalar her çağrı
+    için tohum, işlem, girdi özeti ve o girdinin kaçıncı denemesi olduğundan türetilen
+    ayrı bir üreteçten gelir; böylece eşzamanlı çağrıların sırasından bağımsız olarak
+    aynı istek aynı gecikme ve hata dizisini görür.
+    """
+    name = "simulated"
+
+    def __init__(
+        self,
+        seed: int = SIMULATED_PROVIDER_SEED,
+        latency_ms: dict = None,
+        latency_sigma: float = SIMULATED_LATENCY_SIGMA,
+        error_rate: float = SIMULATED_ERROR_RATE,
+        tts_bytes_per_char: int = SIMULATED_TTS_BYTES_PER_CHAR
+    ):
+        self.latency_ms = latency_ms or {
+            "stt": SIMULATED_STT_LATENCY_MS,
+            "translate": SIMULATED_TRANSLATE_LATENCY_MS,
+            "tts": SIMULATED_TTS_LATENCY_MS,
+        }
+        self.latency_sigma = latency_sigma
+        self.error_rate = error_rate
+        self.tts_bytes_per_char = tts_bytes_per_char
+        self.seed = seed
+        self._attempts = {}
+        self._calls = {operation: 0 for operation in self.latency_ms}
+        self._errors = {operation: 0 for operation in self.latency_ms}
+
+    def _call_random(self, operation: str, request: bytes) -> random.Random:
+        """Çağrıya özgü, girdiden ve deneme sayısından türetilen üreteç"""
+        request_digest = self._digest(request)
+        if len(self._attempts) >= MAX_TRACKED_INPUTS:
+            self._attempts.clear()
+        attempt = self._attempts.get((operation, request_digest), 0)
+        self._attempts[(operation, request_digest)] = attempt + 1
+        seed = self._digest(f"{self.seed}:{operation}:{attempt}:".encode() + request_digest)
+        return random.Random(int.from_bytes(seed[:8], "big"))
+
+    async def _simulate_call(self, operation: str, request: bytes, scale: float = 1.0):
+        """Log-normal gecikme uygula, yapılandırılmış oranda hata fırlat"""
+        self._calls[operation] += 1
+        rng = self._call_random(operation, request)
+        delay = rng.lognormvariate(0, self.latency_sigma) * self.latency_ms[operation] * scale
+        failed = rng.random() < self.error_rate
+        if failed:
+            self._errors[operation] += 1
+        await asyncio.sleep(delay / 1000)
+        if failed:
+            raise SimulatedProviderError(f"Simüle edilmiş {operation} hatası")
+
+    @staticmethod
+    def _digest(data: bytes) -> bytes:
+        return hashlib.blake2b(data, digest_size=32).digest()
+
+    def _transcript_for(self, audio_content: bytes) -> str:
+        digest = self._digest(audio_content)
+        # Yaklaşık saniyede iki kelime
+        word_count = max(1, min(len(digest), len(audio_content) // 16000))
+        return " ".join(WORDS[byte % len(WORDS)] for byte in digest[:word_count])
+
+    async def transcribe(self, audio_content: bytes, language_code: str):
+        await self._simulate_call("stt", audio_content, 1 + len(audio_content) / 320000)
+        return self._transcript_for(audio_content)
+
+    async def detect_and_transcribe(self, audio_content: bytes, language_codes: List[str]):
+        await self._simulate_call("stt", audio_content, 1 + len(audio_content) / 320000)
+        language = language_codes[self._digest(audio_content)[0] % len(language_codes)]
+        return normalize_language_code(language), self._transcript_for(audio_content)
+
+    async def streaming_transcribe(
+        self,
+        audio_chunks: AsyncIterable[bytes],
+        language_code: str,
+        interim_results: bool = True
+    ):
+        received = bytearray()
+        async for chunk in audio_chunks:
+            received.extend(chunk)
+            await self._simulate_call("stt", bytes(received), 0.1)
+            if interim_results:
+                yield self._transcript_for(bytes(received)), False
+        if received:
+            yield self._transcript_for(bytes(received)), True
+
+    async def translate(self, texts: List[str], target_language: str) -> List[str]:
+        request = "\x1f".join([target_language, *texts]).encode()
+        await self._simulate_call("translate", request, 1 + len(texts) / 32)
+        return [f"[{target_language}] {text}" for text in texts]
+
+    async def synthesize(self, text: str, language_code: str, voice_gender: str) -> bytes:
+        request = f"{text}:{language_code}:{voice_gender}".encode()
+        await self._simulate_call("tts", request, 1 + len(text) / 200)
+        size = max(len(MP3_FRAME_HEADER), len(text) * self.tts_bytes_per_char)
+        digest = self._digest(request)
+        payload = digest * (size // len(digest) + 1)
+        return MP3_FRAME_HEADER + payload[:size - len(MP3_FRAME_HEADER)]
+
+    def get_stats(self) -> dict:
+        return {
+            "backend": self.name,
+            "calls": dict(self._calls),
+            "errors": dict(self._errors),
+        }
@@ -0,0 +1,402 @@
+from app.config import (
+    PROVIDER_CONCURRENCY_INITIAL,
+    PROVIDER_CONCURRENCY_MIN,
+    PROVIDER_CONCURRENCY_MAX,
+    PROVIDER_QUEUE_TIMEOUT_MS,
+    PROVIDER_LATENCY_TOLERANCE,
+    PROVIDER_CONCURRENCY_BACKOFF,
+    HEDGE_PROVIDERS,
+    HEDGE_PERCENTILE,
+    HEDGE_MIN_SAMPLES,
+    HEDGE_MIN_DELAY_MS,
+    HEDGE_MAX_RATIO,
+    CIRCUIT_FAILURE_RATE,
+    CIRCUIT_MIN_CALLS,
+    CIRCUIT_WINDOW_SIZE,
+    CIRCUIT_OPEN_SECONDS
+)
+from app.monitoring import (
+    record_provider_limit,
+    record_provider_queue_wait,
+    record_provider_rejected,
+    record_provider_call,
+    record_hedge_sent,
+    record_hedge_won,
+    record_circuit_state,
+    record_circuit_rejected
+)
+from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+import asyncio
+import functools
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Uzun vadeli gecikme ortalamasının güncellenme katsayısı
+BASELINE_ALPHA = 0.05
+
+# Hedge eşiğinin hesaplandığı son başarılı çağrı sayısı
+LATENCY_WINDOW_SIZE = 200
+
+# Biriktirilebilecek en fazla hedge hakkı
+HEDGE_BURST = 10
+
+
+class ProviderOverloadedError(Exception):
+    """Sağlayıcı kuyruğunda izin verilen süreden fazla beklendi"""
+
+
+class CircuitOpenError(ProviderOverloadedError):
+    """Sağlayıcının devresi açık; çağrı yapılmadan reddedildi"""
+
+
+class AdaptiveLimiter:
+    """
+    Sağlayıcı başına AIMD eşzamanlılık sınırlayıcısı.
+    Her başarılı ve hızlı çağrıda limit 1/limit kadar artar; gecikme uzun vadeli
+    ortalamanın latency_tolerance katını aşarsa ya da çağrı hata verirse limit
+    backoff ile çarpılır. Limit doluyken çağıranlar en fazla queue_timeout_ms bekler.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        initial_limit: int = 8,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        queue_timeout_ms: int = 2000,
+        latency_tolerance: float = 2.0,
+        backoff: float = 0.9
+    ):
+        self.name = name
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.limit = float(min(max(initial_limit, self.min_limit), self.max_limit))
+        self.queue_timeout = queue_timeout_ms / 1000
+        self.latency_tolerance = latency_tolerance
+        self.backoff = backoff
+        self.in_flight = 0
+        self.baseline = None
+        self.latencies = deque(maxlen=LATENCY_WINDOW_SIZE)
+        self._waiters = deque()
+        self._last_decrease = 0.0
+        self._executor = None
+        self._report()
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._waiters)
+
+    def _report(self):
+        record_provider_limit(self.name, int(self.limit), self.in_flight, self.queue_depth)
+
+    async def acquire(self):
+        """Boş yer açılana kadar bekle; süre aşılırsa ProviderOverloadedError fırlat"""
+        if self.in_flight < int(self.limit) and not self._waiters:
+            self.in_flight += 1
+            self._report()
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        self._report()
+        start_time = time.monotonic()
+        try:
+            await asyncio.wait_for(asyncio.shield(future), self.queue_timeout)
+        except asyncio.TimeoutError:
+            if future.done() and not future.cancelled():
+                # Zaman aşımıyla aynı anda yer açıldıysa yeri geri ver
+                self._release_slot()
+            else:
+                future.cancel()
+            record_provider_rejected(self.name)
+            raise ProviderOverloadedError(f"{self.name} sağlayıcısı yoğun")
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self._release_slot()
+            else:
+                future.cancel()
+            raise
+        finally:
+            if future in self._waiters:
+                self._waiters.remove(future)
+            record_provider_queue_wait(self.name, time.monotonic() - start_time)
+            self._report()
+
+    def release(self, latency: float, success: bool):
+        """Çağrı sonucuna göre limiti güncelle ve sıradakini uyandır"""
+        overloaded = not success or (
+            self.baseline is not None and latency > self.baseline * self.latency_tolerance
+        )
+        if success:
+            self.baseline = latency if self.baseline is None else (
+                (1 - BASELINE_ALPHA) * self.baseline + BASELINE_ALPHA * latency
+            )
+
+        now = time.monotonic()
+        if overloaded:
+            # Aynı gecikme dalgasındaki çağrılar limiti art arda düşürmesin
+            if now - self._last_decrease >= (self.baseline or latency):
+                self.limit = max(self.min_limit, self.limit * self.backoff)
+                self._last_decrease = now
+        else:
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+
+        self._release_slot()
+
+    def _release_slot(self):
+        self.in_flight -= 1
+        while self._waiters and self.in_flight < int(self.limit):
+            future = self._waiters.popleft()
+            if not future.done():
+                self.in_flight += 1
+                future.set_result(None)
+        self._report()
+
+    def _call(self, func, *args, **kwargs):
+        if asyncio.iscoroutinefunction(func):
+            return func(*args, **kwargs)
+        # Async istemcisi olmayan sağlayıcılar (boto3) varsayılan executor'ı paylaşmaz
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_limit,
+                thread_name_prefix=f"provider-{self.name}"
+            )
+        return asyncio.get_running_loop().run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs)
+        )
+
+    async def run(self, func, *args, **kwargs):
+        """Sağlayıcı çağrısını sınır dahilinde çalıştır; iptal edilen çağrı sağlayıcıda da iptal olur"""
+        await self.acquire()
+        start_time = time.monotonic()
+        try:
+            result = await self._call(func, *args, **kwargs)
+        except asyncio.CancelledError:
+            # Kaybeden hedge ya da ayrılan istemci; limiti etkilemez
+            self._release_slot()
+            raise
+        except Exception:
+            latency = time.monotonic() - start_time
+            record_provider_call(self.name, latency, False)
+            self.release(latency, False)
+            raise
+
+        latency = time.monotonic() - start_time
+        record_provider_call(self.name, latency, True)
+        self.latencies.append(latency)
+        self.release(latency, True)
+        return result
+
+    def latency_percentile(self, percentile: float, min_samples: int = 1) -> Optional[float]:
+        """Son başarılı çağrıların gecikme yüzdeliği; örnek azsa None"""
+        if len(self.latencies) < max(1, min_samples):
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(percentile * len(ordered)))]
+
+    def get_stats(self) -> dict:
+        return {
+            "limit": int(self.limit),
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+            "baseline_latency_ms": round(self.baseline * 1000, 1) if self.baseline else None,
+        }
+
+
+class CircuitBreaker:
+    """
+    Son window_size çağrının hata oranı failure_rate'i aşınca devreyi açar.
+    Açık devre open_seconds boyunca çağrıları hemen reddeder, ardından tek bir
+    deneme çağrısına izin verir; deneme başarılıysa devre kapanır.
+    """
+
+    CLOSED = "closed"
+    HALF_OPEN = "half_open"
+    OPEN = "open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate: float = 0.5,
+        min_calls: int = 20,
+        window_size: int = 50,
+        open_seconds: float = 10
+    ):
+        self.name = name
+        self.failure_rate = failure_rate
+        self.min_calls = max(1, min_calls)
+        self.open_seconds = open_seconds
+        self.state = self.CLOSED
+        self.outcomes = deque(maxlen=max(self.min_calls, window_size))
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        record_circuit_state(name, self.state)
+
+    def _set_state(self, state: str):
+        if state != self.state:
+            logger.warning(f"{self.name} devresi: {self.state} -> {state}")
+        self.state = state
+        record_circuit_state(self.name, state)
+
+    def before_call(self):
+        """Devre açıksa CircuitOpenError fırlat"""
+        if self.state == self.OPEN and time.monotonic() - self._opened_at >= self.open_seconds:
+            self._set_state(self.HALF_OPEN)
+
+        if self.state == self.OPEN or (self.state == self.HALF_OPEN and self._probe_in_flight):
+            record_circuit_rejected(self.name)
+            raise CircuitOpenError(f"{self.name} sağlayıcısı geçici olarak devre dışı")
+
+        if self.state == self.HALF_OPEN:
+            self._probe_in_flight = True
+
+    def record(self, success: Optional[bool]):
+        """Çağrı sonucunu kaydet; None sonucu belirsiz (iptal, yerel yoğunluk) demektir"""
+        if self.state == self.HALF_OPEN:
+            self._probe_in_flight = False
+            if success is True:
+                self.outcomes.clear()
+                self._set_state(self.CLOSED)
+            elif success is False:
+                self._open()
+            return
+
+        if success is None:
+            return
+
+        self.outcomes.append(success)
+        if len(self.outcomes) >= self.min_calls:
+            failures = self.outcomes.count(False)
+            if failures / len(self.outcomes) >= self.failure_rate:
+                self._open()
+
+    def _open(self):
+        self._opened_at = time.monotonic()
+        self._set_state(self.OPEN)
+
+
+class HedgeBudget:
+    """Hedge isteklerini toplam çağrıların max_ratio oranıyla sınırlar"""
+
+    def __init__(self, max_ratio: float = 0.1, burst: int = HEDGE_BURST):
+        self.max_ratio = max_ratio
+        self.burst = burst
+        self.tokens = 0.0
+
+    def on_call(self):
+        self.tokens = min(self.burst, self.tokens + self.max_ratio)
+
+    def try_spend(self) -> bool:
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+
+limiters = {
+    name: AdaptiveLimiter(
+        name,
+        initial_limit=PROVIDER_CONCURRENCY_INITIAL,
+        min_limit=PROVIDER_CONCURRENCY_MIN,
+        max_limit=PROVIDER_CONCURRENCY_MAX,
+        queue_timeout_ms=PROVIDER_QUEUE_TIMEOUT_MS,
+        latency_tolerance=PROVIDER_LATENCY_TOLERANCE,
+        backoff=PROVIDER_CONCURRENCY_BACKOFF
+    )
+    for name in ("stt", "translate", "tts", "s3")
+}
+
+
+breakers = {
+    name: CircuitBreaker(
+        name,
+        failure_rate=CIRCUIT_FAILURE_RATE,
+        min_calls=CIRCUIT_MIN_CALLS,
+        window_size=CIRCUIT_WINDOW_SIZE,
+        open_seconds=CIRCUIT_OPEN_SECONDS
+    )
+    for name in limiters
+}
+
+hedge_budgets = {name: HedgeBudget(HEDGE_MAX_RATIO) for name in HEDGE_PROVIDERS if name in limiters}
+
+
+async def _hedged_run(name: str, func, *args, **kwargs):
+    """
+    Yanıt yuvarlanan p95 süresinde gelmezse aynı çağrıyı bir kez daha gönderir,
+    ilk başarılı yanıtı döndürür ve diğerini iptal eder.
+    """
+    limiter = limiters[name]
+    budget = hedge_budgets[name]
+    budget.on_call()
+
+    delay = limiter.latency_percentile(HEDGE_PERCENTILE, HEDGE_MIN_SAMPLES)
+    primary = asyncio.ensure_future(limiter.run(func, *args, **kwargs))
+    hedge = None
+    try:
+        if delay is None:
+            return await primary
+
+        done, _ = await asyncio.wait({primary}, timeout=max(delay, HEDGE_MIN_DELAY_MS / 1000))
+        if done or not budget.try_spend():
+            return await primary
+
+        record_hedge_sent(name)
+        hedge = asyncio.ensure_future(limiter.run(func, *args, **kwargs))
+        pending = {primary, hedge}
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    if task is hedge:
+                        record_hedge_won(name)
+                    return task.result()
+
+        # İki deneme de başarısızsa asıl çağrının hatası yükselir
+        return primary.result()
+    finally:
+        primary.cancel()
+        if hedge is not None:
+            hedge.cancel()
+
+
+async def call_provider(name: str, func, *args, **kwargs):
+    """
+    Sağlayıcı çağrısını devre kesici ve uyarlanabilir limit üzerinden yap.
+    HEDGE_PROVIDERS içindeki idempotent çağrılar gecikirse hedge edilir.
+    """
+    breaker = breakers[name]
+    breaker.before_call()
+
+    success = None
+    try:
+        if name in hedge_budgets:
+            result = await _hedged_run(name, func, *args, **kwargs)
+        else:
+            result = await limiters[name].run(func, *args, **kwargs)
+        success = True
+        return result
+    except ProviderOverloadedError:
+        raise
+    except Exception:
+        success = False
+        raise
+    finally:
+        breaker.record(success)
+
+
+def get_limiter_stats() -> dict:
+    return {
+        name: {
+            **limiter.get_stats(),
+            "circuit": breakers[name].state,
+            "p95_latency_ms": (
+                round(limiter.latency_percentile(0.95) * 1000, 1) if limiter.latencies else None
+            ),
+        }
+        for name, limiter in limiters.items()
+    }
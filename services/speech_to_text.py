@@ -1,14 +1,94 @@
-from google.cloud import speech_v1 as speech
-
-def transcribe_audio(audio_content: bytes, language_code: str = "tr-TR"):
-    client = speech.SpeechClient()
-    audio = speech.RecognitionAudio(content=audio_content)
-    config = speech.RecognitionConfig(
-        encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
-        sample_rate_hertz=16000,
-        language_code=language_code,
+from .providers import get_provider, SUPPORTED_LANGUAGES, normalize_language_code
+from .audio_processing import split_at_silence
+from .resilience import call_provider
+from app.config import STT_CHUNK_CONCURRENCY
+from app.monitoring import record_stt_chunked
+from app.singleflight import SingleFlight
+import asyncio
+import hashlib
+
+# Parça sınırında tekrarlanmış sayılabilecek en fazla kelime
+STITCH_MAX_OVERLAP_WORDS = 8
+
+async def transcribe_audio(audio_content: bytes, language_code: str = "tr-TR"):
+    return await get_provider().transcribe(audio_content, language_code)
+
+async def detect_and_transcribe(audio_content: bytes, language_code: str = None):
+    """
+    Tek tanıma çağrısıyla dili algılar ve metne dönüştürür.
+    (language_code, transcript) döndürür; metin bulunamazsa transcript None olur.
+    """
+    candidates = [language_code] if language_code else SUPPORTED_LANGUAGES
+    return await get_provider().detect_and_transcribe(audio_content, candidates)
+
+stt_flight = SingleFlight("stt")
+
+async def detect_and_transcribe_shared(audio_content: bytes, language_code: str = None):
+    """Aynı ses için eşzamanlı istekler tek bir tanıma çağrısını paylaşır"""
+    key = (hashlib.blake2b(audio_content, digest_size=16).hexdigest(), language_code)
+    return await stt_flight.do(
+        key,
+        lambda: call_provider("stt", detect_and_transcribe, audio_content, language_code)
     )
-    response = client.recognize(config=config, audio=audio)
-    if response.results:
-        return response.results[0].alternatives[0].transcript
-    return None
\ No newline at end of file
+
+def _overlap_key(word: str) -> str:
+    return word.strip(".,!?;:…\"'").casefold()
+
+def stitch_transcripts(parts: list, max_overlap_words: int = STITCH_MAX_OVERLAP_WORDS) -> str:
+    """
+    Parça metinlerini sırasıyla birleştirir.
+    Bir parçanın başı öncekinin sonunu tekrar ediyorsa (örtüşen ses) tekrar atılır.
+    """
+    words = []
+    for part in parts:
+        if not part:
+            continue
+        new_words = part.split()
+        tail = [_overlap_key(word) for word in words[-max_overlap_words:]]
+        head = [_overlap_key(word) for word in new_words[:max_overlap_words]]
+        overlap = next(
+            (k for k in range(min(len(tail), len(head)), 0, -1) if tail[-k:] == head[:k]),
+            0
+        )
+        words.extend(new_words[overlap:])
+    return " ".join(words)
+
+async def transcribe_long_audio(
+    audio_content: bytes,
+    language_code: str = None,
+    max_concurrency: int = STT_CHUNK_CONCURRENCY
+):
+    """
+    Senkron tanıma limitinden uzun sesi sessizlik sınırlarından parçalara böler,
+    parçaları sınırlı paralellikle tanır ve metinleri sırasıyla birleştirir.
+    Kısa ses tek çağrıda tanınır. (language_code, transcript) döndürür.
+    """
+    chunks = split_at_silence(audio_content)
+    if len(chunks) == 1:
+        return await detect_and_transcribe_shared(audio_content, language_code)
+
+    record_stt_chunked(len(chunks))
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def transcribe_chunk(chunk: bytes):
+        async with semaphore:
+            return await call_provider("stt", transcribe_audio, chunk, language_code)
+
+    if language_code:
+        # Dil biliniyorsa tüm parçalar baştan paralel tanınır
+        transcripts = await asyncio.gather(*[transcribe_chunk(chunk) for chunk in chunks])
+    else:
+        # Dil ilk parçadan algılanır, kalan parçalar o dilde tanınır
+        language_code, first_transcript = await detect_and_transcribe_shared(chunks[0], language_code)
+        transcripts = [first_transcript, *await asyncio.gather(*[transcribe_chunk(chunk) for chunk in chunks[1:]])]
+    transcript = stitch_transcripts(transcripts)
+    return normalize_language_code(language_code), transcript or None
+
+
+def streaming_transcribe(audio_chunks, language_code: str = "tr-TR", interim_results: bool = True):
+    """
+    Async ses parçası akışını akışlı tanıyıcıya besler.
+    Her sonuç için (transcript, is_final) ikilisi üreten async iterator döndürür.
+    """
+    return get_provider().streaming_transcribe(audio_chunks, language_code, interim_results)
@@ -1,16 +1,84 @@
-from google.cloud import texttospeech
+from .providers import get_provider
+from .resilience import call_provider
+from .tts_warmer import tts_warmer
+from app.config import TTS_MAX_CONCURRENCY, TTS_MAX_SEGMENT_CHARS
+from app.cache import cache_manager
+import asyncio
+import re
+import logging
 
-def synthesize_speech(text: str, language_code: str, voice_gender: str = "male"):
-    client = texttospeech.TextToSpeechClient()
-    input_text = texttospeech.SynthesisInput(text=text)
-    voice = texttospeech.VoiceSelectionParams(
-        language_code=language_code,
-        ssml_gender=texttospeech.SsmlVoiceGender.MALE if voice_gender == "male" else texttospeech.SsmlVoiceGender.FEMALE,
-    )
-    audio_config = texttospeech.AudioConfig(
-        audio_encoding=texttospeech.AudioEncoding.MP3
-    )
-    response = client.synthesize_speech(
-        input=input_text, voice=voice, audio_config=audio_config
-    )
-    return response.audio_content
\ No newline at end of file
+logger = logging.getLogger(__name__)
+
+# Cümle sonu noktalamasından sonra gelen boşluklardan böl
+SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?…;])\s+")
+
+async def synthesize_speech(text: str, language_code: str, voice_gender: str = "male"):
+    return await get_provider().synthesize(text, language_code, voice_gender)
+
+def split_sentences(text: str, max_chars: int = TTS_MAX_SEGMENT_CHARS) -> list:
+    """
+    Metni cümlelere böler.
+    max_chars'tan uzun cümleler kelime sınırlarından parçalanır.
+    """
+    segments = []
+    for sentence in SENTENCE_BOUNDARY.split(text.strip()):
+        sentence = sentence.strip()
+        while len(sentence) > max_chars:
+            cut = sentence.rfind(" ", 0, max_chars)
+            if cut <= 0:
+                cut = max_chars
+            segments.append(sentence[:cut].strip())
+            sentence = sentence[cut:].strip()
+        if sentence:
+            segments.append(sentence)
+    return segments
+
+async def synthesize_speech_stream(
+    text: str,
+    language_code: str,
+    voice_gender: str = "male",
+    max_concurrency: int = TTS_MAX_CONCURRENCY
+):
+    """
+    Cümleleri sınırlı paralellikle sentezler ve MP3 parçalarını metin sırasıyla üretir.
+    Önbellekte olan cümleler tek round trip ile alınır ve sentezlenmez;
+    ilk parça yalnızca ilk cümleyi bekler.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async def synthesize(sentence: str) -> bytes:
+        async with semaphore:
+            return await call_provider("tts", synthesize_speech, sentence, language_code, voice_gender)
+    
+    async def synthesize_cached(sentence: str) -> bytes:
+        # Eşzamanlı aynı cümle istekleri tek bir sentezi paylaşır
+        return await cache_manager.get_or_set_tts_segment(
+            sentence,
+            language_code,
+            voice_gender,
+            lambda: synthesize(sentence)
+        )
+    
+    async def segment(sentence: str, audio) -> bytes:
+        if audio is not None:
+            return audio
+        return await synthesize_cached(sentence)
+    
+    sentences = split_sentences(text)
+    tts_warmer.record(sentences, language_code, voice_gender)
+    cached = await cache_manager.get_tts_segments(sentences, language_code, voice_gender)
+    tasks = [asyncio.create_task(segment(sentence, audio)) for sentence, audio in zip(sentences, cached)]
+    try:
+        for task in tasks:
+            yield await task
+    finally:
+        # İstemci ayrıldıysa bekleyen sentezleri iptal et
+        for task in tasks:
+            task.cancel()
+
+async def synthesize_speech_cached(text: str, language_code: str, voice_gender: str = "male") -> bytes:
+    """Metnin tamamını önbellekteki ve yeni sentezlenen cümle seslerinden birleştir"""
+    return b"".join([
+        segment async for segment in
+        synthesize_speech_stream(text, language_code, voice_gender)
+    ])
\ No newline at end of file
@@ -1,6 +1,8 @@
-from google.cloud import translate_v2 as translate
+from .providers import get_provider
 
-def translate_text(text: str, target_language: str):
-    client = translate.Client()
-    result = client.translate(text, target_language=target_language)
-    return result["translatedText"]
\ No newline at end of file
+async def translate_text(text: str, target_language: str):
+    return (await get_provider().translate([text], target_language))[0]
+
+async def translate_texts(texts: list, target_language: str) -> list:
+    """Birden fazla metni tek istekte çevir; sonuçlar girdi sırasıyla döner"""
+    return await get_provider().translate(texts, target_language)
\ No newline at end of file
@@ -0,0 +1,84 @@
+from .batching import translation_batcher
+from app.cache import cache_manager
+from app.config import TRANSLATION_MEMORY_MAX_ENTRIES, TRANSLATION_MEMORY_LOCAL_TTL
+from app.local_cache import LocalCache
+from app.monitoring import record_translation_memory_lookup, record_translation_memory_size
+from app.singleflight import SingleFlight
+from typing import Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class TranslationMemory:
+    """
+    translate_text önünde iki katmanlı çeviri belleği.
+    L1: süreç içi, boyutu ve süresi sınırlı LocalCache. L2: CacheManager üzerinden Redis.
+    L1 anahtarı L2 ile aynıdır (ad alanı nesli dahil); L1 CacheManager'a bağlandığından
+    nesil artırımı, silme ve replikalar arası pub/sub geçersiz kılmaları onu da temizler.
+    """
+
+    def __init__(self, cache, max_entries: int = 10000, local_ttl: float = TRANSLATION_MEMORY_LOCAL_TTL):
+        self.cache = cache
+        self.local_ttl = local_ttl
+        self.local = LocalCache(
+            max_entries,
+            record_state=lambda entries, size: record_translation_memory_size(entries),
+            record_eviction=lambda reason: None
+        )
+        cache.attach_local(self.local)
+        self.flight = SingleFlight("translation")
+
+    def _get_local(self, key: str) -> Optional[str]:
+        data = self.local.get(key)
+        return data.decode() if data is not None else None
+
+    def _set_local(self, key: str, value: str):
+        self.local.set(key, value.encode(), self.local_ttl)
+
+    async def translate(
+        self,
+        text: str,
+        target_language: str,
+        source_language: Optional[str] = None
+    ) -> str:
+        """Çeviriyi bellekten döndür, yoksa sağlayıcıdan al ve iki katmana da yaz"""
+        source_language = source_language or "auto"
+        key = self.cache.text_translation_key(text, source_language, target_language)
+
+        translated = self._get_local(key)
+        record_translation_memory_lookup("l1", translated is not None)
+        if translated is not None:
+            return translated
+
+        translated = await self.cache.get_text_translation(text, source_language, target_language)
+        record_translation_memory_lookup("l2", translated is not None)
+        if translated is not None:
+            self._set_local(key, translated)
+            return translated
+
+        # Aynı metin için eşzamanlı ıskalar tek bir sağlayıcı çağrısını paylaşır
+        return await self.flight.do(
+            key,
+            lambda: self._translate_and_store(key, text, source_language, target_language)
+        )
+
+    async def _translate_and_store(
+        self,
+        key: str,
+        text: str,
+        source_language: str,
+        target_language: str
+    ) -> str:
+        translated = await translation_batcher.translate(text, target_language)
+        if translated:
+            self._set_local(key, translated)
+            await self.cache.set_text_translation(text, source_language, target_language, translated)
+        return translated
+
+    def clear(self):
+        """Süreç içi katmanı temizle"""
+        self.local.clear()
+
+
+translation_memory = TranslationMemory(cache_manager, TRANSLATION_MEMORY_MAX_ENTRIES)
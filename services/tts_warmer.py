@@ -0,0 +1,159 @@
+from .providers import get_provider
+from .resilience import call_provider
+from app.cache import cache_manager
+from app.config import (
+    TTS_WARMER_ENABLED,
+    TTS_WARMER_TOP_N,
+    TTS_WARMER_CALLS_PER_MINUTE,
+    TTS_WARMER_INTERVAL_SECONDS,
+    TTS_WARMER_REFRESH_BEFORE_SECONDS
+)
+from app.monitoring import record_tts_warmer_call, record_tts_warmer_tracked
+from app.sketches import TopK
+from app.utils import normalize_text
+import asyncio
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Aynı turda yalnızca bir replika ısıtır; bütçe tüm replikalar için ortaktır
+WARMER_LOCK_KEY = "lock:tts_warmer"
+# Tüm replikaların cümle sayımlarının toplandığı sıralı küme
+WARMER_PHRASES_KEY = "tts_warmer:phrases"
+# Ortak sayımlar her turda bu katsayıyla çarpılır; eski popülerlik zamanla unutulur
+WARMER_DECAY = 0.9
+
+
+class TTSWarmer:
+    """
+    /tts ve WebSocket trafiğindeki en sık cümle/dil/ses üçlülerini izler ve
+    önbellekteki sesleri süreleri dolmadan yeniden sentezler.
+    Sağlayıcı çağrıları dakikada calls_per_minute ile sınırlıdır.
+    Her replika cümleleri kendi sayacında toplar ve her turda Redis'teki ortak
+    sıralı kümeye ekler; kilidi alan replika ısıtacağı cümleleri oradan seçer.
+    """
+
+    def __init__(
+        self,
+        cache,
+        top_n: int = 100,
+        calls_per_minute: int = 30,
+        interval_seconds: int = 60,
+        refresh_before_seconds: int = 3600
+    ):
+        self.cache = cache
+        self.top_n = max(1, top_n)
+        self.calls_per_minute = max(0, calls_per_minute)
+        self.interval = max(1, interval_seconds)
+        self.refresh_before = refresh_before_seconds
+        # Son turdan beri bu replikada görülen sık cümleler
+        self.phrases = self._new_counter()
+        # Ortak kümede izlenen en fazla cümle sayısı
+        self.max_tracked = self.top_n * 4
+        self._task = None
+
+    def _new_counter(self) -> TopK:
+        return TopK(self.top_n, width=self.top_n * 64)
+
+    def record(self, sentences: list, language_code: str, voice_gender: str):
+        """İstekteki cümleleri frekans sayacına ekle"""
+        for sentence in sentences:
+            self.phrases.add((normalize_text(sentence), language_code, voice_gender))
+
+    @property
+    def budget_per_run(self) -> int:
+        return int(self.calls_per_minute * self.interval / 60)
+
+    async def flush(self):
+        """Bu replikanın sayımlarını ortak kümeye ekle ve yerel sayacı sıfırla"""
+        counts, self.phrases = self.phrases.items(), self._new_counter()
+        if not counts:
+            return
+        async with self.cache.redis.pipeline(transaction=False) as pipe:
+            for phrase, count in counts:
+                pipe.zincrby(WARMER_PHRASES_KEY, count, json.dumps(phrase))
+            await pipe.execute()
+
+    async def _hot_phrases(self) -> list:
+        """Ortak kümedeki en sık top_n cümleyi döndür ve sayımları yaşlandır"""
+        async with self.cache.redis.pipeline(transaction=False) as pipe:
+            pipe.zrevrange(WARMER_PHRASES_KEY, 0, self.top_n - 1)
+            pipe.zunionstore(WARMER_PHRASES_KEY, {WARMER_PHRASES_KEY: WARMER_DECAY})
+            pipe.zremrangebyrank(WARMER_PHRASES_KEY, 0, -self.max_tracked - 1)
+            members, _, _ = await pipe.execute()
+        return [tuple(json.loads(member)) for member in members]
+
+    async def warm_once(self) -> int:
+        """Süresi dolmak üzere olan sıcak cümleleri bütçe dahilinde sentezle"""
+        await self.flush()
+        phrases = await self._hot_phrases()
+        record_tts_warmer_tracked(len(phrases))
+        if not phrases:
+            return 0
+
+        remaining = await self.cache.get_tts_segment_ttls(phrases)
+        expiring = [
+            phrase for phrase, ttl in zip(phrases, remaining)
+            if ttl is None or ttl < self.refresh_before
+        ]
+
+        budget = self.budget_per_run
+        warmed = 0
+        for sentence, language_code, voice_gender in expiring[:budget]:
+            try:
+                await self.cache.warm_tts_segment(
+                    sentence,
+                    language_code,
+                    voice_gender,
+                    lambda: call_provider(
+                        "tts",
+                        get_provider().synthesize,
+                        sentence,
+                        language_code,
+                        voice_gender
+                    )
+                )
+                record_tts_warmer_call("warmed")
+                warmed += 1
+            except Exception as e:
+                logger.warning(f"Cümle ısıtılamadı ({language_code}/{voice_gender}): {e!r}")
+                record_tts_warmer_call("error")
+        if len(expiring) > budget:
+            record_tts_warmer_call("over_budget", len(expiring) - budget)
+        return warmed
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                # Kilidi almayan replikaların sayımları da ortak kümeye girer
+                await self.flush()
+                if await self.cache.try_lock(WARMER_LOCK_KEY, self.interval):
+                    warmed = await self.warm_once()
+                    if warmed:
+                        logger.info(f"{warmed} cümle sesi önceden sentezlendi")
+            except Exception as e:
+                logger.error(f"TTS ısıtma turu başarısız: {e!r}")
+
+    def start(self):
+        if self._task is None and self.calls_per_minute > 0:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+tts_warmer = TTSWarmer(
+    cache_manager,
+    top_n=TTS_WARMER_TOP_N,
+    calls_per_minute=TTS_WARMER_CALLS_PER_MINUTE if TTS_WARMER_ENABLED else 0,
+    interval_seconds=TTS_WARMER_INTERVAL_SECONDS,
+    refresh_before_seconds=TTS_WARMER_REFRESH_BEFORE_SECONDS
+)
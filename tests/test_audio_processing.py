@@ -0,0 +1,118 @@
+import pytest
+import struct
+import numpy as np
+from services.audio_processing import (
+    trim_silence,
+    normalize_audio,
+    parse_wav_header,
+    split_at_silence,
+    AudioValidationError,
+    SAMPLE_RATE
+)
+
+def tone(seconds: float, amplitude: int = 8000, frequency: int = 440) -> np.ndarray:
+    t = np.arange(int(SAMPLE_RATE * seconds)) / SAMPLE_RATE
+    return (amplitude * np.sin(2 * np.pi * frequency * t)).astype("<i2")
+
+def silence(seconds: float) -> np.ndarray:
+    return np.zeros(int(SAMPLE_RATE * seconds), dtype="<i2")
+
+def test_pure_silence_is_rejected():
+    """Tamamen sessiz klip None döndürmeli"""
+    assert trim_silence(silence(1.0).tobytes()) is None
+    assert trim_silence(b"") is None
+
+def test_leading_and_trailing_silence_is_trimmed():
+    """Baş ve sondaki sessizlik kırpılmalı, konuşma korunmalı"""
+    audio = np.concatenate([silence(1.0), tone(0.5), silence(1.0)]).tobytes()
+    trimmed = trim_silence(audio, padding_ms=100)
+    
+    assert trimmed is not None
+    # 0.5 sn ton + her iki yanda en fazla 100 ms padding
+    assert len(trimmed) <= (0.5 + 0.2 + 0.04) * SAMPLE_RATE * 2
+    assert len(trimmed) >= 0.5 * SAMPLE_RATE * 2
+
+def test_internal_silence_is_collapsed():
+    """Konuşmalar arasındaki uzun sessizlik kısaltılmalı"""
+    audio = np.concatenate([tone(0.3), silence(2.0), tone(0.3)]).tobytes()
+    trimmed = trim_silence(audio, padding_ms=0, max_silence_ms=200)
+    
+    assert trimmed is not None
+    assert len(trimmed) <= (0.6 + 0.2 + 0.04) * SAMPLE_RATE * 2
+
+def test_odd_length_input_is_handled():
+    """Tek byte artıklı giriş hata vermemeli"""
+    audio = tone(0.5).tobytes() + b"\x00"
+    assert trim_silence(audio) is not None
+
+def make_wav(samples: np.ndarray, sample_rate: int, channels: int = 1) -> bytes:
+    data = samples.astype("<i2").tobytes()
+    block_align = 2 * channels
+    header = struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 36 + len(data), b"WAVE",
+        b"fmt ", 16, 1, channels, sample_rate, sample_rate * block_align, block_align, 16,
+        b"data", len(data)
+    )
+    return header + data
+
+def test_parse_wav_header():
+    """WAV başlığı doğru ayrıştırılmalı"""
+    wav = make_wav(tone(0.1), 16000)
+    header = parse_wav_header(wav)
+    
+    assert header["channels"] == 1
+    assert header["sample_rate"] == 16000
+    assert header["data_offset"] == 44
+    assert header["data_size"] == len(wav) - 44
+
+def test_normalize_downmixes_and_resamples():
+    """Stereo 44.1 kHz girdi mono 16 kHz'e dönüştürülmeli"""
+    t = np.arange(44100) / 44100
+    left = (8000 * np.sin(2 * np.pi * 440 * t)).astype("<i2")
+    stereo = np.column_stack([left, left]).reshape(-1)
+    pcm = normalize_audio(make_wav(stereo, 44100, channels=2))
+    
+    samples = np.frombuffer(pcm, dtype="<i2")
+    assert len(samples) == 16000
+    assert 6000 < np.abs(samples[100:-100]).max() < 9000
+
+def test_normalize_passthrough_for_target_format():
+    """Hedef formattaki WAV yalnızca başlıktan arındırılmalı"""
+    samples = tone(0.2)
+    assert normalize_audio(make_wav(samples, 16000)) == samples.tobytes()
+
+@pytest.mark.parametrize("data", [
+    b"invalid_audio",
+    b"RIFF\x00\x00\x00\x00WAVE",
+    b"RIFF\x24\x00\x00\x00WAVEfmt \x10\x00\x00\x00" + b"\x00" * 16,
+])
+def test_normalize_rejects_malformed_input(data):
+    """Bozuk girdiler AudioValidationError fırlatmalı"""
+    with pytest.raises(AudioValidationError):
+        normalize_audio(data)
+
+def test_normalize_rejects_oversized_input():
+    """Limit aşan girdiler ayrıştırılmadan reddedilmeli"""
+    with pytest.raises(AudioValidationError):
+        normalize_audio(make_wav(tone(1.0), 16000), max_size=1000)
+    with pytest.raises(AudioValidationError):
+        normalize_audio(make_wav(tone(1.0), 16000), max_duration=0.5)
+
+def test_split_at_silence_cuts_in_pauses_with_overlap():
+    """Uzun ses sessizliklerden, örtüşmeli ve limit altı parçalara bölünmeli"""
+    audio = np.concatenate([tone(3.0), silence(0.4), tone(3.0), silence(0.4), tone(3.0)])
+    chunks = split_at_silence(audio.tobytes(), max_chunk_seconds=4.0, overlap_ms=200)
+    
+    assert len(chunks) == 3
+    assert all(len(chunk) <= 4.0 * SAMPLE_RATE * 2 for chunk in chunks)
+    # Kesim sessizlikte yapıldığından her parça sessizlik içinde bitmeli
+    for chunk in chunks[:-1]:
+        assert np.abs(np.frombuffer(chunk, dtype="<i2")[-160:]).max() == 0
+    # Örtüşme kadar fazlalık dışında ses kaybolmamalı
+    assert sum(len(chunk) for chunk in chunks) >= audio.nbytes
+
+def test_short_audio_is_not_split():
+    """Limit altındaki ses tek parça kalmalı"""
+    audio = tone(1.0).tobytes()
+    assert split_at_silence(audio, max_chunk_seconds=4.0) == [audio]
@@ -0,0 +1,368 @@
+import pytest
+import asyncio
+import random
+import fakeredis
+from app.cache import CacheManager
+
+@pytest.fixture
+def cache():
+    return CacheManager(fakeredis.FakeAsyncRedis(server=fakeredis.FakeServer()))
+
+@pytest.mark.asyncio
+async def test_set_and_get_round_trip(cache):
+    """Değerler async istemci üzerinden yazılıp okunmalı"""
+    assert await cache.set("k", {"id": 1}, ttl=60)
+    assert await cache.get("k", "user") == {"id": 1}
+    assert await cache.get("yok", "user") is None
+
+@pytest.mark.asyncio
+async def test_oversized_values_are_not_stored(cache):
+    """Serileştirilmiş boyutu limiti aşan değer saklanmamalı"""
+    cache.max_size = 10
+    assert not await cache.set("k", b"x" * 100)
+    assert await cache.redis.get("k") is None
+
+@pytest.mark.asyncio
+async def test_rate_limit_counter_expires(cache):
+    """Rate limit sayacı artmalı ve TTL almalı"""
+    assert [await cache.increment_rate_limit("rl", 60) for _ in range(3)] == [1, 2, 3]
+    assert 0 < await cache.redis.ttl("rl") <= 60
+
+@pytest.mark.asyncio
+async def test_get_or_set_computes_once(cache):
+    """Eşzamanlı ıskalamalar tek hesaplamayı paylaşmalı ve sonuç önbelleğe yazılmalı"""
+    calls = 0
+    
+    async def compute():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "değer"
+    
+    results = await asyncio.gather(*[
+        cache.get_or_set("k", compute, ttl=60, distributed=True) for _ in range(5)
+    ])
+    assert results == ["değer"] * 5
+    assert calls == 1
+    assert await cache.get_or_set("k", compute, ttl=60) == "değer"
+    assert calls == 1
+
+@pytest.mark.asyncio
+async def test_invalidate_namespace_bumps_generation(cache):
+    """Ad alanı geçersiz kılınınca eski anahtarlar okunmamalı, diğer ad alanları etkilenmemeli"""
+    await cache.set_translation("ses", "tr", "en", {"translated_text": "hello"})
+    await cache.set_user(1, {"id": 1})
+    
+    await cache.invalidate_namespace("translation")
+    
+    assert await cache.get_translation("ses", "tr", "en") is None
+    assert await cache.get_user(1) == {"id": 1}
+    assert int(await cache.redis.get("cache:gen:translation")) == 1
+
+@pytest.mark.asyncio
+async def test_generations_are_shared_between_replicas():
+    """Başka replikanın artırdığı nesil Redis'ten okunmalı"""
+    server = fakeredis.FakeServer()
+    first = CacheManager(fakeredis.FakeAsyncRedis(server=server))
+    second = CacheManager(fakeredis.FakeAsyncRedis(server=server))
+    await first.set_user(1, {"id": 1})
+    
+    await first.invalidate_namespace("user")
+    await second.refresh_generations()
+    
+    assert second.generations["user"] == 1
+    assert await second.get_user(1) is None
+
+@pytest.mark.asyncio
+async def test_sweeper_deletes_only_stale_keys(cache):
+    """Süpürücü eski nesil ve nesilsiz anahtarları silmeli, güncel olanlara dokunmamalı"""
+    await cache.set_user(1, {"id": 1})
+    await cache.redis.set("user:eskiformat", b"x")
+    await cache.invalidate_namespace("user")
+    await cache.set_user(2, {"id": 2})
+    
+    deleted = await cache.sweep_stale_keys(max_keys_per_second=10_000, scan_count=100)
+    
+    assert deleted == 2
+    assert await cache.get_user(2) == {"id": 2}
+    assert [key async for key in cache.redis.scan_iter(match="user:*")] == [
+        cache._generate_key("user", 2).encode()
+    ]
+
+@pytest.mark.asyncio
+async def test_sweeper_throttles_every_scan_call(cache, monkeypatch):
+    """Eşleşme olmasa da her SCAN çağrısından sonra scan_count kadar beklenmeli"""
+    await cache.redis.mset({f"baska:{i}": i for i in range(50)})
+    sleeps = []
+    
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+    
+    monkeypatch.setattr("app.cache.asyncio.sleep", fake_sleep)
+    assert await cache.sweep_stale_keys(max_keys_per_second=100, scan_count=10) == 0
+    
+    assert sleeps and all(seconds == 0.1 for seconds in sleeps)
+
+@pytest.mark.asyncio
+async def test_generation_does_not_go_back_when_counter_is_lost(cache):
+    """Nesil sayacı silinirse eski nesil anahtarları yeniden sunulmamalı, sayaç onarılmalı"""
+    await cache.set_user(1, {"id": 1})
+    await cache.invalidate_namespace("user")
+    await cache.redis.delete("cache:gen:user")
+    
+    await cache.refresh_generations()
+    
+    assert cache.generations["user"] == 1
+    assert await cache.get_user(1) is None
+    assert int(await cache.redis.get("cache:gen:user")) == 1
+    assert await cache.invalidate_namespace("user") == 2
+
+@pytest.mark.asyncio
+async def test_clear_pattern_uses_scan(cache):
+    """Pattern silme KEYS olmadan tüm eşleşmeleri silmeli"""
+    for i in range(25):
+        await cache.redis.set(f"tmp:{i}", i)
+    await cache.redis.set("keep", 1)
+    
+    assert await cache.clear_pattern("tmp:*") == 25
+    assert await cache.redis.exists("keep")
+
+@pytest.mark.asyncio
+async def test_get_or_set_serves_stale_and_refreshes_in_background(cache, monkeypatch):
+    """Yumuşak süresi dolan değer hemen döndürülmeli, tek bir arka plan yenilemesi yapılmalı"""
+    versions = iter(["eski", "yeni"])
+    calls = 0
+    
+    async def compute():
+        nonlocal calls
+        calls += 1
+        return next(versions)
+    
+    now = 1000.0
+    monkeypatch.setattr("app.cache.time.time", lambda: now)
+    assert await cache.get_or_set("k", compute, ttl=60, stale_ttl=30) == "eski"
+    assert 60 < await cache.redis.ttl("k") <= 90
+    
+    now += 61
+    results = await asyncio.gather(*[cache.get_or_set("k", compute, ttl=60) for _ in range(3)])
+    assert results == ["eski"] * 3
+    await asyncio.gather(*cache._refresh_tasks.values())
+    
+    assert calls == 2
+    assert await cache.get_or_set("k", compute, ttl=60) == "yeni"
+
+@pytest.mark.asyncio
+async def test_failed_refresh_keeps_stale_value(cache, monkeypatch):
+    """Yenileme hata verirse eski değer sunulmaya devam etmeli"""
+    async def compute():
+        return "değer"
+    
+    async def failing():
+        raise RuntimeError("sağlayıcı hatası")
+    
+    now = 1000.0
+    monkeypatch.setattr("app.cache.time.time", lambda: now)
+    await cache.get_or_set("k", compute, ttl=60)
+    now += 61
+    assert await cache.get_or_set("k", failing, ttl=60) == "değer"
+    await asyncio.gather(*cache._refresh_tasks.values())
+    assert await cache.get_or_set("k", failing, ttl=60) == "değer"
+
+def test_xfetch_refreshes_earlier_for_expensive_values():
+    """Erken yenileme olasılığı kalan süre azaldıkça ve hesaplama süresi arttıkça artmalı"""
+    import random
+    random.seed(0)
+    
+    def rate(remaining, delta):
+        return sum(CacheManager._should_refresh_early(remaining, delta, beta=1.0) for _ in range(2000)) / 2000
+    
+    assert rate(100, 0.0) == 0
+    assert rate(10, 1.0) < rate(1, 1.0) < rate(0.1, 1.0)
+    assert rate(1, 0.1) < rate(1, 2.0)
+
+@pytest.mark.asyncio
+async def test_get_many_and_set_many_round_trip(cache):
+    """Toplu yazma anahtar başına TTL uygulamalı, toplu okuma yalnızca bulunanları döndürmeli"""
+    stored = await cache.set_many({"a": 1, "b": "iki"}, ttl=60, ttls={"b": 10})
+    
+    assert stored == 2
+    assert 0 < await cache.redis.ttl("a") <= 60
+    assert 0 < await cache.redis.ttl("b") <= 10
+    assert await cache.get_many(["a", "yok", "b"], "default") == {"a": 1, "b": "iki"}
+    
+    assert await cache.delete_many(["a", "b", "yok"]) == 2
+    assert await cache.get_many(["a", "b"], "default") == {}
+
+@pytest.mark.asyncio
+async def test_set_many_skips_unserializable_values(cache):
+    """Serileştirilemeyen tek değer toplu yazmanın geri kalanını engellememeli"""
+    stored = await cache.set_many({"a": 1, "bozuk": lambda: None, "b": "iki"}, ttl=60)
+    
+    assert stored == 2
+    assert await cache.get_many(["a", "bozuk", "b"], "default") == {"a": 1, "b": "iki"}
+
+@pytest.mark.asyncio
+async def test_get_many_uses_single_round_trip(cache):
+    """Redis'e tek MGET gitmeli"""
+    await cache.set_many({f"k{i}": i for i in range(5)})
+    calls = 0
+    original_mget = cache.redis.mget
+    
+    async def counting_mget(*args, **kwargs):
+        nonlocal calls
+        calls += 1
+        return await original_mget(*args, **kwargs)
+    
+    cache.redis.mget = counting_mget
+    assert len(await cache.get_many([f"k{i}" for i in range(5)], "default")) == 5
+    assert calls == 1
+
+@pytest.mark.asyncio
+async def test_get_tts_segments_skips_expired_entries(cache, monkeypatch):
+    """Yumuşak süresi dolan cümleler None dönmeli ki get_or_set ile yenilensin"""
+    now = 1000.0
+    monkeypatch.setattr("app.cache.time.time", lambda: now)
+    
+    async def synthesize():
+        return b"ses"
+    
+    await cache.get_or_set_tts_segment("Merhaba.", "tr-TR", "male", synthesize, ttl=60)
+    assert await cache.get_tts_segments(["Merhaba.", "Yok."], "tr-TR", "male") == [b"ses", None]
+    now += 61
+    assert await cache.get_tts_segments(["Merhaba."], "tr-TR", "male") == [None]
+
+@pytest.mark.asyncio
+async def test_audio_result_cache_is_keyed_by_digest_target_and_voice(cache):
+    """Aynı ses özeti farklı hedef dil ya da ses için ayrı saklanmalı"""
+    from app.utils import audio_digest
+    digest = audio_digest(b"\x00\x01" * 100)
+    result = {"source_text": "merhaba", "translated_text": "hello", "source_lang": "tr-TR"}
+    await cache.set_translation(digest, None, "en", result, "female")
+    
+    assert await cache.get_translation(digest, None, "en", "female") == result
+    assert await cache.get_translation(digest, None, "en", "male") is None
+    assert await cache.get_translation(digest, None, "de", "female") is None
+
+@pytest.mark.asyncio
+async def test_get_stats_does_not_assume_db0(cache):
+    """Anahtar sayısı seçili veritabanından okunmalı, INFO'da db0 olmasa da"""
+    from unittest.mock import AsyncMock
+    await cache.set("k", 1)
+    cache.redis.info = AsyncMock(return_value={
+        "used_memory": 1024, "keyspace_hits": 3, "keyspace_misses": 1, "db2": {"keys": 1}
+    })
+    stats = await cache.get_stats()
+    assert stats["keys"] == 1
+    assert stats["hit_ratio"] == 0.75
+
+@pytest.mark.asyncio
+async def test_sampled_reads_track_hot_keys(cache):
+    """Örneklenen okumalar sıcak anahtar listesine girmeli"""
+    cache.stats_sample_rate = 1.0
+    await cache.set("sıcak", 1, ttl=60)
+    await cache.set("ılık", 2, ttl=60)
+    for _ in range(5):
+        assert await cache.get("sıcak", "default") == 1
+    await cache.get("ılık", "default")
+    
+    assert [entry["key"] for entry in cache.get_hot_keys()] == ["sıcak", "ılık"]
+
+@pytest.mark.asyncio
+async def test_namespace_memory_is_extrapolated_from_sample(cache, monkeypatch):
+    """Örnekteki oranlar toplam anahtar sayısına ölçeklenmeli"""
+    await cache.set_many({f"tts:v0:{i}": b"x" * 100 for i in range(30)})
+    await cache.set_many({f"user:v0:{i}": {"id": i} for i in range(10)})
+    
+    async def memory_usage(keys):
+        return [await cache.redis.strlen(key) for key in keys]
+    
+    monkeypatch.setattr(cache, "_memory_usage", memory_usage)
+    estimate = await cache.estimate_namespace_memory(sample_size=1000)
+    
+    assert estimate["total_keys"] == estimate["sampled_keys"] == 40
+    assert estimate["namespaces"]["tts"]["estimated_keys"] == 30
+    assert estimate["namespaces"]["tts"]["avg_bytes"] == 102
+    assert estimate["namespaces"]["user"]["estimated_keys"] == 10
+
+class FakeBlobStore:
+    def __init__(self):
+        self.objects = {}
+        
+    async def upload_file(self, file_data, file_key, content_type, cache_control="max-age=31536000"):
+        self.objects[file_key] = file_data
+        return f"https://cdn.example.com/{file_key}"
+        
+    async def download_file(self, file_key):
+        return self.objects.get(file_key)
+
+@pytest.mark.asyncio
+async def test_large_audio_is_offloaded_behind_a_pointer(cache):
+    """Eşikten büyük ses nesne deposuna yüklenmeli, Redis'te yalnızca işaretçi kalmalı"""
+    store = FakeBlobStore()
+    cache.set_blob_store(store)
+    cache.blob_threshold = 1024
+    cache.max_size = 1200  # ses Redis'e doğrudan sığmaz
+    audio = random.Random(0).randbytes(1500)  # sıkıştırılamayan ses verisi
+    
+    assert await cache.set_tts("uzun metin", "tr-TR", "male", audio)
+    key = cache._generate_key("tts", "uzun metin", "tr-TR", "male")
+    assert len(await cache.redis.get(key)) < 200
+    assert len(store.objects) == 1
+    assert await cache.get_tts("uzun metin", "tr-TR", "male") == audio
+    
+    # Aynı içerik aynı nesne anahtarını kullanır
+    assert await cache.set_tts("aynı ses", "tr-TR", "male", audio)
+    assert len(store.objects) == 1
+
+@pytest.mark.asyncio
+async def test_l1_holds_resolved_blob_values():
+    """L1'deki blob değeri tekrar okunurken nesne deposundan yeniden indirilmemeli"""
+    from app.local_cache import LocalCache
+    server = fakeredis.FakeServer()
+    writer = CacheManager(fakeredis.FakeAsyncRedis(server=server))
+    reader = CacheManager(fakeredis.FakeAsyncRedis(server=server), local_cache=LocalCache(), local_types=["tts"])
+    store = FakeBlobStore()
+    downloads = 0
+    original_download = store.download_file
+    
+    async def counting_download(file_key):
+        nonlocal downloads
+        downloads += 1
+        return await original_download(file_key)
+    
+    store.download_file = counting_download
+    for manager in (writer, reader):
+        manager.set_blob_store(store)
+        manager.blob_threshold = 1024
+    audio = random.Random(0).randbytes(4096)
+    await writer.set_tts("metin", "tr-TR", "male", audio)
+    
+    for _ in range(3):
+        assert await reader.get_tts("metin", "tr-TR", "male") == audio
+    assert downloads == 1
+    
+    # Bu replikanın yazdığı değer L1'den indirme olmadan okunmalı
+    await reader.set_tts("diğer", "tr-TR", "male", random.Random(1).randbytes(4096))
+    assert await reader.get_tts("diğer", "tr-TR", "male") is not None
+    assert downloads == 1
+
+@pytest.mark.asyncio
+async def test_missing_blob_is_a_miss(cache):
+    """Nesne deposunda bulunamayan blob ıskalama sayılmalı"""
+    store = FakeBlobStore()
+    cache.set_blob_store(store)
+    cache.blob_threshold = 1024
+    await cache.set_tts("metin", "tr-TR", "male", random.Random(0).randbytes(4096))
+    store.objects.clear()
+    
+    assert await cache.get_tts("metin", "tr-TR", "male") is None
+
+@pytest.mark.asyncio
+async def test_non_blob_types_are_still_bounded(cache):
+    """Blob türü olmayan büyük değerler nesne deposuna gitmemeli"""
+    store = FakeBlobStore()
+    cache.set_blob_store(store)
+    cache.blob_threshold = 10
+    cache.max_size = 100
+    assert not await cache.set_user(1, {"bio": "x" * 500})
+    assert store.objects == {}
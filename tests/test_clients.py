@@ -0,0 +1,44 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from services.clients import ProviderClientRegistry
+
+def make_registry(pool_size=1):
+    """Gerçek gRPC kanalı açmadan sahte istemci üreten kayıt"""
+    registry = ProviderClientRegistry(pool_size=pool_size)
+    created = []
+    
+    def factory():
+        client, channel = object(), MagicMock(close=AsyncMock())
+        created.append((client, channel))
+        return client, channel
+    
+    registry._factories = {"speech": factory}
+    return registry, created
+
+def test_repeated_calls_return_same_client():
+    """Aynı sağlayıcı için her çağrıda aynı istemci dönmeli"""
+    registry, created = make_registry()
+    
+    first = registry.get("speech")
+    assert registry.get("speech") is first
+    assert len(created) == 1
+
+def test_pool_round_robins_clients():
+    """Havuzdaki istemciler sırayla kullanılmalı, yenisi oluşturulmamalı"""
+    registry, created = make_registry(pool_size=2)
+    
+    clients = [registry.get("speech") for _ in range(4)]
+    assert clients == [created[0][0], created[1][0]] * 2
+
+@pytest.mark.asyncio
+async def test_close_closes_channels():
+    """Kapatma tüm kanalları kapatmalı, sonraki çağrı yeni istemci oluşturmalı"""
+    registry, created = make_registry(pool_size=2)
+    first = registry.get("speech")
+    
+    await registry.close()
+    
+    for _, channel in created:
+        channel.close.assert_awaited_once()
+    assert registry.get_stats() == {}
+    assert registry.get("speech") is not first
@@ -0,0 +1,217 @@
+import pytest
+import asyncio
+import fakeredis
+import json
+from unittest.mock import patch
+from app.cache import CacheManager
+from app.local_cache import LocalCache
+from app.serialization import dumps
+
+def test_entry_and_byte_bounds():
+    """Giriş sayısı ve byte sınırı aşılmamalı"""
+    cache = LocalCache(max_entries=3, max_bytes=100)
+    for i in range(5):
+        cache.get(f"k{i}")
+        cache.get(f"k{i}")
+        cache.set(f"k{i}", b"x" * 10, ttl=60)
+    assert len(cache) <= 3
+    
+    assert not cache.set("büyük", b"x" * 101, ttl=60)
+    cache.get("orta")
+    cache.get("orta")
+    cache.get("orta")
+    cache.set("orta", b"x" * 90, ttl=60)
+    assert cache.bytes <= 100
+
+def test_expired_entries_are_not_returned():
+    """Süresi dolan girdi döndürülmemeli"""
+    cache = LocalCache()
+    cache.set("k", b"v", ttl=60)
+    with patch("app.local_cache.time.monotonic", return_value=10 ** 9):
+        assert cache.get("k") is None
+    assert len(cache) == 0
+
+def test_tinylfu_rejects_cold_keys_when_full():
+    """Doluyken nadir anahtar sık kullanılanı çıkaramamalı, sık olan çıkarabilmeli"""
+    cache = LocalCache(max_entries=2)
+    for key in ("a", "b"):
+        for _ in range(5):
+            cache.get(key)
+        cache.set(key, b"v", ttl=60)
+    
+    assert not cache.set("soğuk", b"v", ttl=60)
+    
+    for _ in range(10):
+        cache.get("sıcak")
+    assert cache.set("sıcak", b"v", ttl=60)
+    assert cache.get("sıcak") == b"v"
+
+@pytest.fixture
+def server():
+    return fakeredis.FakeServer()
+
+def make_manager(server):
+    return CacheManager(
+        fakeredis.FakeAsyncRedis(server=server),
+        local_cache=LocalCache(),
+        local_types=["user"]
+    )
+
+@pytest.mark.asyncio
+async def test_l1_serves_hits_without_redis(server):
+    """L1'deki değer Redis'e gitmeden dönmeli"""
+    cache = make_manager(server)
+    await cache.set_user(1, {"id": 1})
+    await cache.redis.flushall()
+    assert await cache.get_user(1) == {"id": 1}
+
+@pytest.mark.asyncio
+async def test_l2_hit_populates_l1(server):
+    """Redis'ten okunan değer L1'e alınmalı"""
+    cache = make_manager(server)
+    key = cache._generate_key("user", 2)
+    await cache.redis.set(key, dumps({"id": 2}))
+    
+    assert await cache.get(key, "user") == {"id": 2}
+    assert cache.local.get(key) is not None
+
+@pytest.mark.asyncio
+async def test_invalidation_propagates_between_replicas(server):
+    """Bir replikadaki silme diğerinin L1'inden de silmeli"""
+    first, second = make_manager(server), make_manager(server)
+    await first.set_user(3, {"id": 3})
+    assert await second.get_user(3) == {"id": 3}
+    
+    second.start_invalidation_listener()
+    await asyncio.sleep(0.05)
+    try:
+        await first.invalidate_user(3)
+        for _ in range(50):
+            if second.local.get(second._generate_key("user", 3)) is None:
+                break
+            await asyncio.sleep(0.01)
+        assert await second.get_user(3) is None
+    finally:
+        await second.stop_invalidation_listener()
+
+def test_topk_keeps_heavy_hitters():
+    """Sık görülen öğeler nadir olanların önünde listelenmeli"""
+    from app.sketches import TopK
+    top = TopK(k=3, width=256)
+    for i in range(200):
+        top.add("sıcak")
+        if i % 2 == 0:
+            top.add("ılık")
+        top.add(f"soğuk{i}")
+    
+    assert [item for item, _ in top.items()[:2]] == ["sıcak", "ılık"]
+    assert top.items()[0][1] >= 200
+
+class IdlePubSubServer:
+    """
+    Yalnızca abonelik, MGET ve PING'e yanıt veren küçük bir RESP sunucusu.
+    Gerçek soket zaman aşımını sınamak için kullanılır (fakeredis soket açmaz).
+    """
+    
+    def __init__(self):
+        self.subscribers = []
+        self.connections = 0
+    
+    async def start(self):
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self.server.sockets[0].getsockname()[1]
+    
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+    
+    async def publish(self, channel: bytes, data: bytes):
+        for writer in self.subscribers:
+            writer.write(self._array([b"message", channel, data]))
+            await writer.drain()
+    
+    @staticmethod
+    def _array(items) -> bytes:
+        out = b"*%d\r\n" % len(items)
+        for item in items:
+            if isinstance(item, int):
+                out += b":%d\r\n" % item
+            elif item is None:
+                out += b"$-1\r\n"
+            else:
+                out += b"$%d\r\n%s\r\n" % (len(item), item)
+        return out
+    
+    async def _read_command(self, reader) -> list:
+        count = int((await reader.readline())[1:])
+        args = []
+        for _ in range(count):
+            length = int((await reader.readline())[1:])
+            args.append((await reader.readexactly(length + 2))[:-2])
+        return args
+    
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        try:
+            while True:
+                args = await self._read_command(reader)
+                command = args[0].upper()
+                if command == b"SUBSCRIBE":
+                    self.subscribers.append(writer)
+                    writer.write(self._array([b"subscribe", args[1], 1]))
+                elif command == b"MGET":
+                    writer.write(self._array([None] * (len(args) - 1)))
+                elif command == b"PING":
+                    writer.write(b"+PONG\r\n")
+                else:
+                    writer.write(b"+OK\r\n")
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            if writer in self.subscribers:
+                self.subscribers.remove(writer)
+            writer.close()
+
+@pytest.mark.asyncio
+async def test_idle_subscription_outlives_socket_timeout():
+    """Boş kanalda soket zaman aşımı yeniden bağlanmaya ve L1 temizliğine yol açmamalı"""
+    from redis.asyncio import Redis
+    from app.cache import CACHE_INVALIDATION_CHANNEL
+    
+    server = IdlePubSubServer()
+    port = await server.start()
+    cache = CacheManager(
+        Redis(host="127.0.0.1", port=port, socket_timeout=0.05),
+        local_cache=LocalCache(),
+        local_types=["user"]
+    )
+    cache.start_invalidation_listener()
+    try:
+        for _ in range(50):
+            if server.subscribers:
+                break
+            await asyncio.sleep(0.01)
+        key = cache._generate_key("user", 1)
+        cache.local.set(key, dumps({"id": 1}), 60)
+        connections = server.connections
+        
+        # Soket zaman aşımının birkaç katı boyunca kanal sessiz kalır
+        await asyncio.sleep(0.3)
+        assert cache.local.get(key) is not None
+        assert server.connections == connections
+        
+        # Abonelik hâlâ çalışıyor olmalı
+        await server.publish(
+            CACHE_INVALIDATION_CHANNEL.encode(),
+            json.dumps({"origin": "diğer", "keys": [key]}).encode()
+        )
+        for _ in range(50):
+            if cache.local.get(key) is None:
+                break
+            await asyncio.sleep(0.01)
+        assert cache.local.get(key) is None
+    finally:
+        await cache.stop_invalidation_listener()
+        await cache.redis.aclose()
+        await server.stop()
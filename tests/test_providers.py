@@ -0,0 +1,91 @@
+import pytest
+import asyncio
+from unittest.mock import patch
+from services.providers import create_provider
+from services.providers.simulated import SimulatedProvider, SimulatedProviderError, MP3_FRAME_HEADER
+
+@pytest.fixture
+def provider():
+    return SimulatedProvider(
+        seed=1,
+        latency_ms={"stt": 0, "translate": 0, "tts": 0},
+        error_rate=0
+    )
+
+async def audio_stream(chunks):
+    for chunk in chunks:
+        yield chunk
+
+def test_create_provider_by_name():
+    """Yapılandırmadaki isimle doğru sağlayıcı oluşturulmalı"""
+    assert isinstance(create_provider("simulated"), SimulatedProvider)
+    with pytest.raises(ValueError):
+        create_provider("bilinmeyen")
+
+@pytest.mark.asyncio
+async def test_outputs_are_deterministic(provider):
+    """Aynı girdi her zaman aynı çıktıyı vermeli"""
+    other = SimulatedProvider(seed=2, latency_ms={"stt": 0, "translate": 0, "tts": 0})
+    audio = bytes(range(256)) * 200
+    
+    assert await provider.detect_and_transcribe(audio, ["tr-TR", "en-US"]) == \
+        await other.detect_and_transcribe(audio, ["tr-TR", "en-US"])
+    assert await provider.translate(["merhaba"], "en") == ["[en] merhaba"]
+    assert await provider.synthesize("Merhaba.", "tr-TR", "male") == \
+        await other.synthesize("Merhaba.", "tr-TR", "male")
+
+@pytest.mark.asyncio
+async def test_tts_payload_size_scales_with_text(provider):
+    """Ses boyutu metin uzunluğuyla orantılı olmalı"""
+    audio = await provider.synthesize("a" * 10, "en-US", "female")
+    assert audio.startswith(MP3_FRAME_HEADER)
+    assert len(audio) == 10 * provider.tts_bytes_per_char
+
+@pytest.mark.asyncio
+async def test_streaming_yields_interim_then_final(provider):
+    """Akışlı tanıma ara sonuçlardan sonra nihai sonuç üretmeli"""
+    results = [
+        result async for result in
+        provider.streaming_transcribe(audio_stream([b"\x01" * 3200] * 3), "tr-TR")
+    ]
+    assert [is_final for _, is_final in results] == [False, False, False, True]
+
+@pytest.mark.asyncio
+async def test_error_rate_is_reproducible():
+    """Hata oranı tohuma göre tekrarlanabilir olmalı"""
+    async def failures(seed):
+        provider = SimulatedProvider(seed=seed, latency_ms={"stt": 0, "translate": 0, "tts": 0}, error_rate=0.3)
+        outcome = []
+        for _ in range(50):
+            try:
+                await provider.translate(["a"], "en")
+                outcome.append(False)
+            except SimulatedProviderError:
+                outcome.append(True)
+        return outcome
+    
+    assert await failures(7) == await failures(7)
+    assert 5 < sum(await failures(7)) < 30
+
+@pytest.mark.asyncio
+async def test_outcomes_do_not_depend_on_call_order():
+    """Aynı istek, diğer çağrıların sırası ne olursa olsun aynı sonucu görmeli"""
+    async def outcomes(texts):
+        provider = SimulatedProvider(seed=7, latency_ms={"stt": 0, "translate": 0, "tts": 0}, error_rate=0.5)
+        results = await asyncio.gather(
+            *[provider.translate([text], "en") for text in texts],
+            return_exceptions=True
+        )
+        return {text: isinstance(result, SimulatedProviderError) for text, result in zip(texts, results)}
+    
+    texts = [f"cümle {i}" for i in range(20)]
+    forward = await outcomes(texts)
+    assert forward == await outcomes(texts[::-1])
+    assert 0 < sum(forward.values()) < len(texts)
+
+@pytest.mark.asyncio
+async def test_services_delegate_to_selected_provider(provider):
+    """Servis fonksiyonları seçili sağlayıcıyı kullanmalı"""
+    from services.translation import translate_texts
+    with patch("services.translation.get_provider", return_value=provider):
+        assert await translate_texts(["a", "b"], "tr") == ["[tr] a", "[tr] b"]
@@ -0,0 +1,108 @@
+import pytest
+import asyncio
+import time
+from unittest.mock import patch
+from services.resilience import (
+    AdaptiveLimiter,
+    CircuitBreaker,
+    CircuitOpenError,
+    HedgeBudget,
+    ProviderOverloadedError,
+    call_provider
+)
+
+@pytest.mark.asyncio
+async def test_limit_bounds_concurrent_calls():
+    """Aynı anda çalışan çağrı sayısı limiti aşmamalı"""
+    limiter = AdaptiveLimiter("test", initial_limit=2, max_limit=2, queue_timeout_ms=1000)
+    running = 0
+    peak = 0
+
+    def work():
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        time.sleep(0.02)
+        running -= 1
+        return "ok"
+
+    results = await asyncio.gather(*[limiter.run(work) for _ in range(6)])
+    assert results == ["ok"] * 6
+    assert peak <= 2
+    assert limiter.in_flight == 0 and limiter.queue_depth == 0
+
+@pytest.mark.asyncio
+async def test_queue_wait_is_bounded():
+    """Kuyrukta süre aşılırsa ProviderOverloadedError fırlatılmalı"""
+    limiter = AdaptiveLimiter("test", initial_limit=1, max_limit=1, queue_timeout_ms=20)
+    slow = asyncio.create_task(limiter.run(time.sleep, 0.2))
+    await asyncio.sleep(0.01)
+
+    with pytest.raises(ProviderOverloadedError):
+        await limiter.run(time.sleep, 0)
+
+    await slow
+    assert limiter.in_flight == 0
+
+def test_aimd_increases_on_fast_calls_and_backs_off_on_slow_ones():
+    """Hızlı çağrılar limiti artırmalı, yavaş ya da hatalı çağrılar düşürmeli"""
+    limiter = AdaptiveLimiter("test", initial_limit=4, max_limit=16)
+    for _ in range(20):
+        limiter.in_flight += 1
+        limiter.release(0.01, success=True)
+    increased = limiter.limit
+    assert increased > 4
+
+    limiter.in_flight += 1
+    limiter.release(1.0, success=True)
+    assert limiter.limit == pytest.approx(increased * limiter.backoff)
+
+    limiter._last_decrease = 0
+    limiter.in_flight += 1
+    limiter.release(0.01, success=False)
+    assert limiter.limit == pytest.approx(increased * limiter.backoff ** 2)
+
+def test_circuit_opens_on_error_spike_and_recovers():
+    """Hata oranı eşiği aşınca devre açılmalı, başarılı denemeyle kapanmalı"""
+    breaker = CircuitBreaker("test", failure_rate=0.5, min_calls=4, window_size=4, open_seconds=0)
+    for success in (True, False, False, True):
+        breaker.before_call()
+        breaker.record(success)
+    assert breaker.state == CircuitBreaker.OPEN
+
+    breaker.open_seconds = 60
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    breaker.open_seconds = 0
+    breaker.before_call()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    breaker.record(True)
+    assert breaker.state == CircuitBreaker.CLOSED
+
+@pytest.mark.asyncio
+async def test_slow_call_is_hedged_and_first_answer_wins():
+    """p95'te yanıt gelmezse ikinci istek gönderilmeli ve ilk yanıt kullanılmalı"""
+    limiter = AdaptiveLimiter("test", initial_limit=4, max_limit=4)
+    limiter.latencies.extend([0.01] * 20)
+    calls = []
+
+    async def work():
+        calls.append(time.monotonic())
+        attempt = len(calls)
+        await asyncio.sleep(0.3 if attempt == 1 else 0.01)
+        return attempt
+
+    with patch.dict("services.resilience.limiters", {"test": limiter}), \
+            patch.dict("services.resilience.breakers", {"test": CircuitBreaker("test")}), \
+            patch.dict("services.resilience.hedge_budgets", {"test": HedgeBudget(max_ratio=1)}):
+        start = time.monotonic()
+        result = await call_provider("test", work)
+        elapsed = time.monotonic() - start
+
+    assert len(calls) == 2
+    assert result == 2
+    assert elapsed < 0.25
@@ -0,0 +1,62 @@
+import pytest
+import os
+import pickle
+from datetime import datetime
+from unittest.mock import patch
+from app.serialization import dumps, loads, SerializationError
+
+@pytest.mark.parametrize("value", [
+    b"\xff\xfb\x90\x64audio",
+    "Merhaba dünya",
+    {"id": 1, "email": "a@b.com", "is_admin": False},
+    [1, 2.5, None, "x"],
+    {"created_at": datetime(2024, 1, 1)},
+])
+def test_round_trip(value):
+    """Tüm desteklenen türler aynı değere geri dönmeli"""
+    assert loads(dumps(value)) == value
+
+def test_non_str_map_keys_round_trip():
+    """int anahtarlı sözlükler okunurken hata vermemeli"""
+    users = {1: {"name": "Ayşe"}, 2: {"name": "Mehmet"}}
+    assert loads(dumps(users)) == users
+
+def test_tuples_round_trip_as_tuples():
+    """tuple'lar listeye dönüşmeden geri gelmeli"""
+    value = {"segment": ("tr-TR", "male"), "items": [(1, 2), (3, 4)]}
+    result = loads(dumps(value))
+    assert result == value
+    assert isinstance(result["segment"], tuple)
+    assert loads(dumps((1, "a"))) == (1, "a")
+
+def test_bytes_and_str_are_stored_as_is():
+    """bytes ve str değerleri yalnızca etiketle saklanmalı"""
+    assert dumps(b"abc") == b"B0abc"
+    assert dumps("çay") == b"S0" + "çay".encode()
+
+def test_large_values_are_compressed():
+    """Eşikten büyük ve sıkışabilen değerler sıkıştırılmalı"""
+    text = "merhaba " * 1000
+    data = dumps(text, compression_threshold=1024)
+    assert len(data) < len(text) // 4
+    assert loads(data) == text
+
+def test_incompressible_values_are_stored_raw():
+    """Sıkıştırma yer kazandırmıyorsa ham saklanmalı"""
+    payload = os.urandom(4096)
+    data = dumps(payload, compression_threshold=1024)
+    assert data == b"B0" + payload
+    assert loads(data) == payload
+
+def test_zlib_fallback_without_lz4():
+    """lz4 kurulu değilse zlib kullanılmalı"""
+    text = "a" * 5000
+    with patch("app.serialization.lz4", None):
+        data = dumps(text)
+        assert data[1:2] == b"1"
+        assert loads(data) == text
+
+def test_legacy_pickle_values_are_rejected():
+    """Eski pickle formatındaki değerler okunmamalı"""
+    with pytest.raises(SerializationError):
+        loads(pickle.dumps("eski"))
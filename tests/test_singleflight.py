@@ -0,0 +1,57 @@
+import pytest
+import asyncio
+from app.singleflight import SingleFlight
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_execution():
+    """Aynı anahtarlı eşzamanlı çağrılar tek bir işi paylaşmalı"""
+    flight = SingleFlight("test")
+    calls = 0
+    
+    async def work():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return "sonuç"
+    
+    results = await asyncio.gather(*[flight.do("key", work) for _ in range(10)])
+    
+    assert results == ["sonuç"] * 10
+    assert calls == 1
+    assert not flight.in_flight("key")
+
+@pytest.mark.asyncio
+async def test_errors_are_shared_and_not_cached():
+    """Hata tüm bekleyenlere iletilmeli, sonraki çağrı yeniden denemeli"""
+    flight = SingleFlight("test")
+    
+    async def failing():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("sağlayıcı hatası")
+    
+    results = await asyncio.gather(
+        flight.do("key", failing),
+        flight.do("key", failing),
+        return_exceptions=True
+    )
+    assert all(isinstance(result, RuntimeError) for result in results)
+    
+    async def working():
+        return "tamam"
+    assert await flight.do("key", working) == "tamam"
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_work():
+    """Bekleyenlerden biri iptal edilirse diğerleri sonucu almalı"""
+    flight = SingleFlight("test")
+    
+    async def work():
+        await asyncio.sleep(0.05)
+        return 42
+    
+    first = asyncio.create_task(flight.do("key", work))
+    second = asyncio.create_task(flight.do("key", work))
+    await asyncio.sleep(0.01)
+    first.cancel()
+    
+    assert await second == 42
@@ -0,0 +1,98 @@
+import asyncio
+import pytest
+import numpy as np
+from unittest.mock import patch, AsyncMock
+from services.speech_to_text import stitch_transcripts, transcribe_long_audio
+
+def test_stitch_removes_repeated_overlap_words():
+    """Örtüşen sesten gelen tekrar eden kelimeler bir kez yazılmalı"""
+    parts = ["bugün hava çok güzel", "Güzel, yarın yağmur", None, "yağmur yağacak"]
+    assert stitch_transcripts(parts) == "bugün hava çok güzel yarın yağmur yağacak"
+
+def test_stitch_keeps_text_without_overlap():
+    """Örtüşme yoksa metinler olduğu gibi birleşmeli"""
+    assert stitch_transcripts(["merhaba dünya", "nasılsın"]) == "merhaba dünya nasılsın"
+
+@pytest.mark.asyncio
+async def test_long_audio_is_transcribed_in_chunks():
+    """Uzun ses parçalanmalı; dil verilmediyse ilk parçada algılanmalı, verildiyse tüm parçalar paralel tanınmalı"""
+    audio = np.zeros(16000 * 3, dtype="<i2").tobytes()
+    chunks = [b"a", b"b", b"c"]
+    
+    with patch("services.speech_to_text.split_at_silence", return_value=chunks), \
+            patch("services.speech_to_text.detect_and_transcribe_shared",
+                  AsyncMock(return_value=("en-US", "hello my"))) as mock_detect, \
+            patch("services.speech_to_text.call_provider",
+                  AsyncMock(side_effect=["my friend", "friend goodbye"])) as mock_call:
+        language, transcript = await transcribe_long_audio(audio)
+    
+    assert (language, transcript) == ("en-US", "hello my friend goodbye")
+    mock_detect.assert_awaited_once_with(b"a", None)
+    assert [call.args[2:] for call in mock_call.await_args_list] == [(b"b", "en-US"), (b"c", "en-US")]
+    
+    # Dil verildiyse ilk parça beklenmeden tüm parçalar aynı anda tanınmalı
+    in_flight = 0
+    max_in_flight = 0
+    
+    async def slow_transcribe(name, func, chunk, language_code):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return chunk.decode()
+    
+    with patch("services.speech_to_text.split_at_silence", return_value=chunks), \
+            patch("services.speech_to_text.detect_and_transcribe_shared", AsyncMock()) as mock_detect, \
+            patch("services.speech_to_text.call_provider", AsyncMock(side_effect=slow_transcribe)) as mock_call:
+        language, transcript = await transcribe_long_audio(audio, "tr-TR")
+    
+    assert (language, transcript) == ("tr-TR", "a b c")
+    mock_detect.assert_not_awaited()
+    assert [call.args[2:] for call in mock_call.await_args_list] == [(b"a", "tr-TR"), (b"b", "tr-TR"), (b"c", "tr-TR")]
+    assert max_in_flight == len(chunks)
+
+
+@pytest.mark.asyncio
+async def test_detect_and_transcribe_sends_candidates_in_one_call():
+    """Dil verilmezse tüm desteklenen diller tek tanıma çağrısında aday olmalı"""
+    from services.speech_to_text import detect_and_transcribe, SUPPORTED_LANGUAGES
+    provider = AsyncMock()
+    provider.detect_and_transcribe.return_value = ("en-US", "hello")
+    
+    with patch("services.speech_to_text.get_provider", return_value=provider):
+        assert await detect_and_transcribe(b"ses") == ("en-US", "hello")
+        await detect_and_transcribe(b"ses", "tr-TR")
+    
+    assert [call.args for call in provider.detect_and_transcribe.await_args_list] == [
+        (b"ses", SUPPORTED_LANGUAGES),
+        (b"ses", ["tr-TR"]),
+    ]
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_audio_shares_one_recognition():
+    """Aynı ses için eşzamanlı istekler tek bir tanıma çağrısını paylaşmalı"""
+    import asyncio
+    from services.speech_to_text import detect_and_transcribe_shared
+    
+    async def slow_recognition(name, func, audio, language_code):
+        await asyncio.sleep(0.01)
+        return ("tr-TR", "merhaba")
+    
+    with patch("services.speech_to_text.call_provider", AsyncMock(side_effect=slow_recognition)) as mock_call:
+        results = await asyncio.gather(*[detect_and_transcribe_shared(b"ses") for _ in range(3)])
+        await detect_and_transcribe_shared(b"baska ses")
+    
+    assert results == [("tr-TR", "merhaba")] * 3
+    assert mock_call.await_count == 2
+
+@pytest.mark.asyncio
+async def test_detect_language_uses_single_recognition_call():
+    """Dil algılama ayrı bir tanıma isteği yapmamalı, konuşma yoksa tr-TR dönmeli"""
+    from services.language_detection import detect_language
+    
+    with patch("services.language_detection.call_provider",
+               AsyncMock(side_effect=[("en-US", "hello"), ("en-US", None)])) as mock_call:
+        assert await detect_language(b"ses") == "en-US"
+        assert await detect_language(b"sessiz") == "tr-TR"
+    assert mock_call.await_count == 2
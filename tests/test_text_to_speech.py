@@ -0,0 +1,68 @@
+import pytest
+import asyncio
+import time
+from unittest.mock import patch, AsyncMock
+from services.text_to_speech import split_sentences, synthesize_speech_stream, synthesize_speech_cached
+
+@pytest.fixture
+def segment_cache():
+    """Cümle önbelleğini bellekte taklit et"""
+    store = {}
+    
+    async def get_or_set_segment(sentence, lang, voice, func):
+        key = (sentence, lang, voice)
+        if key not in store:
+            store[key] = await func()
+        return store[key]
+    
+    async def get_segments(sentences, lang, voice):
+        return [store.get((sentence, lang, voice)) for sentence in sentences]
+    
+    with patch("services.text_to_speech.cache_manager") as mock_cache:
+        mock_cache.get_or_set_tts_segment = AsyncMock(side_effect=get_or_set_segment)
+        mock_cache.get_tts_segments = AsyncMock(side_effect=get_segments)
+        yield store
+
+def test_split_sentences():
+    """Metin cümle sonu noktalamasından bölünmeli"""
+    text = "Merhaba! Nasılsın? Bugün hava çok güzel.  Görüşürüz."
+    assert split_sentences(text) == ["Merhaba!", "Nasılsın?", "Bugün hava çok güzel.", "Görüşürüz."]
+    assert split_sentences("   ") == []
+
+def test_split_long_sentence_on_word_boundary():
+    """Uzun cümleler kelime sınırından parçalanmalı"""
+    segments = split_sentences("bir iki üç dört beş altı", max_chars=10)
+    assert all(len(segment) <= 10 for segment in segments)
+    assert " ".join(segments) == "bir iki üç dört beş altı"
+
+@pytest.mark.asyncio
+async def test_stream_preserves_order_and_runs_in_parallel(segment_cache):
+    """Parçalar metin sırasıyla gelmeli, sentez paralel yapılmalı"""
+    async def fake_synthesize(text, language_code, voice_gender):
+        # İlk cümle en yavaş olsa bile sıra korunmalı
+        await asyncio.sleep(0.2 if text == "Bir." else 0.1)
+        return text.encode()
+    
+    with patch("services.text_to_speech.synthesize_speech", side_effect=fake_synthesize):
+        start = time.time()
+        segments = [
+            segment async for segment in
+            synthesize_speech_stream("Bir. İki. Üç. Dört.", "tr-TR", max_concurrency=4)
+        ]
+        elapsed = time.time() - start
+    
+    assert segments == [b"Bir.", "İki.".encode(), "Üç.".encode(), "Dört.".encode()]
+    assert elapsed < 0.35
+
+
+@pytest.mark.asyncio
+async def test_cached_segments_are_not_resynthesized(segment_cache):
+    """Önbellekteki cümleler tekrar sentezlenmemeli, eksikler önbelleğe yazılmalı"""
+    segment_cache[("Merhaba.", "tr-TR", "male")] = b"cached"
+    
+    with patch("services.text_to_speech.synthesize_speech", return_value=b"new") as mock_synthesize:
+        audio = await synthesize_speech_cached("Merhaba. Nasılsın?", "tr-TR", "male")
+    
+    assert audio == b"cachednew"
+    mock_synthesize.assert_called_once_with("Nasılsın?", "tr-TR", "male")
+    assert segment_cache[("Nasılsın?", "tr-TR", "male")] == b"new"
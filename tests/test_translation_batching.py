@@ -0,0 +1,62 @@
+import pytest
+import asyncio
+from unittest.mock import patch
+from services.batching import TranslationBatcher
+
+def fake_translate_texts(texts, target_language):
+    return [f"{target_language}:{text}" for text in texts]
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_batch():
+    """Aynı hedef dile giden eşzamanlı istekler tek istekte gönderilmeli"""
+    batcher = TranslationBatcher(max_batch_size=10, max_wait_ms=5)
+    with patch("services.batching.translate_texts", side_effect=fake_translate_texts) as mock_translate:
+        results = await asyncio.gather(
+            batcher.translate("merhaba", "en"),
+            batcher.translate("nasılsın", "en"),
+            batcher.translate("merhaba", "en")
+        )
+    
+    assert results == ["en:merhaba", "en:nasılsın", "en:merhaba"]
+    mock_translate.assert_called_once_with(["merhaba", "nasılsın"], "en")
+
+@pytest.mark.asyncio
+async def test_batches_are_split_by_target_language_and_size():
+    """Farklı hedef diller ayrı, dolan batch'ler hemen gönderilmeli"""
+    batcher = TranslationBatcher(max_batch_size=2, max_wait_ms=5)
+    with patch("services.batching.translate_texts", side_effect=fake_translate_texts) as mock_translate:
+        results = await asyncio.gather(
+            batcher.translate("a", "en"),
+            batcher.translate("b", "en"),
+            batcher.translate("c", "en"),
+            batcher.translate("d", "tr")
+        )
+    
+    assert results == ["en:a", "en:b", "en:c", "tr:d"]
+    assert mock_translate.call_count == 3
+
+@pytest.mark.asyncio
+async def test_batch_error_is_propagated_to_every_caller():
+    """Toplu istek hatası tüm bekleyenlere iletilmeli"""
+    batcher = TranslationBatcher(max_batch_size=10, max_wait_ms=5)
+    with patch("services.batching.translate_texts", side_effect=RuntimeError("quota")):
+        results = await asyncio.gather(
+            batcher.translate("a", "en"),
+            batcher.translate("b", "en"),
+            return_exceptions=True
+        )
+    
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+@pytest.mark.asyncio
+async def test_mismatched_provider_response_fails_every_caller():
+    """Sağlayıcı eksik sonuç döndürürse bekleyenler askıda kalmamalı, hata almalı"""
+    batcher = TranslationBatcher(max_batch_size=10, max_wait_ms=5)
+    with patch("services.batching.translate_texts", return_value=["en:a"]):
+        results = await asyncio.wait_for(asyncio.gather(
+            batcher.translate("a", "en"),
+            batcher.translate("b", "en"),
+            return_exceptions=True
+        ), timeout=1)
+    
+    assert all(isinstance(result, ValueError) for result in results)
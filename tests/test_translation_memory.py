@@ -0,0 +1,123 @@
+import asyncio
+import fakeredis
+import pytest
+from unittest.mock import patch, AsyncMock, MagicMock
+from app.cache import CacheManager
+from app.utils import normalize_text
+from services.translation_memory import TranslationMemory
+
+@pytest.fixture
+def redis_tier():
+    """Redis katmanını bellekte taklit et"""
+    store = {}
+    cache = MagicMock()
+    
+    async def get_translation(text, source_lang, target_lang):
+        return store.get((text, source_lang, target_lang))
+    
+    async def set_translation(text, source_lang, target_lang, translation):
+        store[(text, source_lang, target_lang)] = translation
+        return True
+    
+    cache.text_translation_key = lambda text, source_lang, target_lang: (
+        f"text_translation:v0:{normalize_text(text)}:{source_lang}:{target_lang}"
+    )
+    cache.get_text_translation = AsyncMock(side_effect=get_translation)
+    cache.set_text_translation = AsyncMock(side_effect=set_translation)
+    cache.store = store
+    return cache
+
+@pytest.mark.asyncio
+async def test_repeated_phrase_hits_local_tier(redis_tier):
+    """Tekrar eden ifade sağlayıcıya ve Redis'e gitmemeli"""
+    memory = TranslationMemory(redis_tier, max_entries=10)
+    with patch("services.translation_memory.translation_batcher") as mock_batcher:
+        mock_batcher.translate = AsyncMock(return_value="Hello")
+        
+        assert await memory.translate("Merhaba", "en", "tr-TR") == "Hello"
+        assert await memory.translate("  Merhaba ", "en", "tr-TR") == "Hello"
+    
+    mock_batcher.translate.assert_called_once()
+    assert redis_tier.get_text_translation.call_count == 1
+    assert redis_tier.store[("Merhaba", "tr-TR", "en")] == "Hello"
+
+@pytest.mark.asyncio
+async def test_redis_tier_fills_local_tier(redis_tier):
+    """Redis katmanındaki çeviri sağlayıcı çağrısı olmadan dönmeli"""
+    redis_tier.store[("Merhaba", "auto", "en")] = "Hello"
+    memory = TranslationMemory(redis_tier, max_entries=10)
+    with patch("services.translation_memory.translation_batcher") as mock_batcher:
+        mock_batcher.translate = AsyncMock()
+        assert await memory.translate("Merhaba", "en") == "Hello"
+    
+    mock_batcher.translate.assert_not_called()
+    assert len(memory.local) == 1
+
+@pytest.mark.asyncio
+async def test_local_tier_is_size_bounded(redis_tier):
+    """Yerel katman en eski girdileri atmalı"""
+    memory = TranslationMemory(redis_tier, max_entries=2)
+    with patch("services.translation_memory.translation_batcher") as mock_batcher:
+        mock_batcher.translate = AsyncMock(side_effect=lambda text, target: text.upper())
+        for text in ["a", "b", "c"]:
+            await memory.translate(text, "en")
+    
+    assert len(memory.local) == 2
+
+@pytest.mark.asyncio
+async def test_local_tier_entries_expire(redis_tier):
+    """Yerel katmandaki girdi TTL dolunca Redis'ten yeniden okunmalı"""
+    memory = TranslationMemory(redis_tier, max_entries=10, local_ttl=0.01)
+    with patch("services.translation_memory.translation_batcher") as mock_batcher:
+        mock_batcher.translate = AsyncMock(return_value="Hello")
+        await memory.translate("Merhaba", "en")
+        await asyncio.sleep(0.02)
+        assert await memory.translate("Merhaba", "en") == "Hello"
+    
+    assert redis_tier.get_text_translation.call_count == 2
+
+@pytest.mark.asyncio
+async def test_namespace_invalidation_clears_local_tier():
+    """Ad alanı geçersiz kılınınca yerel katmandaki çeviri de kullanılmamalı"""
+    cache = CacheManager(fakeredis.FakeAsyncRedis(server=fakeredis.FakeServer()))
+    memory = TranslationMemory(cache, max_entries=10)
+    with patch("services.translation_memory.translation_batcher") as mock_batcher:
+        mock_batcher.translate = AsyncMock(side_effect=["Hello", "Hi"])
+        assert await memory.translate("Merhaba", "en") == "Hello"
+        await cache.invalidate_namespace("text_translation")
+        assert len(memory.local) == 0
+        assert await memory.translate("Merhaba", "en") == "Hi"
+
+@pytest.mark.asyncio
+async def test_other_replica_invalidation_clears_local_tier():
+    """Başka replikadaki nesil artırımı ve L1 temizliği pub/sub ile yerel katmana ulaşmalı"""
+    server = fakeredis.FakeServer()
+    first = CacheManager(fakeredis.FakeAsyncRedis(server=server))
+    second = CacheManager(fakeredis.FakeAsyncRedis(server=server))
+    memory = TranslationMemory(second, max_entries=10)
+    with patch("services.translation_memory.translation_batcher") as mock_batcher:
+        mock_batcher.translate = AsyncMock(return_value="Hello")
+        await memory.translate("Merhaba", "en")
+        await memory.translate("Günaydın", "en")
+    
+    second.start_invalidation_listener()
+    await asyncio.sleep(0.05)
+    try:
+        await first.invalidate_namespace("text_translation")
+        for _ in range(50):
+            if second.generations["text_translation"] == 1:
+                break
+            await asyncio.sleep(0.01)
+        assert len(memory.local) == 0
+        
+        with patch("services.translation_memory.translation_batcher") as mock_batcher:
+            mock_batcher.translate = AsyncMock(return_value="Hello")
+            await memory.translate("Merhaba", "en")
+        await first.clear_local()
+        for _ in range(50):
+            if len(memory.local) == 0:
+                break
+            await asyncio.sleep(0.01)
+        assert len(memory.local) == 0
+    finally:
+        await second.stop_invalidation_listener()
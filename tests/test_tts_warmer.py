@@ -0,0 +1,116 @@
+import pytest
+import fakeredis
+from unittest.mock import patch, AsyncMock
+from app.cache import CacheManager
+from app.config import CACHE_STALE_TTL
+from services.tts_warmer import TTSWarmer
+
+@pytest.fixture
+def cache():
+    return CacheManager(fakeredis.FakeAsyncRedis(server=fakeredis.FakeServer()))
+
+@pytest.fixture
+def synthesized():
+    calls = []
+    
+    async def fake_call_provider(name, func, sentence, language_code, voice_gender):
+        calls.append(sentence)
+        return sentence.encode()
+    
+    with patch("services.tts_warmer.call_provider", side_effect=fake_call_provider):
+        yield calls
+
+@pytest.mark.asyncio
+async def test_warms_most_frequent_phrases_within_budget(cache, synthesized):
+    """En sık cümleler bütçe kadar sentezlenmeli, taze olanlar tekrar sentezlenmemeli"""
+    warmer = TTSWarmer(cache, top_n=10, calls_per_minute=2, interval_seconds=60)
+    for _ in range(5):
+        warmer.record(["Merhaba.", "Teşekkürler."], "tr-TR", "male")
+    warmer.record(["Nadir cümle."], "tr-TR", "male")
+    
+    assert await warmer.warm_once() == 2
+    assert sorted(synthesized) == ["Merhaba.", "Teşekkürler."]
+    
+    assert await warmer.warm_once() == 1
+    assert synthesized[-1] == "Nadir cümle."
+    assert await warmer.warm_once() == 0
+
+@pytest.mark.asyncio
+async def test_warmed_segments_are_served_and_counted(cache, synthesized):
+    """Isıtılan cümleler istek yolunda önbellekten gelmeli"""
+    warmer = TTSWarmer(cache, top_n=10, calls_per_minute=10, interval_seconds=60)
+    warmer.record(["Merhaba."], "tr-TR", "male")
+    await warmer.warm_once()
+    
+    with patch("app.cache.record_tts_warmer_hit") as record_hit:
+        assert await cache.get_tts_segments(["Merhaba."], "tr-TR", "male") == [b"Merhaba."]
+    record_hit.assert_called_once_with(1)
+
+@pytest.mark.asyncio
+async def test_expiring_segments_are_refreshed(cache, synthesized):
+    """Kalan süresi eşiğin altındaki cümleler yeniden sentezlenmeli"""
+    warmer = TTSWarmer(cache, top_n=10, calls_per_minute=10, interval_seconds=60, refresh_before_seconds=3600)
+    warmer.record(["Merhaba."], "tr-TR", "male")
+    
+    async def old_audio():
+        return b"eski"
+    
+    await cache.warm_tts_segment("Merhaba.", "tr-TR", "male", old_audio, ttl=600)
+    assert await warmer.warm_once() == 1
+    assert await cache.get_tts_segments(["Merhaba."], "tr-TR", "male") == [b"Merhaba."]
+
+@pytest.mark.asyncio
+async def test_raw_and_enveloped_segments_can_be_mixed(cache, synthesized):
+    """set_tts_segment ile yazılan ham sesler toplu okumayı ve TTL hesabını bozmamalı"""
+    warmer = TTSWarmer(cache, top_n=10, calls_per_minute=10, interval_seconds=60, refresh_before_seconds=3600)
+    warmer.record(["Ham.", "Zarflı."], "tr-TR", "male")
+    await cache.set_tts_segment("Ham.", "tr-TR", "male", b"ham", ttl=7200)
+    await cache.warm_tts_segment("Zarflı.", "tr-TR", "male", synthesized_audio(b"zarfli"), ttl=600)
+    
+    with patch("app.cache.record_tts_warmer_hit") as record_hit:
+        segments = await cache.get_tts_segments(["Ham.", "Zarflı."], "tr-TR", "male")
+    assert segments == [b"ham", b"zarfli"]
+    record_hit.assert_called_once_with(1)
+    
+    raw_ttl, enveloped_ttl = await cache.get_tts_segment_ttls([
+        ("Ham.", "tr-TR", "male"), ("Zarflı.", "tr-TR", "male")
+    ])
+    # Ham değerin yumuşak süresi de bayat sunma süresi düşülerek (erken) hesaplanır
+    assert 7100 - CACHE_STALE_TTL < raw_ttl <= 7200 - CACHE_STALE_TTL
+    assert 500 < enveloped_ttl <= 600
+    
+    # Yalnızca süresi eşiğin altındaki zarflı cümle yenilenmeli
+    assert await warmer.warm_once() == 1
+    assert synthesized == ["Zarflı."]
+
+@pytest.mark.asyncio
+async def test_ttl_lookup_does_not_read_payloads(cache):
+    """Kalan süre hesabı sesi Redis'ten ya da nesne deposundan okumamalı"""
+    await cache.warm_tts_segment("Merhaba.", "tr-TR", "male", synthesized_audio(b"ses"), ttl=600)
+    cache.redis.get = AsyncMock(side_effect=AssertionError("GET çağrılmamalı"))
+    cache._decode = AsyncMock(side_effect=AssertionError("blob indirilmemeli"))
+    
+    remaining, missing = await cache.get_tts_segment_ttls([
+        ("Merhaba.", "tr-TR", "male"), ("Yok.", "tr-TR", "male")
+    ])
+    assert 500 < remaining <= 600
+    assert missing is None
+
+@pytest.mark.asyncio
+async def test_phrases_counted_on_other_replicas_are_warmed(synthesized):
+    """Kilidi tutmayan replikada sık görülen cümleler de ısıtılmalı"""
+    server = fakeredis.FakeServer()
+    first = TTSWarmer(CacheManager(fakeredis.FakeAsyncRedis(server=server)), top_n=10, calls_per_minute=10)
+    second = TTSWarmer(CacheManager(fakeredis.FakeAsyncRedis(server=server)), top_n=10, calls_per_minute=10)
+    for _ in range(3):
+        first.record(["Merhaba."], "tr-TR", "male")
+    second.record(["Günaydın."], "tr-TR", "male")
+    
+    await first.flush()
+    assert await second.warm_once() == 2
+    assert sorted(synthesized) == ["Günaydın.", "Merhaba."]
+
+def synthesized_audio(audio: bytes):
+    async def synthesize():
+        return audio
+    return synthesize
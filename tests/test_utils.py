@@ -0,0 +1,23 @@
+import io
+import pytest
+from app.utils import audio_digest, read_upload
+
+class FakeUpload:
+    def __init__(self, data: bytes):
+        self._buffer = io.BytesIO(data)
+        
+    async def read(self, size: int = -1) -> bytes:
+        return self._buffer.read(size)
+
+@pytest.mark.asyncio
+async def test_read_upload_digest_matches_whole_file():
+    """Parça parça hesaplanan özet tüm dosyanın özetiyle aynı olmalı"""
+    data = bytes(range(256)) * 1000
+    audio_data, digest = await read_upload(FakeUpload(data), max_size=len(data), chunk_size=1000)
+    assert audio_data == data
+    assert digest == audio_digest(data)
+
+@pytest.mark.asyncio
+async def test_read_upload_rejects_oversized_file():
+    """Limit aşılınca okuma bırakılmalı"""
+    assert await read_upload(FakeUpload(b"x" * 101), max_size=100, chunk_size=10) == (None, None)
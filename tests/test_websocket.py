@@ -3,7 +3,7 @@ from fastapi.testclient import TestClient
 from app.main import app
 import asyncio
 import json
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, AsyncMock
 import base64
 
 @pytest.fixture
@@ -127,4 +127,67 @@ async def test_websocket_concurrent_connections(websocket_client, auth_token):
     finally:
         # Bağlantıları kapat
         for ws in connections:
-            ws.__exit__(None, None, None) 
\ No newline at end of file
+            ws.__exit__(None, None, None)
+
+
+def fake_streaming_transcribe(calls, fail_first=False):
+    """Her parçayı nihai sonuç olarak döndüren akışlı tanıyıcı; istenirse ilk oturum hata verir"""
+    def streaming_transcribe(audio_chunks, language_code):
+        calls.append(language_code)
+        session = len(calls)
+        
+        async def results():
+            async for chunk in audio_chunks:
+                if fail_first and session == 1:
+                    raise RuntimeError("tanıyıcı hatası")
+                yield chunk.decode(), False
+                yield chunk.decode(), True
+        return results()
+    return streaming_transcribe
+
+
+@pytest.mark.asyncio
+async def test_websocket_streaming_mode(websocket_client, auth_token):
+    calls = []
+    with patch("app.api.v1.websocket.streaming_transcribe", fake_streaming_transcribe(calls)), \
+         patch("app.api.v1.websocket.translate_and_synthesize",
+               AsyncMock(return_value=("Hello", b"audio"))):
+        with websocket_client.websocket_connect(
+            f"/ws/translate?token={auth_token}&mode=stream&language=tr-TR"
+        ) as websocket:
+            websocket.send_bytes(b"merhaba")
+            assert websocket.receive_json() == {"type": "interim", "transcribed_text": "merhaba"}
+            
+            response = websocket.receive_json()
+            assert response["type"] == "final"
+            assert response["transcribed_text"] == "merhaba"
+            assert response["translated_text"] == "Hello"
+            
+            websocket.send_json({"type": "end"})
+            assert websocket.receive_json() == {"type": "end"}
+    
+    assert calls == ["tr-TR"]
+
+
+@pytest.mark.asyncio
+async def test_websocket_streaming_recovers_after_recognizer_error(websocket_client, auth_token):
+    calls = []
+    is_allowed = AsyncMock(return_value=True)
+    with patch("app.api.v1.websocket.streaming_transcribe", fake_streaming_transcribe(calls, fail_first=True)), \
+         patch("app.api.v1.websocket.translate_and_synthesize",
+               AsyncMock(return_value=("Hello", None))), \
+         patch("app.api.v1.websocket.manager.rate_limiter.is_allowed", is_allowed):
+        with websocket_client.websocket_connect(
+            f"/ws/translate?token={auth_token}&mode=stream"
+        ) as websocket:
+            websocket.send_bytes(b"bozuk")
+            assert websocket.receive_json() == {"error": "tanıyıcı hatası"}
+            
+            # Biten tanıyıcının kuyruğuna yazılmamalı; yeni oturum açılmalı
+            websocket.send_bytes(b"merhaba")
+            assert websocket.receive_json()["type"] == "interim"
+            assert websocket.receive_json()["translated_text"] == "Hello"
+    
+    assert len(calls) == 2
+    # Rate limit her yeni konuşmada yeniden uygulanmalı
+    assert is_allowed.await_count == 2